@@ -0,0 +1,145 @@
+from functools import lru_cache
+from cryp_constants import CrypConstants
+
+class Alphabet():
+    """ The letters that puzzles and dictionaries are written in, such as
+        English's A to Z or Spanish's A to Z with Ñ after N. Each letter
+        has an ordinal, its place in the alphabet, and the alphabet
+        mappings and the dictionary index work with ordinals (as array
+        indexes and bit numbers) rather than searching strings of letters.
+        The apostrophe gets the ordinal just past the last letter, so that
+        dictionary words with apostrophes can be stored the same way, but
+        it isn't one of the letters. Get an alphabet from of() or named()
+        rather than making one, so that there's only ever one object for
+        each alphabet and comparing two is just comparing identities. """
+
+    def __init__(self, letters):
+        """ Set up an alphabet of the given (upper case) letters, in
+            order. There can be at most 32 of them, since the mappings
+            keep each letter's translations in 32 bits (see
+            BitmaskAlphabetMapping.snapshot). """
+        if len(letters) == 0 or len(letters) > 32 or \
+                len(set(letters)) != len(letters) or '\'' in letters:
+            raise ValueError('"' + letters + '" is not an alphabet.')
+        self._letters = letters
+        self._characters = letters + '\''
+        self._ordinals = {character: ordinal
+                for ordinal, character in enumerate(self._characters)}
+        # (For decoding ordinals to text: each ordinal, taken as a
+        # Latin-1 character, translates to the character it stands for.)
+        self._decoding = {ordinal: character
+                for ordinal, character in enumerate(self._characters)}
+        self._everything = (1 << len(letters)) - 1
+        self._letters_of = {}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def of(letters):
+        """ Return the alphabet of the given letters. """
+        return Alphabet(letters)
+
+    @staticmethod
+    def named(name):
+        """ Return one of the alphabets in CrypConstants.ALPHABETS. """
+        if name not in CrypConstants.ALPHABETS:
+            raise ValueError('There is no ' + name + ' alphabet.')
+        return Alphabet.of(CrypConstants.ALPHABETS[name])
+
+    @staticmethod
+    def default():
+        """ Return the alphabet to use when nobody says otherwise
+            (see CrypConstants.LANGUAGE). """
+        return Alphabet.named(CrypConstants.LANGUAGE)
+
+    @staticmethod
+    def upper(text):
+        """ Return a piece of text in upper case. Unlike str.upper, this
+            never changes the length of the text: a letter with no single
+            upper case form (like the German ß) stays as it is. """
+        result = text.upper()
+        if len(result) == len(text):
+            return result
+        return ''.join(character.upper() if len(character.upper()) == 1
+                else character for character in text)
+
+    def letters(self):
+        """ Return the letters, in order, as a string. """
+        return self._letters
+
+    def size(self):
+        """ Return the number of letters. """
+        return len(self._letters)
+
+    def everything(self):
+        """ Return the mask with every letter's bit set. """
+        return self._everything
+
+    def apostrophe(self):
+        """ Return the ordinal that stands for an apostrophe. """
+        return len(self._letters)
+
+    def contains(self, character):
+        """ Return True if a character is one of the letters. """
+        return character in self._ordinals and character != '\''
+
+    def ordinal(self, character):
+        """ Return the ordinal of a letter (or an apostrophe), or
+            None if the character isn't in the alphabet at all. """
+        return self._ordinals.get(character)
+
+    def letter(self, ordinal):
+        """ Return the letter (or apostrophe) with a given ordinal. """
+        return self._characters[ordinal]
+
+    def is_word(self, word):
+        """ Return True if an (upper case) word is all letters, apart
+            from any apostrophes, and has at least one letter. """
+        return any(character != '\'' for character in word) and \
+                all(character in self._ordinals for character in word)
+
+    def encode(self, word):
+        """ Return the ordinals of the characters of a word, as bytes.
+            Everything in the word must be in the alphabet. """
+        return bytes(self._ordinals[character] for character in word)
+
+    def decode(self, ordinals):
+        """ Return the word whose characters have the given ordinals
+            (the bytes, or a memoryview of the bytes, that encode gave). """
+        return bytes(ordinals).decode('latin-1').translate(self._decoding)
+
+    def mask_of(self, characters):
+        """ Return the mask with the bit of each of the given letters (or
+            apostrophes) set, ignoring anything not in the alphabet. """
+        mask = 0
+        for character in characters:
+            ordinal = self._ordinals.get(character)
+            if ordinal is not None:
+                mask |= 1 << ordinal
+        return mask
+
+    def letters_of(self, mask):
+        """ Return the letters whose bits are set in a mask, in
+            alphabetical order, as a string. (The same few masks come
+            up again and again, so we remember the answers.) """
+        letters = self._letters_of.get(mask)
+        if letters is None:
+            letters = ''.join(self._characters[ordinal]
+                    for ordinal in Alphabet.ordinals_of(mask))
+            if len(self._letters_of) < CrypConstants.PATTERN_CACHE_SIZE:
+                self._letters_of[mask] = letters
+        return letters
+
+    @staticmethod
+    @lru_cache(maxsize=CrypConstants.PATTERN_CACHE_SIZE)
+    def ordinals_of(mask):
+        """ Return a tuple of the ordinals whose bits are set in a mask,
+            in order. (Like letters_of, we remember the answers.) """
+        ordinals = []
+        while mask:
+            lowest = mask & -mask
+            ordinals.append(lowest.bit_length() - 1)
+            mask ^= lowest
+        return tuple(ordinals)
+
+    def __repr__(self):
+        return 'Alphabet.of(' + repr(self._letters) + ')'
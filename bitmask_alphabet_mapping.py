@@ -0,0 +1,358 @@
+import struct
+from alphabet import Alphabet
+from cryp_constants import CrypConstants
+
+class BitmaskAlphabetMapping():
+    """ A map from each ciphertext letter to every plaintext letter it
+        might translate to, with each letter's translations kept as the
+        bits of an int instead of as a string. Narrowing down is an AND
+        and deleting a translation is an AND NOT, and when a letter gets
+        pinned down to one translation, the deletions that follow are
+        driven by an explicit stack rather than by recursion. (The stack
+        visits the letters in exactly the order the old string mapping's
+        recursion did, so at SINGLES strength the two always come up
+        with the same map; AlphabetMapping is just that strength.)
+
+        The letters can be those of any alphabet (see Alphabet). The
+        masks are kept in a list indexed by each ciphertext letter's
+        ordinal, and bit n of a mask stands for the plaintext letter
+        whose ordinal is n. """
+
+    # How hard the mapping works at pinning letters down (see __init__).
+    SINGLES = 0
+    HIDDEN_SINGLES = 1
+    SETS = 2
+
+    def __init__(self, like_exclusion, strength=SINGLES, alphabet=None):
+        """ Build the initial, full (or almost full) mapping for the
+            letters of an alphabet (or the default one). The strength
+            says what to work out whenever the mapping changes. SINGLES
+            just deletes a pinned-down letter's translation from all the
+            other letters. HIDDEN_SINGLES also pins down a letter if it's
+            the only one left that can translate to some plaintext letter.
+            SETS also looks for a group of letters that between them have
+            only as many translations as there are letters in the group,
+            so no other letter can have those translations, and for a
+            group of plaintext letters that only as many ciphertext
+            letters can translate to, so those ciphertext letters can't
+            translate to anything else. (Every ciphertext letter has a
+            different translation, and every plaintext letter has to
+            come from somewhere, much as in a Sudoku.) """
+        self._alphabet = alphabet or Alphabet.default()
+        self._masks = [self._alphabet.everything()] * self._alphabet.size()
+        self._strength = strength
+        # While there are checkpoints, the trail has the number and the
+        # old translations of each letter changed, in order, so we can
+        # roll back by popping the changes back off.
+        self._trail = []
+        self._checkpoints = 0
+        # The bits of the ciphertext letters changed since changes() was
+        # last called (or since the mapping was made, if it hasn't been).
+        self._changed = 0
+        # The inverse (see _inverted) gets worked out the first time it's
+        # needed, which at SINGLES strength may be never, and only then
+        # kept up to date on every change.
+        self._inverse = None
+        if like_exclusion:
+            for number in range(len(self._masks)):
+                self._masks[number] &= ~(1 << number)
+
+    def copy(self):
+        """ Return an independent copy of this mapping. """
+        duplicate = BitmaskAlphabetMapping(False, self._strength,
+                self._alphabet)
+        duplicate._masks = list(self._masks)
+        if self._inverse is not None:
+            duplicate._inverse = list(self._inverse)
+        return duplicate
+
+    def snapshot(self):
+        """ Return the mapping as it is now, packed into bytes: each
+            letter's mask as 32 bits, in order. A snapshot can't change and
+            can be hashed, so it will do as a dictionary key for remembering
+            what we worked out from a mapping, and it's cheap to send to
+            another process. """
+        return struct.pack('<%dI' % len(self._masks), *self._masks)
+
+    @staticmethod
+    def from_snapshot(snapshot, strength=SINGLES, alphabet=None):
+        """ Return a new mapping just like the one that a snapshot was
+            taken of (which must have been for the same alphabet). """
+        mapping = BitmaskAlphabetMapping(False, strength, alphabet)
+        if len(snapshot) != 4 * len(mapping._masks):
+            raise ValueError('The snapshot is not for ' +
+                    repr(mapping._alphabet) + '.')
+        mapping._masks = list(struct.unpack('<%dI' % len(mapping._masks),
+                snapshot))
+        return mapping
+
+    def alphabet(self):
+        """ Return the alphabet of the letters. """
+        return self._alphabet
+
+    def changes(self):
+        """ Return the set of ciphertext letters whose translations have
+            changed (by narrowing down, deleting, propagation or rolling
+            back) since the last time this was called, so that whoever
+            keeps track of the mapping only has to look at those. """
+        changed = set(self._alphabet.letters_of(self._changed))
+        self._changed = 0
+        return changed
+
+    def checkpoint(self):
+        """ Return a marker for the mapping as it is now, which rollback()
+            can take the mapping back to (as often as you like) until it's
+            released. Undoing changes costs only as much as the changes
+            themselves did, so it's much cheaper than a copy when trying
+            something out. Checkpoints nest, so release them in the
+            reverse of the order they were taken. """
+        self._checkpoints += 1
+        return len(self._trail)
+
+    def rollback(self, checkpoint):
+        """ Undo every change since a checkpoint was taken. (The
+            checkpoint stays, so it can be rolled back to again.) """
+        while len(self._trail) > checkpoint:
+            number, mask = self._trail.pop()
+            if self._inverse is not None:
+                self._reinvert(number, self._masks[number], mask)
+            self._masks[number] = mask
+            self._changed |= 1 << number
+
+    def release(self, checkpoint):
+        """ Keep the changes since a checkpoint was taken, and give up the
+            chance to roll them back (unless there's an earlier checkpoint
+            that still covers them). """
+        self._checkpoints -= 1
+        if self._checkpoints == 0:
+            self._trail = []
+
+    def delete_translation(self, ciphertext, plaintext):
+        """ Note in the mapping that a given ciphertext letter does NOT
+            translate to a given plaintext letter, if it's feasible
+            (that is, if it doesn't reduce the translations to none). """
+        if self._restrict(self._alphabet.ordinal(ciphertext),
+                ~self._alphabet.mask_of(plaintext)):
+            self._strengthen()
+
+    def narrow_down_translations(self, ciphertext, plaintext):
+        """ Narrow down (potentially) the possible translations
+            of the "ciphertext" argument by asserting that it must
+            be one of the letters in the "plaintext" argument (which
+            can have duplicates and be in any order). (A "letter" that
+            isn't in the alphabet has no translations to narrow down.) """
+        number = self._alphabet.ordinal(ciphertext)
+        if number is None or number == self._alphabet.apostrophe():
+            return
+        if self._restrict(number, self._alphabet.mask_of(plaintext)):
+            self._strengthen()
+
+    def _restrict(self, number, mask):
+        """ Cut a ciphertext letter's translations down to the ones in a
+            mask, and see to any letters that get pinned down as a result.
+            Return True if that changed anything. (It doesn't if the letter
+            is pinned down already, since there's no narrowing it down
+            further, or if it would leave the letter no translations.) """
+        current = self._masks[number]
+        mask &= current
+        if not current & (current - 1) or mask == 0 or mask == current:
+            return False
+        self._set(number, mask)
+        if not mask & (mask - 1):
+            self._propagate(number)
+        return True
+
+    def _set(self, number, mask):
+        """ Change a ciphertext letter's translations, noting the old ones
+            on the trail if there are any checkpoints. """
+        if self._checkpoints:
+            self._trail.append((number, self._masks[number]))
+        if self._inverse is not None:
+            self._reinvert(number, self._masks[number], mask)
+        self._masks[number] = mask
+        self._changed |= 1 << number
+
+    def _inverted(self):
+        """ Return the inverse of the mapping: a mask for each plaintext
+            letter of the ciphertext letters that can translate to it. The
+            first time, we work it out from scratch; after that, every
+            change keeps it up to date (see _reinvert). """
+        if self._inverse is None:
+            self._inverse = [0] * len(self._masks)
+            for number, mask in enumerate(self._masks):
+                self._reinvert(number, 0, mask)
+        return self._inverse
+
+    def _reinvert(self, number, old, new):
+        """ Bring the inverse up to date for a change in
+            a ciphertext letter's translations. """
+        bit = 1 << number
+        changed = old ^ new
+        while changed:
+            lowest = changed & -changed
+            self._inverse[lowest.bit_length() - 1] ^= bit
+            changed ^= lowest
+
+    def _propagate(self, pinned):
+        """ A ciphertext letter has been pinned down to one translation,
+            so delete that translation from every other letter, and so on
+            for any letter that pins down in turn. Each stack entry is a
+            pinned letter, its translation's bit and the next letter to
+            delete it from; a letter that pins down gets dealt with
+            completely before we go back to the one that pinned it. """
+        stack = [(pinned, self._masks[pinned], 0)]
+        while stack:
+            pinned, bit, number = stack.pop()
+            while number < len(self._masks):
+                mask = self._masks[number]
+                if number != pinned and mask & (mask - 1) and mask & bit:
+                    mask &= ~bit
+                    self._set(number, mask)
+                    if not mask & (mask - 1):
+                        stack.append((pinned, bit, number + 1))
+                        stack.append((number, mask, 0))
+                        break
+                number += 1
+
+    def _strengthen(self):
+        """ Apply whatever rules beyond SINGLES the strength calls for
+            (see __init__), over and over until none of them changes
+            anything. """
+        if self._strength >= self.HIDDEN_SINGLES:
+            while self._hidden_singles() or (self._strength >= self.SETS
+                    and (self._naked_set() or self._hidden_set())):
+                pass
+
+    def _hidden_singles(self):
+        """ Pin down every ciphertext letter that's the only one that can
+            still translate to some plaintext letter. Return True if that
+            changed anything. """
+        changed = False
+        for plaintext, sources in enumerate(self._inverted()):
+            if sources and not sources & (sources - 1):
+                changed = self._restrict(sources.bit_length() - 1,
+                        1 << plaintext) or changed
+        return changed
+
+    def _naked_set(self):
+        """ Find a group of ciphertext letters that between them can only
+            translate to as many plaintext letters as there are letters in
+            the group, and delete those translations from the other
+            letters. Return True if that changed anything. """
+        for group, union in BitmaskAlphabetMapping._sets(self._masks):
+            changed = False
+            for number in range(len(self._masks)):
+                if not group & (1 << number):
+                    changed = self._restrict(number, ~union) or changed
+            if changed:
+                return True
+        return False
+
+    def _hidden_set(self):
+        """ Find a group of plaintext letters that only as many ciphertext
+            letters can translate to as there are letters in the group,
+            and narrow those ciphertext letters down to the group. Return
+            True if that changed anything. """
+        for group, union in BitmaskAlphabetMapping._sets(
+                list(self._inverted())):
+            changed = False
+            for number in range(len(self._masks)):
+                if union & (1 << number):
+                    changed = self._restrict(number, group) or changed
+            if changed:
+                return True
+        return False
+
+    @staticmethod
+    def _sets(masks):
+        """ Generate each group of two or more (but at most
+            CrypConstants.LARGEST_SET) of the given masks that have only as
+            many bits between them as there are masks in the group, as a
+            (mask of the group's numbers, bits of the group) pair. """
+        numbers = [number for number, mask in enumerate(masks)
+                if mask & (mask - 1) and BitmaskAlphabetMapping._size(mask)
+                <= CrypConstants.LARGEST_SET]
+        # Grow each group one mask at a time, in order of number, giving
+        # up on it once it has more bits than it could ever have masks.
+        stack = [(0, 0, 0, 0)]
+        while stack:
+            start, group, union, size = stack.pop()
+            for index in range(start, len(numbers)):
+                grown = union | masks[numbers[index]]
+                bits = BitmaskAlphabetMapping._size(grown)
+                if bits > CrypConstants.LARGEST_SET:
+                    continue
+                if bits == size + 1:
+                    yield group | (1 << numbers[index]), grown
+                elif bits > size + 1:
+                    stack.append((index + 1, group | (1 << numbers[index]),
+                            grown, size + 1))
+
+    @staticmethod
+    def _size(mask):
+        """ Return the number of bits in a mask. """
+        return bin(mask).count('1')
+
+    def conforms(self, ciphertext, plaintext):
+        """ If I said that a ciphertext word translates to a
+            plaintext word, does that conform to the current alphabet
+            mapping? If so, return True; otherwise return False. """
+        for index in range(len(ciphertext)):
+            if ciphertext[index] != '\'':
+                if not self._alphabet.mask_of(plaintext[index]) & \
+                        self._masks[self._alphabet.ordinal(ciphertext[index])]:
+                    return False
+        return True
+
+    def consistent(self):
+        """ Return False if the mapping has contradicted itself, with two
+            ciphertext letters pinned down to the same translation (which
+            narrowing down doesn't stop, since a letter that pins down
+            only deletes its translation from letters that aren't pinned
+            down yet), or a letter left with no translations at all. Return
+            True otherwise. """
+        pinned = 0
+        for mask in self._masks:
+            if not mask & (mask - 1):
+                if not mask or pinned & mask:
+                    return False
+                pinned |= mask
+        return True
+
+    def conforming(self, ciphertext, positional, mask):
+        """ Do the same as conforms, but for a whole bucket of plaintext
+            words at once. Given a ciphertext word, the positional index
+            of the words that fit its pattern (see PositionalIndex) and a
+            bitset of the words we're considering, return the bitset of
+            the ones that conform to the current alphabet mapping. """
+        # (If the words are in our alphabet, the positional index can
+        # take the translations as they are, as masks of ordinals.)
+        same_alphabet = positional.alphabet() is self._alphabet
+        ordinal = self._alphabet.ordinal
+        everything = self._alphabet.everything()
+        already_checked = '\''
+        for index in range(len(ciphertext)):
+            # (A repeated ciphertext letter needs checking only once,
+            # since the words fit the pattern and so repeat it too.)
+            if ciphertext[index] not in already_checked and mask:
+                already_checked += ciphertext[index]
+                translations = self._masks[ordinal(ciphertext[index])]
+                if translations == everything:
+                    continue
+                if same_alphabet:
+                    mask &= positional.matching_mask(index, translations)
+                else:
+                    mask &= positional.matching(index,
+                            self._alphabet.letters_of(translations))
+        return mask
+
+    def translate(self, ciphertext):
+        """ Given a ciphertext letter, return all translations. """
+        return self._alphabet.letters_of(
+                self._masks[self._alphabet.ordinal(ciphertext)])
+
+    def sources(self, plaintext):
+        """ Given a plaintext letter, return all the ciphertext
+            letters that might translate to it. """
+        return self._alphabet.letters_of(
+                self._inverted()[self._alphabet.ordinal(plaintext)])
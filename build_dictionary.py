@@ -0,0 +1,179 @@
+import argparse
+import hashlib
+import os
+import shutil
+import tempfile
+from alphabet import Alphabet
+from pattern_encoder import PatternEncoder
+from pattern_index import PatternIndex
+from sharded_pattern_index import ShardedPatternIndex
+from word_frequency import WordFrequency
+from word_membership import WordMembership
+from cryp_constants import CrypConstants
+
+class DictionaryBuilder():
+    """ Compile a plain word list (one word per line, optionally followed
+        by whitespace and the word's corpus frequency) into a directory of
+        pattern index shards for the solver. """
+
+    # The hash of the word list that a shard directory was built from.
+    SOURCE_HASH = 'SOURCE_HASH'
+
+    # How much of the word list to read at a time while hashing it.
+    CHUNK_SIZE = 1 << 20
+
+    @staticmethod
+    def build(source_path, directory, force=False, alphabet=None):
+        """ Build the shard directory for a word list in a given alphabet
+            (or the default one), unless it's already been built from a
+            word list with identical contents. Return True if we built
+            it, False if we found it up to date. """
+        alphabet = alphabet or Alphabet.default()
+        source_hash = DictionaryBuilder.hash_source(source_path, alphabet)
+        if not force and \
+                DictionaryBuilder.built_hash(directory) == source_hash:
+            return False
+
+        # Scatter the words into one spill file per word length so
+        # that we only need to hold one length's words in memory at a
+        # time, no matter how big the word list is.
+        spill_directory = tempfile.mkdtemp(prefix='cryp_build_')
+        try:
+            spill_files = {}
+            with open(source_path, encoding='utf-8') as source:
+                for line in source:
+                    entry = DictionaryBuilder.normalize(line, alphabet)
+                    if entry is None:
+                        continue
+                    word, frequency = entry
+                    if len(word) not in spill_files:
+                        spill_files[len(word)] = open(os.path.join(
+                                spill_directory, str(len(word))), 'w',
+                                encoding='utf-8')
+                    spill_files[len(word)].write(
+                            word + ' ' + str(frequency) + '\n')
+            for spill_file in spill_files.values():
+                spill_file.close()
+
+            # Start from a clean directory so that no shard
+            # from an older, different dictionary survives.
+            DictionaryBuilder._clear(directory)
+            for length in spill_files:
+                # (If a word is listed more than once,
+                # keep its highest frequency.)
+                frequencies = {}
+                with open(os.path.join(spill_directory, str(length)),
+                        encoding='utf-8') as spill_file:
+                    for line in spill_file:
+                        word, frequency = line.split()
+                        frequencies[word] = max(int(frequency),
+                                frequencies.get(word, 0))
+                patterns = {}
+                for word, frequency in frequencies.items():
+                    patterns.setdefault(PatternEncoder.encode(word),
+                            []).append((word, frequency))
+                PatternIndex.compile(patterns, os.path.join(directory,
+                        ShardedPatternIndex.shard_name(length)), alphabet)
+            WordMembership.compile(DictionaryBuilder._spilled_words(
+                    spill_directory, spill_files), os.path.join(directory,
+                    WordMembership.FILE_NAME))
+            ShardedPatternIndex.write_manifest(directory, spill_files,
+                    alphabet)
+        finally:
+            shutil.rmtree(spill_directory)
+
+        # Record the hash last; it's our proof of a finished build.
+        with open(os.path.join(directory,
+                DictionaryBuilder.SOURCE_HASH), 'w') as hash_file:
+            hash_file.write(source_hash + '\n')
+        return True
+
+    @staticmethod
+    def _clear(directory):
+        """ Make sure that a directory exists and holds none of the files
+            that a build writes. Only those files get deleted; anything
+            else in the directory is none of our business, so that
+            building into, say, the current directory by mistake costs
+            nothing worse than a few stray files. """
+        os.makedirs(directory, exist_ok=True)
+        ours = {DictionaryBuilder.SOURCE_HASH, ShardedPatternIndex.MANIFEST,
+                WordMembership.FILE_NAME}
+        for name in os.listdir(directory):
+            if name in ours or (name.startswith('length_') and
+                    name.endswith('.idx')):
+                os.remove(os.path.join(directory, name))
+
+    @staticmethod
+    def _spilled_words(spill_directory, lengths):
+        """ Iterate over every word in the spill files, one file at a time
+            (repeating any word that the word list repeated). """
+        for length in lengths:
+            with open(os.path.join(spill_directory, str(length)),
+                    encoding='utf-8') as spill_file:
+                for line in spill_file:
+                    yield line.split()[0]
+
+    @staticmethod
+    def normalize(line, alphabet=None):
+        """ Turn a line of the word list into a dictionary word and its
+            frequency (estimated if the line doesn't give one), or return
+            None if the line doesn't hold a usable word (one that's all in
+            the given alphabet, or the default one). """
+        alphabet = alphabet or Alphabet.default()
+        fields = line.split()
+        if len(fields) == 0 or len(fields) > 2:
+            return None
+        word = Alphabet.upper(fields[0])
+        if not alphabet.is_word(word):
+            return None
+        if len(fields) == 1:
+            return word, WordFrequency.estimate(word)
+        if not fields[1].isdigit():
+            return None
+        # (The index stores frequencies in 32 bits.)
+        return word, min(int(fields[1]), 0xFFFFFFFF)
+
+    @staticmethod
+    def hash_source(source_path, alphabet=None):
+        """ Return a hash of the contents of a word list (and of the
+            index format, the alphabet and the frequency estimates for
+            words listed without counts, which also affect the build). """
+        alphabet = alphabet or Alphabet.default()
+        source_hash = hashlib.sha256()
+        source_hash.update(PatternIndex.MAGIC +
+                bytes([PatternIndex.VERSION]) +
+                alphabet.letters().encode('utf-8'))
+        source_hash.update(WordFrequency.signature())
+        with open(source_path, 'rb') as source:
+            for chunk in iter(
+                    lambda: source.read(DictionaryBuilder.CHUNK_SIZE), b''):
+                source_hash.update(chunk)
+        return source_hash.hexdigest()
+
+    @staticmethod
+    def built_hash(directory):
+        """ Return the hash of the word list that a shard directory
+            was built from, or None if it wasn't (completely) built. """
+        try:
+            with open(os.path.join(directory,
+                    DictionaryBuilder.SOURCE_HASH)) as hash_file:
+                return hash_file.read().strip()
+        except OSError:
+            return None
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+            description='Compile a word list into a Cryp pattern index.')
+    parser.add_argument('word_list', help='a file with one word per line')
+    parser.add_argument('directory', help='where to write the index shards')
+    parser.add_argument('--force', action='store_true',
+            help='rebuild even if the word list has not changed')
+    parser.add_argument('--language', default=CrypConstants.LANGUAGE,
+            choices=sorted(CrypConstants.ALPHABETS),
+            help='the language (and so the alphabet) of the words')
+    arguments = parser.parse_args()
+    if DictionaryBuilder.build(arguments.word_list, arguments.directory,
+            arguments.force, Alphabet.named(arguments.language)):
+        print('Built ' + arguments.directory)
+    else:
+        print(arguments.directory + ' is already up to date')
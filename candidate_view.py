@@ -0,0 +1,108 @@
+from collections.abc import Sequence
+from positional_index import PositionalIndex
+
+class CandidateView(Sequence):
+    """ A read-only view of some of the words in a dictionary bucket,
+        given by a bitset over the bucket's positional index. Views share
+        the bucket's storage instead of copying it, and narrowing a view
+        down just makes another view with fewer bits set. Anybody who
+        really wants a list of their own can call copy(). """
+
+    def __init__(self, positional, mask=None):
+        """ Make a view of the words in a bitset (or of the whole bucket,
+            if there's no bitset) over a given positional index. """
+        self._positional = positional
+        if mask is None:
+            mask = positional.everything()
+        self._mask = mask
+        # If the bitset is all the words up to some point (which it is
+        # for whole buckets and their likeliest-first slices), we can
+        # find the nth word directly instead of counting bits.
+        self._prefix = mask & (mask + 1) == 0
+
+    @staticmethod
+    def likeliest(positional, limit=None):
+        """ Return a view of the whole bucket behind a positional index,
+            or of only its first "limit" (that is, likeliest) words. """
+        if limit is None:
+            return CandidateView(positional)
+        return CandidateView(positional,
+                positional.everything() & ((1 << limit) - 1))
+
+    def positional(self):
+        """ Return the positional index that the view is over. """
+        return self._positional
+
+    def mask(self):
+        """ Return the bitset of the words in the view. """
+        return self._mask
+
+    def narrowed(self, mask):
+        """ Return a view of only those words in this
+            view that are also in the given bitset. """
+        return CandidateView(self._positional, self._mask & mask)
+
+    def where(self, position, letters):
+        """ Return a view of only those words in this view that
+            have one of the given letters in a given position. """
+        return self.narrowed(self._positional.matching(position, letters))
+
+    def filter(self, predicate):
+        """ Iterate over the words in this view for which
+            the predicate is true, without copying the view. """
+        for word in self:
+            if predicate(word):
+                yield word
+
+    def copy(self):
+        """ Return a new list of the words in this
+            view, which the caller is free to change. """
+        return self._positional.words(self._mask)
+
+    def __len__(self):
+        return PositionalIndex.count(self._mask)
+
+    def __iter__(self):
+        mask = self._mask
+        while mask:
+            lowest = mask & -mask
+            yield self._positional.word(lowest.bit_length() - 1)
+            mask ^= lowest
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if self._prefix:
+                return tuple(self._positional.word(number)
+                        for number in range(*index.indices(len(self))))
+            return tuple(self.copy()[index])
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError('candidate index out of range')
+        if self._prefix:
+            return self._positional.word(index)
+        for number, word in enumerate(self):
+            if number == index:
+                return word
+
+    def __contains__(self, word):
+        # (Check letter by letter against the index
+        # rather than comparing word by word.)
+        if not isinstance(word, str) or \
+                len(word) != self._positional.width():
+            return False
+        mask = self._mask
+        for position, letter in enumerate(word):
+            if not mask:
+                return False
+            mask &= self._positional.matching(position, letter)
+        return bool(mask)
+
+    def __eq__(self, other):
+        if isinstance(other, (CandidateView, list, tuple)):
+            return len(self) == len(other) and \
+                    all(mine == theirs for mine, theirs in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return 'CandidateView(' + repr(self.copy()) + ')'
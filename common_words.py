@@ -0,0 +1,414 @@
+""" Common English words, for estimating how likely a dictionary word is
+    (see WordFrequency). rankedWords runs from the most common word down,
+    in roughly the order that word counts of large bodies of English text
+    put them; unrankedWords are less common, but still everyday, words in
+    alphabetical order, since their ranks among themselves hardly matter. """
+
+rankedWords = ['THE', 'OF', 'AND', 'TO', 'A', 'IN', 'IS', 'THAT', 'IT', 'I',
+               'FOR', 'YOU', 'WAS', 'HE', 'ON', 'WITH', 'AS', 'BE', 'HAVE',
+               'AT', 'THIS', 'ARE', 'HIS', 'NOT', 'BUT', 'BY', 'THEY',
+               'FROM', 'WE', 'OR', 'HAD', 'SHE', 'AN', 'HER', 'THERE',
+               'ONE', 'ALL', 'SAID', 'WHICH', 'WERE', 'DO', 'THEIR', 'IF',
+               'WILL', 'WHAT', 'SO', 'CAN', 'WOULD', 'MY', 'ME', 'ABOUT',
+               'OUT', 'UP', 'NO', 'HAS', 'BEEN', 'WHEN', 'WHO', 'HIM',
+               'THEM', 'MORE', 'YOUR', 'LIKE', 'JUST', "I'M", "IT'S",
+               "DON'T", 'SOME', "THERE'S", 'TIME', 'INTO', 'THAN', 'COULD',
+               'ONLY', 'OTHER', 'THEN', 'ITS', 'PEOPLE', 'NOW', 'ALSO',
+               'KNOW', 'GET', 'THESE', 'TWO', 'OVER', 'NEW', 'FIRST', 'OUR',
+               'SEE', 'WAY', 'VERY', 'BECAUSE', 'ANY', 'EVEN', 'HOW',
+               'THINK', 'BACK', 'WELL', 'AFTER', 'GO', 'DID', 'SHOULD',
+               'THOSE', 'US', 'GOOD', 'WHERE', 'MUCH', 'MAKE', 'MANY',
+               'MOST', 'THROUGH', 'YEAR', 'YEARS', 'DOWN', 'MAY', 'SUCH',
+               'DAY', 'MADE', 'OWN', 'BEFORE', 'SAY', 'HERE', 'STILL',
+               'BEING', 'MAN', 'COME', 'WORK', 'LIFE', 'LAST', 'WORLD',
+               'WHILE', 'BETWEEN', 'SAME', 'LITTLE', 'OLD', 'OFF', 'GOING',
+               'TAKE', 'WHY', 'UNDER', 'MIGHT', 'NEVER', 'THREE', 'AGAIN',
+               'GREAT', 'ANOTHER', 'RIGHT', 'LONG', 'BOTH', 'TOO', 'AROUND',
+               'EACH', 'MUST', 'SOMETHING', 'THINGS', 'THING', 'WANT',
+               'CAME', 'WENT', 'TOLD', 'PART', 'REALLY', 'THOUGHT', 'PLACE',
+               'CALLED', 'WITHOUT', 'AGAINST', 'GOT', 'HOME', 'ALWAYS',
+               'LOOKING', 'USE', 'HOWEVER', 'SINCE', 'MEN', 'SMALL',
+               'NUMBER', 'LEFT', 'DURING', 'OFTEN', 'LATER', 'HIGH', 'END',
+               'EVERY', 'FEW', 'LARGE', 'UNTIL', 'PUBLIC', 'LOOK', 'PUT',
+               'ASKED', 'CASE', 'SET', 'POINT', 'AWAY', 'SEEN', 'HOUSE',
+               'SYSTEM', 'YET', 'GENERAL', 'GOVERNMENT', 'GROUP', 'NEXT',
+               'COURSE', 'CHILDREN', 'GIVEN', 'IMPORTANT', 'PERHAPS',
+               'WHOLE', 'ONCE', 'LESS', 'ENOUGH', 'SECOND', 'TURNED',
+               'THOUGH', 'AMONG', 'ALMOST', 'ALREADY', 'MIND', 'TOOK',
+               'SIDE', 'FACT', 'FELT', 'HEAD', 'HAND', 'FACE', 'NOTHING',
+               'BECOME', 'POWER', 'SHOW', 'TIMES', 'TODAY', 'ABLE', 'UPON',
+               'ELSE', 'SEVERAL', 'LEAST', 'FAMILY', 'ORDER', 'DONE', 'FAR',
+               'COUNTRY', 'BUSINESS', 'SCHOOL', 'MONEY', 'NIGHT', 'WATER',
+               'RATHER', 'FOUR', 'FIVE', 'KEEP', 'NEED', 'EYES', 'ROOM',
+               'HALF', 'BETTER', 'BEST', 'YOUNG', 'QUITE', 'TRUE', 'KIND',
+               'KNEW', 'WORD', 'WORDS', 'WHETHER', 'NAME', 'PROBLEM',
+               'QUESTION', 'LET', 'BEGAN', 'STATE', 'SEEMED', 'TAKEN',
+               'PER', 'MILLION', 'BELIEVE', 'AREA', 'MOTHER', 'FATHER',
+               'OTHERS', 'CERTAIN', 'WITHIN', 'WHOM', 'DAYS', 'SURE',
+               'ANYTHING', 'TOWARD', 'BECAME', 'SOMETIMES', 'EARLY', 'OPEN',
+               'ACROSS', 'HELP', 'GAVE', 'FULL', 'LOVE', 'YES', 'MEAN',
+               'BROUGHT', 'BEHIND', 'STATES', 'CITY', 'JOHN', 'AMERICAN',
+               'NATIONAL', 'WAR', 'GONE', 'STOOD', 'HARD', 'REAL', "I'VE",
+               "I'LL", "YOU'RE", "CAN'T", "DIDN'T", "DOESN'T", "ISN'T",
+               "WON'T", "THAT'S", "HE'S", "SHE'S", "WE'RE", "THEY'RE",
+               "WHAT'S", "LET'S", "WASN'T", "AREN'T", "COULDN'T",
+               "WOULDN'T", "SHOULDN'T", "I'D", "YOU'LL", "WE'LL", "YOU'VE",
+               "WE'VE", "THEY'VE", "HE'D", "SHE'D", "THEY'LL", "HAVEN'T",
+               "HASN'T", "WEREN'T", "WHO'S", "WHERE'S", "HERE'S", 'ABOVE',
+               'ALONG', 'BELOW', 'BENEATH', 'BESIDE', 'BESIDES', 'BEYOND',
+               'DESPITE', 'EXCEPT', 'INSIDE', 'NEAR', 'ONTO', 'OUTSIDE',
+               'PAST', 'THROUGHOUT', 'TILL', 'TOWARDS', 'UNDERNEATH',
+               'UNLIKE', 'VIA', 'ALTHOUGH', 'UNLESS', 'WHEREAS', 'NOR',
+               'AM', 'HAVING', 'DOES', 'DOING', 'SHALL', 'OUGHT', 'MINE',
+               'MYSELF', 'YOURS', 'YOURSELF', 'YOURSELVES', 'HIMSELF',
+               'HERS', 'HERSELF', 'ITSELF', 'OURS', 'OURSELVES', 'THEIRS',
+               'THEMSELVES', 'WHOSE', 'SIX', 'SEVEN', 'EIGHT', 'NINE',
+               'TEN', 'ELEVEN', 'TWELVE', 'THIRTEEN', 'FOURTEEN', 'FIFTEEN',
+               'SIXTEEN', 'SEVENTEEN', 'EIGHTEEN', 'NINETEEN', 'TWENTY',
+               'THIRTY', 'FORTY', 'FIFTY', 'SIXTY', 'SEVENTY', 'EIGHTY',
+               'NINETY', 'HUNDRED', 'THOUSAND', 'BILLION', 'THIRD',
+               'FOURTH', 'FIFTH', 'SIXTH', 'SEVENTH', 'EIGHTH', 'NINTH',
+               'TENTH', 'DOUBLE', 'MONDAY', 'TUESDAY', 'WEDNESDAY',
+               'THURSDAY', 'FRIDAY', 'SATURDAY', 'SUNDAY', 'JANUARY',
+               'FEBRUARY', 'MARCH', 'APRIL', 'JUNE', 'JULY', 'AUGUST',
+               'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'MR', 'MRS',
+               'MS', 'DR', 'SIR', 'MADAM', 'MISS', 'OH', 'AH', 'OKAY', 'OK',
+               'HELLO', 'HI', 'GOODBYE', 'PLEASE', 'THANK', 'THANKS',
+               'SORRY', 'HEY', 'WOW', 'SUCCESS', 'IDEA', 'GOES',
+               'HAPPINESS', 'IDEAS', 'WOMAN', 'WISDOM', 'PLAN', 'BAD',
+               'WOMEN', 'KNOWLEDGE', 'PLANS', 'WORSE', 'BODY', 'FREEDOM',
+               'PROJECT', 'WORST', 'LAW', 'COURAGE', 'COMES', 'CAR', 'FEAR',
+               'PROBLEMS', 'COMING', 'BIG', 'BOOK', 'HOPE', 'ISSUE',
+               'STORY', 'FAITH', 'ISSUES', 'DOOR', 'PEACE', 'GETS', 'JOY',
+               'QUESTIONS', 'GETTING', 'JOB', 'BEAUTY', 'REASON', 'SHORT',
+               'PARTY', 'PAIN', 'REASONS', 'OFFICE', 'FAILURE', 'PURPOSE',
+               'MAKES', 'LOW', 'LEVEL', 'DREAM', 'GOAL', 'MAKING', 'GAME',
+               'DREAMS', 'GOALS', 'LINE', 'MISTAKE', 'CHOICE', 'MISTAKES',
+               'CHOICES', 'TAKES', 'CHARACTER', 'DECISION', 'TAKING',
+               'LATE', 'GIRL', 'NATURE', 'DECISIONS', 'BOY', 'SPIRIT',
+               'METHOD', 'WRONG', 'PERSON', 'HEAVEN', 'METHODS', 'FRIEND',
+               'HELL', 'SEES', 'FALSE', 'FRIENDS', 'SIN', 'MEANS', 'SEEING',
+               'DOG', 'VIRTUE', 'SAW', 'CAT', 'HONOR', 'SYSTEMS', 'MORNING',
+               'DUTY', 'PROCESS', 'EASY', 'EVENING', 'GLORY', 'RESULT',
+               'KNOWS', 'FREE', 'MOMENT', 'FORTUNE', 'RESULTS', 'KNOWING',
+               'AIR', 'FATE', 'EFFECT', 'EMPTY', 'LOT', 'CHANCE', 'EFFECTS',
+               'KNOWN', 'TEACHER', 'LUCK', 'CAUSE', 'CLOSE', 'STUDENT',
+               'OPPORTUNITY', 'CAUSES', 'THINKS', 'STUDENTS', 'EDUCATION',
+               'EXAMPLE', 'THINKING', 'CHANGE', 'EXPERIENCE', 'EXAMPLES',
+               'DIFFERENT', 'IMAGINATION', 'HISTORY', 'GENIUS', 'CASES',
+               'SAYS', 'TALENT', 'SAYING', 'POSSIBLE', 'MATTER', 'EFFORT',
+               'POINTS', 'AVAILABLE', 'FORM', 'PATIENCE', 'TELL', 'CLEAR',
+               'SILENCE', 'TELLS', 'MEMORY', 'PARTS', 'TELLING', 'LIKELY',
+               'MEMORIES', 'PIECE', 'STREET', 'FUTURE', 'PIECES', 'GIVE',
+               'TOWN', 'SECTION', 'GIVES', 'YOUTH', 'GIVING', 'PRIVATE',
+               'ROAD', 'AGE', 'AREAS', 'POLITICAL', 'RIVER', 'WEALTH',
+               'REGION', 'SOCIAL', 'SEA', 'POVERTY', 'FIND', 'ECONOMIC',
+               'SKY', 'JUSTICE', 'PLACES', 'FINDS', 'SUN', 'LIBERTY',
+               'SITE', 'FINDING', 'LOCAL', 'MOON', 'DEMOCRACY', 'POSITION',
+               'FOUND', 'HUMAN', 'STAR', 'POLITICS', 'SITUATION',
+               'MILITARY', 'STARS', 'POLITICIAN', 'CONDITION', 'LOOKS',
+               'SPECIAL', 'TREE', 'POLITICIANS', 'CONDITIONS', 'TREES',
+               'LOOKED', 'COMMON', 'FOOD', 'NATION', 'SIMPLE', 'BREAD',
+               'NATIONS', 'LEVELS', 'WANTS', 'STRONG', 'MILK', 'RATE',
+               'WANTED', 'WEAK', 'COFFEE', 'CROWD', 'RATES', 'RICH', 'TEA',
+               'SOCIETY', 'AMOUNT', 'USES', 'POOR', 'WINE', 'CULTURE',
+               'USED', 'HAPPY', 'BEER', 'RELIGION', 'NUMBERS', 'USING',
+               'SAD', 'MUSIC', 'SCIENCE', 'FIGURE', 'NICE', 'FILM',
+               'PHILOSOPHY', 'FIGURES', 'WORKS', 'FINE', 'MOVIE', 'TRUTH',
+               'SIZE', 'WORKING', 'BEAUTIFUL', 'PICTURE', 'LIES', 'SHAPE',
+               'WORKED', 'PRETTY', 'PAPER', 'LIE', 'CALL', 'UGLY', 'LETTER',
+               'LIAR', 'FORMS', 'CALLS', 'HOT', 'NEWS', 'ENEMY', 'TYPE',
+               'COLD', 'REPORT', 'ENEMIES', 'TYPES', 'CALLING', 'WARM',
+               'TRY', 'COOL', 'ANSWER', 'FRIENDSHIP', 'KINDS', 'TRIES',
+               'DARK', 'MARRIAGE', 'SORT', 'TRIED', 'BRIGHT', 'WIFE',
+               'SORTS', 'TRYING', 'LIGHT', 'HEART', 'HUSBAND', 'STYLE',
+               'ASK', 'HEAVY', 'BLOOD', 'SON', 'DESIGN', 'ASKS', 'FAST',
+               'BONE', 'DAUGHTER', 'STRUCTURE', 'SLOW', 'SKIN', 'BROTHER',
+               'PATTERN', 'ASKING', 'QUICK', 'HAIR', 'SISTER', 'MODEL',
+               'QUIET', 'BABY', 'MODELS', 'NEEDS', 'LOUD', 'EYE', 'BABIES',
+               'ROLE', 'NEEDED', 'SOFT', 'EAR', 'PARENT', 'FEEL', 'SAFE',
+               'NOSE', 'PARENTS', 'QUALITY', 'FEELS', 'DANGEROUS', 'MOUTH',
+               'QUANTITY', 'FEELING', 'DEAD', 'FAMILIES', 'DEGREE', 'ALIVE',
+               'HANDS', 'CHILD', 'EXTENT', 'SICK', 'ARM', 'RANGE',
+               'BECOMES', 'ILL', 'ARMS', 'SCALE', 'BECOMING', 'HEALTHY',
+               'LEG', 'UNCLE', 'BASE', 'LEAVE', 'BUSY', 'LEGS', 'AUNT',
+               'BASIS', 'LEAVES', 'READY', 'FOOT', 'COUSIN', 'CENTER',
+               'LEAVING', 'TIRED', 'FEET', 'NEIGHBOR', 'EDGE', 'HUNGRY',
+               'FINGER', 'STRANGER', 'ANGRY', 'GUEST', 'ENDS', 'PUTS',
+               'AFRAID', 'NECK', 'MASTER', 'TOP', 'PUTTING', 'ALONE',
+               'SERVANT', 'BOTTOM', 'SINGLE', 'SLAVE', 'FRONT', 'MAIN',
+               'SOUL', 'HERO', 'MEANT', 'MAJOR', 'GOD', 'HEROES', 'SIDES',
+               'MINOR', 'KING', 'FOOL', 'MIDDLE', 'KEEPS', 'FINAL', 'QUEEN',
+               'FOOLS', 'KEEPING', 'NATURAL', 'LORD', 'LINES', 'KEPT',
+               'SERIOUS', 'PRINCE', 'SAINT', 'CIRCLE', 'RECENT',
+               'PRESIDENT', 'DEVIL', 'SQUARE', 'LETS', 'SIMILAR', 'LEADER',
+               'ANGEL', 'CORNER', 'BEGIN', 'VARIOUS', 'MEMBER', 'GHOST',
+               'SURFACE', 'BEGINS', 'ENTIRE', 'MEMBERS', 'BEGINNING',
+               'WIDE', 'ARMY', 'DEEP', 'SOLDIER', 'BEGUN', 'HUGE', 'POLICE',
+               'BRAIN', 'SEEM', 'TINY', 'DOCTOR', 'THOUGHTS', 'HEALTH',
+               'SEEMS', 'THIN', 'NURSE', 'FEELINGS', 'DISEASE', 'THICK',
+               'LAWYER', 'EMOTION', 'ILLNESS', 'FAT', 'JUDGE', 'PASSION',
+               'CANCER', 'HELPS', 'CLEAN', 'CHURCH', 'DESIRE', 'HELPED',
+               'DIRTY', 'ANGER', 'MEDICINE', 'TALK', 'DRY', 'COLLEGE',
+               'HATE', 'DRUG', 'TALKS', 'WET', 'UNIVERSITY', 'HATRED',
+               'DRUGS', 'TALKED', 'FRESH', 'CLASS', 'TREATMENT', 'TALKING',
+               'SWEET', 'LESSON', 'LOVER', 'PATIENT', 'TURN', 'BITTER',
+               'TEST', 'JEALOUSY', 'PATIENTS', 'TURNS', 'SOUR', 'PRIDE',
+               'BLACK', 'MARKET', 'SHAME', 'DOCTORS', 'START', 'WHITE',
+               'BANK', 'GUILT', 'STARTS', 'RED', 'PRICE', 'DOUBT', 'CARE',
+               'STARTED', 'BLUE', 'COST', 'TRUST', 'SLEEP', 'STARTING',
+               'GREEN', 'RESPECT', 'YELLOW', 'DOLLAR', 'KINDNESS',
+               'EXERCISE', 'SHOWS', 'BROWN', 'DOLLARS', 'HUMOR', 'SPORT',
+               'SHOWED', 'GRAY', 'POUND', 'LAUGHTER', 'SPORTS', 'SHOWN',
+               'GREY', 'TAX', 'TEARS', 'HEAR', 'PINK', 'SMILE', 'GAMES',
+               'HEARS', 'PURPLE', 'COMPANY', 'RACE', 'HEARD', 'ORANGE',
+               'INDUSTRY', 'REALITY', 'TEAM', 'HEARING', 'GOLD', 'WORKER',
+               'FICTION', 'FAN', 'PLAY', 'GOLDEN', 'WORKERS', 'FANS',
+               'PLAYS', 'SILVER', 'FACTS', 'MATCH', 'PLAYED', 'WILD',
+               'JOBS', 'OPINION', 'SCORE', 'PLAYING', 'CALM', 'OPINIONS',
+               'RUN', 'GLAD', 'BOSS', 'ADVICE', 'RUNS', 'PROUD', 'BALL',
+               'RUNNING', 'BRAVE', 'LESSONS', 'PLAYER', 'RAN', 'WISE',
+               'RULE', 'COACH', 'MOVE', 'PLAYERS', 'RULES', 'WIN', 'MOVES',
+               'CRUEL', 'LOSS', 'MOVED', 'FUNNY', 'FIELD', 'LAWS', 'VOICE',
+               'MOVING', 'STRANGE', 'CLUB', 'CRIME', 'SOUND', 'FOREIGN',
+               'SEASON', 'CRIMINAL', 'SOUNDS', 'LIKES', 'FAMOUS', 'WEEK',
+               'MURDER', 'LIKED', 'PERFECT', 'WEEKS', 'DEATH', 'SONG',
+               'LIVE', 'NORMAL', 'MONTH', 'BIRTH', 'SONGS', 'LIVES',
+               'USUAL', 'MONTHS', 'BAND', 'LIVED', 'MODERN', 'HOUR',
+               'LIVING', 'INSTRUMENT', 'ANCIENT', 'HOURS', 'PIANO',
+               'MINUTE', 'JOURNEY', 'GUITAR', 'BELIEVED', 'MINUTES',
+               'RADIO', 'HOLD', 'PRESENT', 'PATH', 'NOISE', 'HOLDS', 'DEAR',
+               'SECONDS', 'HELD', 'WAYS', 'HOLDING', 'LUCKY', 'BRING',
+               'FAIR', 'EARTH', 'SENTENCE', 'BRINGS', 'HONEST', 'NIGHTS',
+               'UNIVERSE', 'BRINGING', 'CORRECT', 'SPACE', 'STORIES',
+               'EXACT', 'AFTERNOON', 'TALE', 'HAPPEN', 'EQUAL', 'NOVEL',
+               'HAPPENS', 'DIRECT', 'MOMENTS', 'POEM', 'HAPPENED', 'TOTAL',
+               'POETRY', 'WRITE', 'BASIC', 'SUMMER', 'AUTHOR', 'WRITES',
+               'CENTRAL', 'WINTER', 'WRITER', 'WRITING', 'PHYSICAL',
+               'SPRING', 'WRITERS', 'WROTE', 'PERSONAL', 'AUTUMN', 'BATTLE',
+               'WRITTEN', 'POPULAR', 'FALL', 'VICTORY', 'BOOKS', 'PROVIDE',
+               'CURRENT', 'WEATHER', 'DEFEAT', 'TEXT', 'PROVIDED', 'LEGAL',
+               'RAIN', 'NOTE', 'SIT', 'MEDICAL', 'SNOW', 'NOTES', 'SITS',
+               'FINANCIAL', 'WIND', 'WEAPON', 'SITTING', 'STORM', 'WEAPONS',
+               'MESSAGE', 'SAT', 'ORIGINAL', 'FIRE', 'GUN', 'MESSAGES',
+               'STAND', 'PARTICULAR', 'GUNS', 'SPEECH', 'STANDS',
+               'PROFESSIONAL', 'SWORD', 'STANDING', 'USEFUL', 'LAND',
+               'BOMB', 'CONVERSATION', 'WONDERFUL', 'GROUND', 'SHIP',
+               'DISCUSSION', 'LOSE', 'TERRIBLE', 'STONE', 'SHIPS', 'DEBATE',
+               'LOSES', 'HORRIBLE', 'ROCK', 'ARGUMENT', 'LOSING', 'AWFUL',
+               'WOOD', 'OCEAN', 'STATEMENT', 'LOST', 'LOVELY', 'ISLAND',
+               'CLAIM', 'PAY', 'PLEASANT', 'MOUNTAIN', 'ANIMAL', 'PAYS',
+               'IRON', 'MOUNTAINS', 'ANIMALS', 'PAYING', 'GLASS', 'HILL',
+               'PAID', 'FRIENDLY', 'PLASTIC', 'HILLS', 'DOGS', 'MEET',
+               'CAREFUL', 'METAL', 'VALLEY', 'MEETS', 'CARELESS', 'OIL',
+               'FOREST', 'CATS', 'MEETING', 'GAS', 'DESERT', 'HORSE', 'MET',
+               'BIRD', 'INCLUDE', 'ENERGY', 'LAKE', 'BIRDS', 'INCLUDES',
+               'BEACH', 'FISH', 'INCLUDED', 'HEAT', 'SHORE', 'INSECT',
+               'INCLUDING', 'COAST', 'BUG', 'CONTINUE', 'WAVE', 'BEE',
+               'CONTINUED', 'WAVES', 'BEES', 'PROGRAM', 'USUALLY', 'SNAKE',
+               'SETS', 'WINDS', 'LION', 'SETTING', 'DANCE', 'CLOUD',
+               'TIGER', 'LEARN', 'ART', 'CLOUDS', 'BEAR', 'LEARNED',
+               'ARTIST', 'WOLF', 'LEARNING', 'PAINTING', 'FOX', 'SUNSHINE',
+               'RABBIT', 'CHANGED', 'SOON', 'SHADOW', 'MOUSE', 'CHANGES',
+               'PAGE', 'SHADOWS', 'RAT', 'CHANGING', 'DARKNESS', 'MONKEY',
+               'LEAD', 'ELEPHANT', 'LEADS', 'DEER', 'LEADING', 'POET',
+               'FLAME', 'DUCK', 'LED', 'TOMORROW', 'SMOKE', 'COW',
+               'UNDERSTAND', 'YESTERDAY', 'READER', 'DUST', 'COWS',
+               'UNDERSTOOD', 'TONIGHT', 'LIBRARY', 'ICE', 'PIG', 'WATCH',
+               'MAYBE', 'PIGS', 'WATCHED', 'SHEEP', 'WATCHING', 'STONES',
+               'GOAT', 'FOLLOW', 'LETTERS', 'CHICKEN', 'FOLLOWED',
+               'LANGUAGE', 'ROCKS', 'FOLLOWING', 'ENGLISH', 'SAND', 'STOP',
+               'FRENCH', 'STOPPED', 'GERMAN', 'DIAMOND', 'STOPPING',
+               'JEWEL', 'CREATE', 'TREASURE', 'CREATED', 'TWICE', 'MATH',
+               'SPEAK', 'EVER', 'CASH', 'SPEAKS', 'SPEAKING', 'INSTEAD',
+               'SPOKE', 'TOGETHER', 'VALUE', 'SPOKEN', 'WORTH', 'READ',
+               'READS', 'DEAL', 'READING', 'HORSES', 'TRADE', 'ALLOW',
+               'ALLOWED', 'BUYER', 'ADD', 'SELLER', 'ADDED', 'CUSTOMER',
+               'THUS', 'SPEND', 'AHEAD', 'EGG', 'SERVICE', 'SPENT', 'EGGS',
+               'PRODUCT', 'GROW', 'APPLE', 'GOODS', 'GREW', 'ESPECIALLY',
+               'APPLES', 'SALE', 'GROWN', 'CERTAINLY', 'FRUIT', 'SALES',
+               'GROWING', 'PROBABLY', 'FLOWER', 'PROFIT', 'ACTUALLY',
+               'FLOWERS', 'OPENED', 'FINALLY', 'GARDEN', 'DEBT', 'OPENING',
+               'SIMPLY', 'GRASS', 'CREDIT', 'WALK', 'EXACTLY', 'BILL',
+               'WALKED', 'NEARLY', 'FARM', 'BILLS', 'WALKING', 'SUDDENLY',
+               'FARMER', 'CHECK', 'QUICKLY', 'VILLAGE', 'CARD', 'WON',
+               'SLOWLY', 'ACCOUNT', 'WINNING', 'CLEARLY', 'CITIES', 'OFFER',
+               'EASILY', 'OFFERED', 'RECENTLY', 'TOWNS', 'REMEMBER',
+               'DIRECTLY', 'REMEMBERED', 'GENERALLY', 'HOUSES', 'HARDLY',
+               'LOVED', 'QUIETLY', 'LOVES', 'RARELY', 'ROOMS', 'EITHER',
+               'LOVING', 'SERIOUSLY', 'KITCHEN', 'CONSIDER', 'TRULY', 'BED',
+               'CONSIDERED', 'COMPLETELY', 'BEDROOM', 'APPEAR',
+               'ABSOLUTELY', 'BATH', 'APPEARED', 'IMMEDIATELY', 'BUY',
+               'INDEED', 'DOORS', 'BOUGHT', 'ANYWAY', 'WINDOW', 'WAIT',
+               'OTHERWISE', 'WINDOWS', 'WAITED', 'THEREFORE', 'WALL',
+               'WAITING', 'WALLS', 'SERVE', 'FLOOR', 'SERVED', 'WHATEVER',
+               'ROOF', 'DIE', 'WHENEVER', 'TABLE', 'DIED', 'WHEREVER',
+               'CHAIR', 'DYING', 'WHOEVER', 'CHAIRS', 'SEND', 'DESK',
+               'SENT', 'ANYWHERE', 'BOX', 'SENDING', 'EVERYWHERE', 'BAG',
+               'EXPECT', 'SOMEWHERE', 'BOTTLE', 'EXPECTED', 'NOWHERE',
+               'CUP', 'BUILD', 'ANYONE', 'BUILT', 'EVERYONE', 'PLATE',
+               'BUILDING', 'SOMEONE', 'KNIFE', 'STAY', 'NOBODY', 'FORK',
+               'STAYED', 'EVERYBODY', 'SPOON', 'SOMEBODY', 'CLOCK', 'FELL',
+               'ANYBODY', 'FALLEN', 'PHONE', 'INFORMATION', 'FALLING',
+               'EVERYTHING', 'COMPUTER', 'CUT', 'TELEVISION', 'REACH',
+               'REACHED', 'NONE', 'KILL', 'NEITHER', 'CARS', 'KILLED',
+               'BUS', 'REMAIN', 'TRAIN', 'REMAINED', 'PLANE', 'SUGGEST',
+               'DEVELOPMENT', 'SUGGESTED', 'BOAT', 'RAISE', 'BIKE',
+               'RAISED', 'TRUCK', 'PASS', 'PASSED', 'ROADS', 'PASSING',
+               'SELL', 'BRIDGE', 'SOLD', 'STATION', 'REQUIRE', 'AIRPORT',
+               'UNITED', 'REQUIRED', 'HOTEL', 'RESTAURANT', 'REPORTED',
+               'SHOP', 'DECIDE', 'STORE', 'DECIDED', 'HOSPITAL', 'PULL',
+               'PRISON', 'PULLED', 'COURT', 'PULLING', 'BREAK', 'BROKE',
+               'BROKEN', 'BREAKING', 'WISH', 'WISHED', 'HOPED', 'HOPING',
+               'DRIVE', 'PERIOD', 'DROVE', 'DRIVEN', 'DRIVING', 'CARRY',
+               'CARRIED', 'EAT', 'ATE', 'EATEN', 'EATING', 'DRINK', 'DRANK',
+               'SLEPT', 'SING', 'SANG', 'SUNG', 'FLY', 'FLEW', 'FLYING',
+               'SWIM', 'FIGHT', 'FOUGHT', 'THROW', 'THREW', 'THROWN',
+               'CATCH', 'CAUGHT', 'TEACH', 'TAUGHT', 'WEAR', 'WORE', 'WORN',
+               'CHOOSE', 'CHOSE', 'CHOSEN', 'FORGET', 'FORGOT', 'FORGOTTEN',
+               'FORGIVE', 'HIDE', 'HID', 'RIDE', 'RODE', 'RISE', 'ROSE',
+               'RISEN', 'SHAKE', 'SHOOK', 'SHOOT', 'SHOT', 'SINK', 'STEAL',
+               'STOLE', 'STRIKE', 'STRUCK', 'SWEAR', 'SWORE', 'POLICY',
+               'TEAR', 'TORE', 'WAKE', 'WOKE', 'LAUGH', 'FURTHER',
+               'LAUGHED', 'CRY', 'SUPPORT', 'CRIED', 'SMILED', 'KISS',
+               'KISSED', 'TOUCH', 'SENSE', 'TOUCHED', 'PICK', 'PICKED',
+               'PUSH', 'INTEREST', 'PUSHED', 'JUMP', 'JUMPED', 'CLIMB',
+               'CLIMBED', 'FILL', 'FILLED', 'ACT', 'CLEANED', 'COOK',
+               'COOKED', 'WASH', 'FORCE', 'WASHED', 'CLOSED', 'CLOSING',
+               'ENTER', 'ENTERED', 'JOIN', 'JOINED', 'TRAVEL', 'SHARE',
+               'SHARED', 'SAVE', 'SAVED', 'CARED', 'RETURN', 'RETURNED',
+               'AGO', 'ANSWERED', 'COUNT', 'COUNTED', 'DATA', 'EXPLAIN',
+               'EXPLAINED', 'DESCRIBE', 'DESCRIBED', 'AGREE', 'AGREED',
+               'ACCEPT', 'ACCEPTED', 'RECEIVE', 'RECEIVED', 'PREPARE',
+               'ACTION', 'PREPARED', 'CONTROL', 'PRODUCE', 'VIEW',
+               'PRODUCED', 'PROTECT', 'PROTECTED', 'PROVE', 'PROVED',
+               'NOTICE', 'NOTICED', 'MENTION', 'MENTIONED', 'WORRY',
+               'WORRIED', 'WONDER', 'WONDERED', 'IMAGINE', 'IMAGINED',
+               'ACCORDING', 'REST', 'RESEARCH', 'LAY', 'SOUTH', 'NORTH',
+               'EAST', 'WEST', 'DUE', 'INDIVIDUAL', 'DIFFICULT', 'MILES',
+               'ATTENTION', 'BOARD', 'FORWARD', 'EVIDENCE', 'PRESS',
+               'INCREASE', 'PRACTICE', 'COLOR', 'STAGE', 'SOURCE', 'COUPLE',
+               'ONES', 'HIT', 'PRESSURE', 'LIST', 'CENTURY', 'SUBJECT',
+               'STEP', 'DEVELOPED', 'INVOLVED', 'TROUBLE', 'BORN',
+               'MOVEMENT', 'FORCES', 'STOCK', 'SIGN', 'RELIGIOUS',
+               'RESPONSE', 'LONGER', 'TERMS', 'TERM', 'HIGHER']
+
+unrankedWords = ['ACTIVE', 'ACTIVITY', 'ADDRESS', 'ADMIT', 'ADULT', 'AFFECT',
+                 'AGENCY', 'AGENT', 'AID', 'AIM', 'ANALYSIS', 'ANNOUNCE',
+                 'ANNUAL', 'APART', 'APPLY', 'APPROACH', 'APPROVE', 'ARGUE',
+                 'ARRIVE', 'ARTICLE', 'ASIDE', 'ASSUME', 'ATTACK', 'ATTEMPT',
+                 'ATTEND', 'ATTITUDE', 'AUDIENCE', 'AVOID', 'AWARD', 'AWARE',
+                 'BALANCE', 'BAR', 'BEAT', 'BEHAVIOR', 'BENEFIT', 'BIT',
+                 'BLIND', 'BLOCK', 'BORROW', 'BRANCH', 'BREATH', 'BREATHE',
+                 'BRIEF', 'BROAD', 'BUDGET', 'BURN', 'BURNING', 'BUTTON',
+                 'CABINET', 'CAMERA', 'CAMP', 'CAMPAIGN', 'CANDIDATE',
+                 'CAPITAL', 'CAPTAIN', 'CAREER', 'CEILING', 'CELL', 'CHAIN',
+                 'CHALLENGE', 'CHAMPION', 'CHANNEL', 'CHAPTER', 'CHARGE',
+                 'CHEAP', 'CHEST', 'CHIEF', 'CHIP', 'CITIZEN', 'CIVIL',
+                 'CLOTHES', 'COAT', 'CODE', 'COLLECT', 'COLUMN', 'COMFORT',
+                 'COMMAND', 'COMMENT', 'COMMIT', 'COMMITTEE', 'COMMUNITY',
+                 'COMPARE', 'COMPETE', 'COMPLETE', 'CONCERN', 'CONCERT',
+                 'CONDUCT', 'CONFIDENCE', 'CONGRESS', 'CONNECT', 'CONSCIOUS',
+                 'CONTAIN', 'CONTENT', 'CONTRACT', 'COPY', 'COUNCIL', 'COVER',
+                 'CRACK', 'CRAZY', 'CREW', 'CRISIS', 'CRITIC', 'CROSS',
+                 'CROWN', 'CURIOUS', 'CYCLE', 'DAMAGE', 'DANGER', 'DARE',
+                 'DATE', 'DECADE', 'DEFEND', 'DELIVER', 'DEMAND', 'DENY',
+                 'DEPEND', 'DESERVE', 'DESTROY', 'DETAIL', 'DETERMINE',
+                 'DEVICE', 'DIET', 'DINNER', 'DIRECTION', 'DIRT', 'DISCOVER',
+                 'DISCUSS', 'DISH', 'DISTANCE', 'DIVIDE', 'DOCUMENT', 'DRAFT',
+                 'DRAG', 'DRAMA', 'DRAW', 'DRAWING', 'DRESS', 'DROP', 'EAGER',
+                 'EARN', 'EASE', 'ECONOMY', 'EDITION', 'EDITOR', 'ELEMENT',
+                 'EMERGE', 'EMPLOYEE', 'ENCOURAGE', 'ENGINE', 'ENJOY',
+                 'ENORMOUS', 'ENSURE', 'ENVIRONMENT', 'EQUIPMENT', 'ESCAPE',
+                 'ESSAY', 'ESTABLISH', 'ESTATE', 'EVENT', 'EXAMINE', 'EXIST',
+                 'EXPAND', 'EXPERT', 'EXPRESS', 'EXTEND', 'EXTRA', 'FAIL',
+                 'FAMILIAR', 'FASHION', 'FAULT', 'FAVOR', 'FAVORITE',
+                 'FEATURE', 'FEDERAL', 'FEE', 'FEED', 'FELLOW', 'FEMALE',
+                 'FENCE', 'FILE', 'FINANCE', 'FIT', 'FIX', 'FLAG', 'FLAT',
+                 'FLIGHT', 'FLOAT', 'FLOW', 'FOCUS', 'FOLD', 'FOLK',
+                 'FOOTBALL', 'FORMER', 'FRAME', 'FRANK', 'FROG', 'FUEL',
+                 'FUN', 'FUNCTION', 'FUND', 'GAIN', 'GAP', 'GARAGE', 'GATE',
+                 'GATHER', 'GENTLE', 'GENTLEMAN', 'GIFT', 'GLANCE', 'GLOBAL',
+                 'GOLF', 'GOVERNOR', 'GRAB', 'GRADE', 'GRAND', 'GRANDFATHER',
+                 'GRANDMOTHER', 'GRANT', 'GRAVE', 'GRIN', 'GRIP', 'GUARD',
+                 'GUESS', 'GUIDE', 'GUILTY', 'GUY', 'HABIT', 'HALL', 'HANDLE',
+                 'HANG', 'HARM', 'HAT', 'HEADLINE', 'HEIGHT', 'HIGHWAY',
+                 'HIRE', 'HOLE', 'HOLIDAY', 'HOLLOW', 'HOLY', 'HOOK', 'HORN',
+                 'HUNT', 'HUNTING', 'HURRY', 'HURT', 'IGNORE', 'ILLEGAL',
+                 'IMAGE', 'IMPACT', 'IMPLY', 'IMPOSE', 'IMPRESS', 'IMPROVE',
+                 'INCIDENT', 'INCOME', 'INDEPENDENT', 'INDEX', 'INDICATE',
+                 'INFLUENCE', 'INFORM', 'INJURY', 'INNER', 'INNOCENT',
+                 'INSIST', 'INSTANCE', 'INTEND', 'INTENSE', 'INTERVIEW',
+                 'INTRODUCE', 'INVITE', 'INVOLVE', 'ITEM', 'JACKET', 'JOKE',
+                 'JOURNAL', 'JUICE', 'JURY', 'KEY', 'KICK', 'KID', 'KNEE',
+                 'KNOCK', 'LABEL', 'LABOR', 'LACK', 'LADDER', 'LADY', 'LAMP',
+                 'LANDSCAPE', 'LANE', 'LAUNCH', 'LAYER', 'LAZY', 'LEAF',
+                 'LEAN', 'LEATHER', 'LEGEND', 'LENGTH', 'LENS', 'LID', 'LIFT',
+                 'LIMIT', 'LINK', 'LIP', 'LIQUID', 'LISTEN', 'LOAD', 'LOAN',
+                 'LOCK', 'LONELY', 'LOOSE', 'LUNCH', 'MACHINE', 'MAD', 'MAIL',
+                 'MAINTAIN', 'MALE', 'MALL', 'MANAGE', 'MANAGER', 'MANNER',
+                 'MAP', 'MARK', 'MARRY', 'MASS', 'MATE', 'MAYOR', 'MEAL',
+                 'MEAT', 'MEDIUM', 'MENTAL', 'MESS', 'MILE', 'MINISTER',
+                 'MIRROR', 'MISSION', 'MIX', 'MODE', 'MOOD', 'MORAL',
+                 'MOSTLY', 'MOTION', 'MOTOR', 'MOUNT', 'MUD', 'MUSCLE',
+                 'MUSEUM', 'MYSTERY', 'NAKED', 'NARROW', 'NEAT', 'NEGATIVE',
+                 'NERVE', 'NERVOUS', 'NET', 'NETWORK', 'NEWSPAPER', 'NOBLE',
+                 'NOD', 'NOON', 'NUCLEAR', 'NUT', 'OBEY', 'OBJECT', 'OBTAIN',
+                 'OBVIOUS', 'OCCASION', 'OCCUR', 'ODD', 'OFFENSE', 'OFFICER',
+                 'OFFICIAL', 'OPERA', 'OPERATE', 'OPERATION', 'OPPONENT',
+                 'OPPOSE', 'OPTION', 'ORDINARY', 'ORGAN', 'ORGANIZE',
+                 'ORIGIN', 'OUTCOME', 'OVEN', 'OWNER', 'PACE', 'PACK',
+                 'PACKAGE', 'PAINT', 'PAIR', 'PALACE', 'PALE', 'PAN', 'PANEL',
+                 'PANTS', 'PARK', 'PARTLY', 'PARTNER', 'PASSAGE', 'PASSENGER',
+                 'PATCH', 'PAUSE', 'PEAK', 'PEN', 'PENALTY', 'PENCIL',
+                 'PENSION', 'PERFORM', 'PERMIT', 'PET', 'PHASE', 'PHOTO',
+                 'PHRASE', 'PILE', 'PILOT', 'PIN', 'PIPE', 'PITCH', 'PLAIN',
+                 'PLANET', 'PLANT', 'PLATFORM', 'PLEASURE', 'PLENTY',
+                 'POCKET', 'POLE', 'POLISH', 'POOL', 'POP', 'PORT', 'PORTION',
+                 'POSE', 'POSSESS', 'POST', 'POT', 'POUR', 'POWDER', 'PRAISE',
+                 'PRAY', 'PRAYER', 'PREFER', 'PREGNANT', 'PRESENCE',
+                 'PRETEND', 'PREVENT', 'PRIEST', 'PRIME', 'PRINCESS', 'PRINT',
+                 'PRIOR', 'PRIZE', 'PROMISE', 'PROOF', 'PROPER', 'PROPERTY',
+                 'PUB', 'PUMP', 'PUNCH', 'PUPIL', 'PURE', 'QUARTER', 'QUIT',
+                 'QUOTE', 'RAIL', 'RAPID', 'RARE', 'RAW', 'RAY', 'REALIZE',
+                 'REAR', 'RECALL', 'RECEIPT', 'RECORD', 'RECOVER', 'REDUCE',
+                 'REFLECT', 'REFORM', 'REFUSE', 'REGARD', 'RELATE', 'RELEASE',
+                 'RELIEF', 'RELY', 'REMIND', 'REMOTE', 'REMOVE', 'RENT',
+                 'REPAIR', 'REPEAT', 'REPLACE', 'REPLY', 'RESCUE', 'RESERVE',
+                 'RESIST', 'RESOURCE', 'RESPOND', 'REVEAL', 'REWARD', 'RICE',
+                 'RID', 'RING', 'RIOT', 'RISK', 'RIVAL', 'ROB', 'ROBOT',
+                 'ROLL', 'ROMANTIC', 'ROOT', 'ROPE', 'ROUGH', 'ROUND',
+                 'ROUTE', 'ROW', 'ROYAL', 'RUB', 'RUBBER', 'RUDE', 'RUIN',
+                 'RUSH', 'SAIL', 'SALARY', 'SALT', 'SAMPLE', 'SATISFY',
+                 'SAUCE', 'SCENE', 'SCHEME', 'SCREAM', 'SCREEN', 'SEARCH',
+                 'SEAT', 'SECRET', 'SECRETARY', 'SEED', 'SEEK', 'SEPARATE',
+                 'SEQUENCE', 'SERIES', 'SETTLE', 'SEVERE', 'SEX', 'SHADE',
+                 'SHALLOW', 'SHARP', 'SHEET', 'SHELF', 'SHELL', 'SHELTER',
+                 'SHIFT', 'SHINE', 'SHIRT', 'SHOCK', 'SHOE', 'SHOULDER',
+                 'SHOUT', 'SHUT', 'SHY', 'SIGHT', 'SIGNAL', 'SILENT', 'SILK',
+                 'SILLY', 'SKILL', 'SKIRT', 'SLICE', 'SLIDE', 'SLIGHT',
+                 'SLIP', 'SMART', 'SMELL', 'SMOOTH', 'SOAP', 'SOCK', 'SOIL',
+                 'SOLID', 'SOLVE', 'SORE', 'SOUP', 'SPEED', 'SPELL', 'SPIN',
+                 'SPLIT', 'SPOIL', 'SPOT', 'SPREAD', 'STABLE', 'STAFF',
+                 'STAIR', 'STAMP', 'STANDARD', 'STARE', 'STEADY', 'STEAM',
+                 'STEEL', 'STEEP', 'STICK', 'STIFF', 'STOMACH', 'STOVE',
+                 'STRAIGHT', 'STREAM', 'STRENGTH', 'STRESS', 'STRETCH',
+                 'STRING', 'STRIP', 'STUFF', 'STUPID', 'SUGAR', 'SUIT', 'SUM',
+                 'SUPER', 'SUPPLY', 'SURPRISE', 'SURROUND', 'SURVIVE',
+                 'SUSPECT', 'SWALLOW', 'SWEAT', 'SWEEP', 'SWING', 'SWITCH',
+                 'SYMBOL', 'TAIL', 'TALL', 'TANK', 'TAPE', 'TARGET', 'TASK',
+                 'TASTE', 'TECHNIQUE', 'TEETH', 'TEMPLE', 'TEND', 'TENT',
+                 'TERRITORY', 'THEATER', 'THEME', 'THEORY', 'THIEF', 'THREAT',
+                 'THROAT', 'THUMB', 'TICKET', 'TIE', 'TIGHT', 'TIP', 'TITLE',
+                 'TOE', 'TONE', 'TONGUE', 'TOOL', 'TOOTH', 'TOPIC', 'TOSS',
+                 'TOUGH', 'TOUR', 'TOURIST', 'TOWER', 'TOY', 'TRACK',
+                 'TRADITION', 'TRAFFIC', 'TRAIL', 'TRANSFER', 'TRAP', 'TREAT',
+                 'TREATY', 'TRIAL', 'TRICK', 'TRIP', 'TROOP', 'TUBE', 'TUNE',
+                 'TUNNEL', 'TWIN', 'TWIST', 'UNIT', 'UNKNOWN', 'UPPER',
+                 'UPSET', 'URBAN', 'URGE', 'VACATION', 'VAST', 'VEHICLE',
+                 'VERSION', 'VICTIM', 'VIOLENCE', 'VIRUS', 'VISIBLE',
+                 'VISION', 'VISIT', 'VISITOR', 'VITAL', 'VOLUME', 'VOTE',
+                 'WAGE', 'WAIST', 'WANDER', 'WARN', 'WEDDING', 'WEIGH',
+                 'WEIGHT', 'WELCOME', 'WHEEL', 'WHISPER', 'WIDOW', 'WILLING',
+                 'WING', 'WINNER', 'WITNESS', 'WOODEN', 'WOOL', 'WOUND',
+                 'WRAP', 'WRIST', 'YARD', 'YELL', 'YIELD', 'ZONE']
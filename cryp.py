@@ -3,8 +3,8 @@ from one_word_interface import OneWordWindow
 from puzzle_letter_field import PuzzleLetterField
 from enter_ciphertext_window import EnterCiphertextWindow
 from word_mapping_group import WordMappingGroup
-from alphabet_mapping import AlphabetMapping
-from cryp_constants import CrypConstants
+from one_word_solver import OneWordSolver
+from bitmask_alphabet_mapping import BitmaskAlphabetMapping
 from tkinter import messagebox
 
 class Cryp(tk.Tk):
@@ -127,7 +127,8 @@ class Cryp(tk.Tk):
 
         # Now take a guess at some of the solution by assuming
         # that some of the words are in our dictionary.
-        alphabet_map = AlphabetMapping(like_exclusion)
+        alphabet_map = BitmaskAlphabetMapping(like_exclusion,
+                BitmaskAlphabetMapping.SETS, OneWordSolver.alphabet())
         self.guess_by_the_map(alphabet_map)
 
         # Fill in the frequency reports.
@@ -144,7 +145,7 @@ class Cryp(tk.Tk):
         """ Given the alphabet map, guess the puzzle's plaintext. """
         initial_mapping = WordMappingGroup(
             self.ciphertext_message, alphabet_map)
-        for ciphertext_letter in CrypConstants.LETTERS:
+        for ciphertext_letter in alphabet_map.alphabet().letters():
             plaintext_letter = initial_mapping.translate(ciphertext_letter)
             if len(plaintext_letter) == 1:
                 self.map(ciphertext_letter, plaintext_letter)
@@ -154,17 +155,18 @@ class Cryp(tk.Tk):
             an alphabetical frequency survey and another user-friendly
             string with the survey in order of frequency. """
         # First run the survey.
+        letters = OneWordSolver.alphabet().letters()
         freq_dict = {}
-        for letter in CrypConstants.LETTERS:
+        for letter in letters:
             freq_dict[letter] = 0
         for letter in message:
-            if letter.isalpha():
+            if letter in freq_dict:
                 freq_dict[letter] = freq_dict[letter] + 1
 
         # Now generate an alphabetical report.
-        alpha_report = 'A:'
-        for letter in CrypConstants.LETTERS:
-            if letter != 'A':
+        alpha_report = letters[0] + ':'
+        for letter in letters:
+            if letter != letters[0]:
                 alpha_report = alpha_report + ", " + letter + ":"
             alpha_report = alpha_report + str(freq_dict[letter])
 
@@ -387,7 +389,7 @@ class Cryp(tk.Tk):
         if len(plaintext_at_this_point) < 1:
             return ""
         plaintext_at_this_point = plaintext_at_this_point[0]
-        if plaintext_at_this_point < 'A' or plaintext_at_this_point > 'Z':
+        if not OneWordSolver.alphabet().contains(plaintext_at_this_point):
             return ""
         if plaintext_at_this_point in plaintext_so_far:
             return ""
@@ -418,7 +420,8 @@ class Cryp(tk.Tk):
         except:
             return
         # Also build an alphabet map based on what we've got.
-        alphabet_map = AlphabetMapping(False)
+        alphabet_map = BitmaskAlphabetMapping(False,
+                BitmaskAlphabetMapping.SETS, OneWordSolver.alphabet())
 
         # We need to scan the puzzle for all letters filled
         # in and narrow down our alphabet map accordingly.
@@ -8,3 +8,63 @@ class CrypConstants:
 
     # This constant is the alphabet. (Did I really need to explain that?)
     LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+    # But puzzles can be in other languages too (see Alphabet), as long
+    # as there's a dictionary for the language, built with its alphabet.
+    # (Mappings keep each letter's translations in 32 bits, so Alphabet
+    # won't take one with more letters than that.)
+    ALPHABETS = {'English': LETTERS,
+                 'Spanish': 'ABCDEFGHIJKLMNÑOPQRSTUVWXYZ',
+                 'German': LETTERS + 'ÄÖÜß'}
+
+    # The language of the alphabet to use unless we're told otherwise.
+    LANGUAGE = 'English'
+
+    # The directory for the compiled, memory-mapped form of the word pattern
+    # dictionary, with one shard per word length. (It gets built from
+    # word_patterns.py the first time it's needed.)
+    PATTERN_INDEX_DIRECTORY = 'word_patterns_index'
+
+    # How many words' pattern keys to remember. (Puzzles
+    # repeat words a lot, but not THAT many different ones.)
+    PATTERN_CACHE_SIZE = 4096
+
+    # Roughly how many times the commonest English word (THE) turns up in
+    # a million words of text. We use it, and the ranks of the words in
+    # common_words.py, to estimate how common a word is when the word list
+    # we built the dictionary from doesn't tell us (see WordFrequency).
+    TOP_WORD_FREQUENCY = 60000
+
+    # How many times to try taking a run of words in a puzzle to be a
+    # stock phrase (see PhraseDictionary) before giving up on phrases.
+    PHRASE_ATTEMPTS = 40
+
+    # When searching a puzzle exhaustively for complete keys (see
+    # WordMappingGroup.search), the most candidate words to try and the
+    # most seconds to spend before giving up on finding any more.
+    SEARCH_NODE_LIMIT = 100000
+    SEARCH_TIME_LIMIT = 30
+
+    # The apostrophe suffixes that can go on the end of any dictionary
+    # word (see SuffixDictionary), each with the weight by which to
+    # multiply the word's frequency for the suffixed form. (N'T, 'RE,
+    # 'VE and 'M only go with a handful of words, which the dictionary
+    # lists already, so they're not here.)
+    CONTRACTION_SUFFIXES = {'\'S': 0.5, 'S\'': 0.2, '\'LL': 0.02, '\'D': 0.02}
+
+    # The solver only puts those suffixes on dictionary words for a
+    # pattern that the dictionary has fewer words than this for itself.
+    # Otherwise a possessive fits any noun of the right length, and a
+    # listed word like WORLD'S, which does a lot to pin down its letters,
+    # gets lost among them and stops telling the solver much of anything.
+    SUFFIX_FALLBACK_SIZE = 2
+
+    # How many query results to add to the one-word window's list at a
+    # time. (Listing them in batches keeps the window responsive.)
+    QUERY_BATCH_SIZE = 200
+
+    # The most letters to look at together when an alphabet mapping
+    # looks for a group of letters that have only as many translations
+    # between them as there are letters in the group (see
+    # BitmaskAlphabetMapping). Bigger groups are rare and slow to find.
+    LARGEST_SET = 4
@@ -0,0 +1,292 @@
+from array import array
+from alphabet import Alphabet
+from pattern_encoder import PatternEncoder
+from positional_index import PositionalIndex
+from candidate_view import CandidateView
+from word_frequency import WordFrequency
+
+class DawgDictionary():
+    """ The word dictionary stored as a DAWG (a directed acyclic word graph,
+        i.e. a trie in which identical subtrees are stored only once), as an
+        alternative to the pattern index. Instead of looking up a bucket, we
+        answer a pattern query by walking the graph, enforcing the pattern's
+        repeated letters on the way down, so we never enter a subtree that
+        can't hold an answer. It can also take fixed letters at any position
+        ("5 letters, pattern X, with E in position 2") at no extra cost. """
+
+    # No word in any sensible dictionary is longer than this, and it
+    # lets us keep each node's possible word lengths in 64 bits.
+    MAXIMUM_LENGTH = 63
+
+    def __init__(self, words, alphabet=None):
+        """ Build the graph from an iterable of (word, frequency) pairs
+            in a given alphabet (or the default one). """
+        self._alphabet = alphabet or Alphabet.default()
+        frequencies = {}
+        for word, frequency in words:
+            word = Alphabet.upper(word)
+            if 0 < len(word) <= self.MAXIMUM_LENGTH:
+                frequencies[word] = max(frequency, frequencies.get(word, 0))
+        sorted_words = sorted(frequencies)
+        self._build(sorted_words)
+        # Since the graph numbers the words in alphabetical order, we
+        # can keep the frequencies in a plain array in that same order.
+        self._frequencies = array('I',
+                (frequencies[word] for word in sorted_words))
+        self._results = {}
+        self._keys = {}
+
+    def _build(self, sorted_words):
+        """ Build the graph from an alphabetical list of words with the
+            incremental algorithm of Daciuk et al., which merges identical
+            subtrees as it goes rather than building the whole trie first.
+            Then flatten the graph into arrays. """
+        root = _BuildNode()
+        # (The path of the previous word that might still be merged.)
+        unchecked = []
+        register = {}
+        previous = ''
+
+        def minimize(down_to):
+            while len(unchecked) > down_to:
+                parent, letter, child = unchecked.pop()
+                signature = child.signature()
+                if signature in register:
+                    parent.edges[letter] = register[signature]
+                else:
+                    register[signature] = child
+
+        for word in sorted_words:
+            common = 0
+            while common < min(len(word), len(previous)) and \
+                    word[common] == previous[common]:
+                common += 1
+            minimize(common)
+            node = unchecked[-1][2] if unchecked else root
+            for letter in word[common:]:
+                child = _BuildNode()
+                node.edges[letter] = child
+                unchecked.append((node, letter, child))
+                node = child
+            node.final = True
+            previous = word
+        minimize(0)
+        self._flatten(root)
+
+    def _flatten(self, root):
+        """ Turn the graph of node objects into arrays. Node n's edges are
+            numbers edge_start[n] up to (but not including) edge_start[n+1];
+            each edge has a letter, a target node and the number of words
+            that come alphabetically before any word through that edge
+            (counting from the node), which numbers each word uniquely. """
+        numbers = {id(root): 0}
+        nodes = [root]
+        index = 0
+        while index < len(nodes):
+            for child in nodes[index].edges.values():
+                if id(child) not in numbers:
+                    numbers[id(child)] = len(nodes)
+                    nodes.append(child)
+            index += 1
+
+        # Work out, from the bottom up, how many words each node leads
+        # to and a bitset of the lengths of the rest of those words.
+        counts = [0] * len(nodes)
+        lengths = [0] * len(nodes)
+        for number in reversed(self._topological_order(nodes, numbers)):
+            node = nodes[number]
+            counts[number] = 1 if node.final else 0
+            lengths[number] = 1 if node.final else 0
+            for child in node.edges.values():
+                counts[number] += counts[numbers[id(child)]]
+                lengths[number] |= lengths[numbers[id(child)]] << 1
+
+        self._edge_start = array('I', [0])
+        self._edge_target = array('I')
+        self._edge_before = array('I')
+        letters = []
+        for node in nodes:
+            before = 1 if node.final else 0
+            for letter, child in node.edges.items():
+                letters.append(letter)
+                self._edge_target.append(numbers[id(child)])
+                self._edge_before.append(before)
+                before += counts[numbers[id(child)]]
+            self._edge_start.append(len(letters))
+        self._edge_letters = ''.join(letters)
+        self._final = bytearray(1 if node.final else 0 for node in nodes)
+        self._lengths = array('Q', lengths)
+
+    @staticmethod
+    def _topological_order(nodes, numbers):
+        """ Return the node numbers with every node before its children. """
+        order = []
+        visited = set()
+        for start in range(len(nodes)):
+            if start in visited:
+                continue
+            # (An iterative depth-first search, since
+            # recursion could go as deep as the longest word.)
+            stack = [(start, False)]
+            while stack:
+                number, finished = stack.pop()
+                if finished:
+                    order.append(number)
+                elif number not in visited:
+                    visited.add(number)
+                    stack.append((number, True))
+                    for child in nodes[number].edges.values():
+                        if numbers[id(child)] not in visited:
+                            stack.append((numbers[id(child)], False))
+        order.reverse()
+        return order
+
+    def query(self, key, fixed=None):
+        """ Iterate over (word, frequency) pairs for all the words that fit
+            a pattern key, in alphabetical order. "fixed" optionally maps
+            positions to strings of the letters allowed there. """
+        return self._descend(0, key, 0, 0, {}, set(), fixed or {}, [])
+
+    def _descend(self, node, key, depth, number, assigned, used, fixed, word):
+        """ Continue a query from a given node at a given depth, with
+            the pattern's letter numbers assigned so far. """
+        if depth == len(key):
+            if self._final[node]:
+                yield ''.join(word), self._frequencies[number]
+            return
+        remaining = len(key) - depth - 1
+        symbol = key[depth]
+        for edge in range(self._edge_start[node], self._edge_start[node + 1]):
+            letter = self._edge_letters[edge]
+            child = self._edge_target[edge]
+            # Skip the subtree if no word in it has the right length...
+            if not (self._lengths[child] >> remaining) & 1:
+                continue
+            # ...or if the letter breaks the pattern...
+            if symbol == PatternEncoder.APOSTROPHE:
+                if letter != '\'':
+                    continue
+            elif letter == '\'':
+                continue
+            elif symbol in assigned:
+                if assigned[symbol] != letter:
+                    continue
+            elif letter in used:
+                continue
+            # ...or isn't allowed at this position.
+            if depth in fixed and letter not in fixed[depth]:
+                continue
+            newly_assigned = symbol != PatternEncoder.APOSTROPHE and \
+                    symbol not in assigned
+            if newly_assigned:
+                assigned[symbol] = letter
+                used.add(letter)
+            word.append(letter)
+            yield from self._descend(child, key, depth + 1,
+                    number + self._edge_before[edge],
+                    assigned, used, fixed, word)
+            word.pop()
+            if newly_assigned:
+                del assigned[symbol]
+                used.discard(letter)
+
+    def candidates(self, key, limit=None):
+        """ Return a view (see CandidateView) of all the words that fit a
+            given pattern key, most frequent first, which is empty if none
+            do. If there's a limit, include only that many of the most
+            frequent words. """
+        return CandidateView.likeliest(self._result(key)[2], limit)
+
+    def frequencies(self, key, limit=None):
+        """ Return a list of the frequencies of the words that fit a given
+            pattern key, in the same order that candidates() returns. """
+        return list(self._result(key)[1][:limit])
+
+    def positional(self, key):
+        """ Return the positional letter index of
+            the words that fit a given pattern key. """
+        return self._result(key)[2]
+
+    def keys(self, length):
+        """ Return a sorted list of all the pattern keys for
+            words of a given length, working them out if we
+            haven't already (by visiting every such word). """
+        if length not in self._keys:
+            keys = set()
+            stack = [(0, '')]
+            while stack:
+                node, word = stack.pop()
+                if len(word) == length:
+                    if self._final[node]:
+                        keys.add(PatternEncoder.encode(word))
+                    continue
+                remaining = length - len(word) - 1
+                for edge in range(self._edge_start[node],
+                        self._edge_start[node + 1]):
+                    child = self._edge_target[edge]
+                    if (self._lengths[child] >> remaining) & 1:
+                        stack.append((child, word + self._edge_letters[edge]))
+            self._keys[length] = sorted(keys)
+        return self._keys[length]
+
+    def alphabet(self):
+        """ Return the alphabet the words are in. """
+        return self._alphabet
+
+    def lengths(self):
+        """ Return a sorted list of the lengths of the words. """
+        return [length for length in range(self.MAXIMUM_LENGTH + 1)
+                if (self._lengths[0] >> length) & 1]
+
+    def contains(self, word):
+        """ Return True if a word is in the dictionary, False if not,
+            by following its letters down the graph. """
+        node = 0
+        for letter in Alphabet.upper(word):
+            for edge in range(self._edge_start[node],
+                    self._edge_start[node + 1]):
+                if self._edge_letters[edge] == letter:
+                    node = self._edge_target[edge]
+                    break
+            else:
+                return False
+        return bool(self._final[node])
+
+    def close(self):
+        """ There's nothing to release; the graph is all in memory. """
+
+    def _result(self, key):
+        """ Return a tuple of the words that fit a given pattern key (most
+            frequent first), a tuple of their frequencies and their
+            positional index, running the query if we haven't already. """
+        if key not in self._results:
+            ranked = sorted(self.query(key),
+                    key=lambda pair: (-pair[1], pair[0]))
+            words = tuple(word for word, frequency in ranked)
+            self._results[key] = (words,
+                    tuple(frequency for word, frequency in ranked),
+                    PositionalIndex(words, self._alphabet))
+        return self._results[key]
+
+    @staticmethod
+    def from_patterns(patterns, alphabet=None):
+        """ Build a DAWG from a dictionary in the form of
+            word_patterns.allPatterns, estimating frequencies. """
+        return DawgDictionary(((word, WordFrequency.estimate(word))
+                for words in patterns.values() for word in words), alphabet)
+
+class _BuildNode():
+    """ A node of the graph while we're still building it. """
+
+    __slots__ = ('edges', 'final')
+
+    def __init__(self):
+        self.edges = {}
+        self.final = False
+
+    def signature(self):
+        """ Return something that's equal for two nodes exactly when their
+            subtrees are identical. (The children must already be merged,
+            so that identical children are the very same objects.) """
+        return (self.final, tuple((letter, id(child))
+                for letter, child in self.edges.items()))
@@ -0,0 +1,174 @@
+import bisect
+from alphabet import Alphabet
+from pattern_encoder import PatternEncoder
+from candidate_view import CandidateView
+from word_frequency import WordFrequency
+
+class EditableDictionary():
+    """ A dictionary that words can be added to and removed from while the
+        program runs (say, when the user notices a word is missing), on
+        top of a dictionary that can't change, like ShardedPatternIndex.
+        Buckets nobody has changed are passed straight through. The first
+        change to a bucket copies that one bucket; after that, adding or
+        removing a word updates the bucket, its frequency ranking and its
+        positional index in place. Either way an edit takes time in
+        proportion to the word's bucket (inserting into its lists and
+        shifting its bitsets), never to the whole dictionary.
+
+        Anything that remembers what it looked up (merged layers, say,
+        or candidate views) should register a listener, which gets
+        called with the pattern key of every bucket that changes. """
+
+    def __init__(self, dictionary):
+        """ Start with a dictionary (anything with candidates(),
+            frequencies() and positional() methods) and no changes. """
+        self._dictionary = dictionary
+        # For each changed bucket, by pattern key: its positional index
+        # (which holds its words), their frequencies and the words'
+        # places in the ranking, as (negative frequency, word) pairs.
+        self._buckets = {}
+        self._added = set()
+        self._removed = set()
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """ Have a function called with the pattern key
+            of each bucket that changes from now on. """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """ Stop calling a function that add_listener() registered. """
+        self._listeners.remove(listener)
+
+    def add_word(self, word, frequency=None):
+        """ Add a word to the dictionary, with a given frequency (which
+            is estimated if there isn't one). If the word is already in
+            the dictionary, this just changes its frequency. """
+        word = Alphabet.upper(word)
+        if not self.alphabet().is_word(word):
+            raise ValueError('"' + word + '" is not a word.')
+        if frequency is None:
+            frequency = WordFrequency.estimate(word)
+        key = PatternEncoder.key(word)
+        positional, frequencies, ranks = self._bucket(key)
+        if self._word_mask(positional, word):
+            self._take_out(key, word)
+        number = bisect.bisect_left(ranks, (-frequency, word))
+        ranks.insert(number, (-frequency, word))
+        frequencies.insert(number, frequency)
+        positional.insert(number, word)
+        self._added.add(word)
+        self._removed.discard(word)
+        self._changed(key)
+
+    def remove_word(self, word):
+        """ Remove a word from the dictionary. Return True if it was
+            there, False if it wasn't (in which case nothing changes). """
+        word = Alphabet.upper(word)
+        key = PatternEncoder.key(word)
+        if not self.contains(word):
+            return False
+        self._bucket(key)
+        self._take_out(key, word)
+        self._added.discard(word)
+        self._removed.add(word)
+        self._changed(key)
+        return True
+
+    def candidates(self, key, limit=None):
+        """ Return a view (see CandidateView) of all the words that fit a
+            given pattern key, most frequent first, which is empty if none
+            do. If there's a limit, include only that many of the most
+            frequent words. """
+        if key not in self._buckets:
+            return self._dictionary.candidates(key, limit)
+        return CandidateView.likeliest(self._buckets[key][0], limit)
+
+    def frequencies(self, key, limit=None):
+        """ Return a list of the frequencies of the words that fit a given
+            pattern key, in the same order that candidates() returns. """
+        if key not in self._buckets:
+            return self._dictionary.frequencies(key, limit)
+        return self._buckets[key][1][:limit]
+
+    def positional(self, key):
+        """ Return the positional letter index of
+            the words that fit a given pattern key. """
+        if key not in self._buckets:
+            return self._dictionary.positional(key)
+        return self._buckets[key][0]
+
+    def keys(self, length):
+        """ Return a sorted list of all the pattern keys for words of a
+            given length, including buckets that changes have started and
+            leaving out buckets that changes have emptied. """
+        keys = set(self._dictionary.keys(length))
+        for key, (positional, frequencies, ranks) in self._buckets.items():
+            if len(key) == length:
+                if len(ranks) > 0:
+                    keys.add(key)
+                else:
+                    keys.discard(key)
+        return sorted(keys)
+
+    def alphabet(self):
+        """ Return the alphabet the words are in. """
+        return self._dictionary.alphabet()
+
+    def lengths(self):
+        """ Return a sorted list of the word lengths. """
+        lengths = set(self._dictionary.lengths())
+        for key, (positional, frequencies, ranks) in self._buckets.items():
+            if len(ranks) > 0:
+                lengths.add(len(key))
+        return sorted(lengths)
+
+    def contains(self, word):
+        """ Return True if a word is in the dictionary, False if not. """
+        word = Alphabet.upper(word)
+        if word in self._added:
+            return True
+        if word in self._removed:
+            return False
+        return self._dictionary.contains(word)
+
+    def close(self):
+        """ Close the dictionary underneath (and forget the changes). """
+        self._dictionary.close()
+        self._buckets = {}
+
+    def _bucket(self, key):
+        """ Return the changeable bucket for a pattern key, as a
+            (positional index, frequencies, ranks) triple, copying
+            it from the dictionary underneath if necessary. """
+        if key not in self._buckets:
+            positional = self._dictionary.positional(key).editable()
+            frequencies = list(self._dictionary.frequencies(key))
+            ranks = [(-frequency, positional.word(number))
+                    for number, frequency in enumerate(frequencies)]
+            self._buckets[key] = (positional, frequencies, ranks)
+        return self._buckets[key]
+
+    def _take_out(self, key, word):
+        """ Remove a word from its (changeable) bucket. """
+        positional, frequencies, ranks = self._buckets[key]
+        number = self._word_mask(positional, word).bit_length() - 1
+        del ranks[number]
+        del frequencies[number]
+        positional.remove(number)
+
+    @staticmethod
+    def _word_mask(positional, word):
+        """ Return the bitset of the words in a positional index that are
+            the given word (which, in a dictionary, is at most one). """
+        mask = positional.everything()
+        for position, letter in enumerate(word):
+            if not mask:
+                break
+            mask &= positional.matching(position, letter)
+        return mask
+
+    def _changed(self, key):
+        """ Tell the listeners that a bucket has changed. """
+        for listener in self._listeners:
+            listener(key)
@@ -1,5 +1,6 @@
 import tkSimpleDialog
 import tkinter as tk
+from alphabet import Alphabet
 from tkinter import messagebox
 from cryp_constants import CrypConstants
 
@@ -21,7 +22,7 @@ class EnterCiphertextWindow(tkSimpleDialog.Dialog):
     def apply(self):
         """ Close the window and return the ciphertext
             puzzle and the "like-exclusion" setting. """
-        self.result = self.puzzle.get(1.0, tk.END).upper()\
+        self.result = Alphabet.upper(self.puzzle.get(1.0, tk.END))\
             .replace('\n', ' ').replace('\t', ' '), self.like_exclusion.get()
 
     def validate(self):
@@ -0,0 +1,149 @@
+from alphabet import Alphabet
+from positional_index import PositionalIndex
+from candidate_view import CandidateView
+
+class LayeredDictionary():
+    """ Several pattern dictionaries stacked on top of each other (say, the
+        base dictionary, a list of names and a user's own list), merged
+        when a pattern is looked up rather than copied ahead of time. Each
+        layer has a weight by which its word frequencies get multiplied,
+        so a small list of names can still rank above the common words. """
+
+    def __init__(self, layers=()):
+        """ Start with a sequence of (dictionary, weight) pairs. A
+            dictionary is anything with candidates(), frequencies() and
+            positional() methods, like ShardedPatternIndex. """
+        self._layers = []
+        self._merged = {}
+        for dictionary, weight in layers:
+            self.add_layer(dictionary, weight)
+
+    def add_layer(self, dictionary, weight=1):
+        """ Stack another dictionary on top of the others. (It has to
+            be in the same alphabet as the others, or the words can't
+            be merged; see Alphabet.) """
+        if self._layers and dictionary.alphabet() is not self.alphabet():
+            raise ValueError('A ' + repr(dictionary.alphabet()) +
+                    ' dictionary cannot be layered on a ' +
+                    repr(self.alphabet()) + ' one.')
+        self._layers.append((dictionary, weight))
+        # Any merging we did before didn't know about the new layer.
+        self._merged = {}
+
+    def candidates(self, key, limit=None):
+        """ Return a view (see CandidateView) of all the words that fit a
+            given pattern key in any layer, most frequent (by weighted
+            frequency) first, which is empty if none do. If there's a
+            limit, include only that many of the most frequent words. """
+        layer = self._only_layer(key)
+        if layer is not None:
+            return layer.candidates(key, limit)
+        return CandidateView.likeliest(self._merge(key)[2], limit)
+
+    def frequencies(self, key, limit=None):
+        """ Return a list of the weighted frequencies of the words that fit
+            a given pattern key, in the same order that candidates() does. """
+        layer = self._only_layer(key)
+        if layer is not None:
+            weight = self._weight(layer)
+            return [round(frequency * weight)
+                    for frequency in layer.frequencies(key, limit)]
+        return list(self._merge(key)[1][:limit])
+
+    def positional(self, key):
+        """ Return the positional letter index of the words that fit a
+            given pattern key, in the same order that candidates() does. """
+        layer = self._only_layer(key)
+        if layer is not None:
+            return layer.positional(key)
+        return self._merge(key)[2]
+
+    def keys(self, length):
+        """ Return a sorted list of all the pattern keys
+            for words of a given length in any layer. """
+        keys = set()
+        for dictionary, weight in self._layers:
+            keys.update(dictionary.keys(length))
+        return sorted(keys)
+
+    def alphabet(self):
+        """ Return the alphabet the layers' words are in. """
+        if not self._layers:
+            return Alphabet.default()
+        return self._layers[0][0].alphabet()
+
+    def lengths(self):
+        """ Return a sorted list of the word lengths in any layer. """
+        lengths = set()
+        for dictionary, weight in self._layers:
+            lengths.update(dictionary.lengths())
+        return sorted(lengths)
+
+    def contains(self, word):
+        """ Return True if a word is in any layer, False if not. """
+        for dictionary, weight in self._layers:
+            if dictionary.contains(word):
+                return True
+        return False
+
+    def close(self):
+        """ Close every layer. """
+        for dictionary, weight in self._layers:
+            dictionary.close()
+
+    def invalidate(self, key):
+        """ Forget what we merged for a pattern key, because a layer's
+            bucket for it has changed (see EditableDictionary), and for
+            any keys whose words a layer makes from that bucket (see
+            SuffixDictionary.derives), and tell any layers that remember
+            things of their own. """
+        self._merged.pop(key, None)
+        for dictionary, weight in self._layers:
+            if hasattr(dictionary, 'derives'):
+                for merged_key in list(self._merged):
+                    if dictionary.derives(key, merged_key):
+                        del self._merged[merged_key]
+            if hasattr(dictionary, 'invalidate'):
+                dictionary.invalidate(key)
+
+    def _only_layer(self, key):
+        """ If exactly one layer has words for a given pattern key, return
+            that layer, since we can use its bucket as it is. (Its words
+            are already in order, and weighting them all by the same amount
+            doesn't change that.) Otherwise return None. """
+        if key in self._merged:
+            return None
+        found = None
+        for dictionary, weight in self._layers:
+            if len(dictionary.candidates(key, 1)) > 0:
+                if found is not None:
+                    return None
+                found = dictionary
+        return found
+
+    def _weight(self, layer):
+        """ Return the weight of a given layer. """
+        for dictionary, weight in self._layers:
+            if dictionary is layer:
+                return weight
+        return 1
+
+    def _merge(self, key):
+        """ Return a tuple of the words from all the layers that fit a
+            given pattern key, a tuple of their weighted frequencies and
+            their positional index, merging the layers if we haven't yet.
+            (A word in more than one layer gets its best frequency.) """
+        if key not in self._merged:
+            best = {}
+            for dictionary, weight in self._layers:
+                for word, frequency in zip(dictionary.candidates(key),
+                        dictionary.frequencies(key)):
+                    best[word] = max(round(frequency * weight),
+                            best.get(word, 0))
+            ranked = sorted(best.items(),
+                    key=lambda pair: (-pair[1], pair[0]))
+            words = tuple(word for word, frequency in ranked)
+            self._merged[key] = (words,
+                    tuple(frequency for word, frequency in ranked),
+                    PositionalIndex(words, self.alphabet()))
+        return self._merged[key]
@@ -1,4 +1,5 @@
 import tkinter as tk
+from alphabet import Alphabet
 
 class LetterField(tk.Entry):
     """ A tkinter Entry widget with functionality
@@ -15,7 +16,7 @@ class LetterField(tk.Entry):
     def enter_char(self, key):
         """ Enter the character the user entered
             at the exclusion of all else. """
-        entry = key.keysym
+        entry = LetterField.key_entry(key)
         if entry == 'BackSpace':
             self.delete(0, tk.END) # Throw out everything in the field.
             self.master.reverse_tab(self.letter_field_type,
@@ -41,7 +42,7 @@ class LetterField(tk.Entry):
             if entry == 'quoteright':
                 entry = '\''
             else:
-                entry = entry.upper()
+                entry = Alphabet.upper(entry)
             self.delete(0, tk.END) # Throw out everything in the field.
             self.insert(0, entry)
         else:
@@ -52,7 +53,7 @@ class LetterField(tk.Entry):
     def finish_char(self, key):
         """ Enter the character the user entered
             at the exclusion of all else. """
-        entry = key.keysym
+        entry = LetterField.key_entry(key)
         if LetterField.is_acceptable(entry):
             if entry == 'space':
                 self.delete(0, tk.END) # Throw out everything in the field.
@@ -63,7 +64,7 @@ class LetterField(tk.Entry):
                 if entry == 'quoteright':
                     entry = '\''
                 else:
-                    entry = entry.upper()
+                    entry = Alphabet.upper(entry)
                 self.delete(0, tk.END) # Throw out everything in the field.
                 self.insert(0, entry)
                 self.master.tab(self.letter_field_type, self.letter_field_index)
@@ -75,6 +76,14 @@ class LetterField(tk.Entry):
             self.insert(0, self.original_value)
         self.master.fill_in_search_field()
 
+    @staticmethod
+    def key_entry(key):
+        """ Return the name of the key the user pressed or, for a letter
+            whose key has a longer name (like "ntilde" for Ñ), the letter. """
+        if len(key.keysym) > 1 and len(key.char) == 1 and key.char.isalpha():
+            return key.char
+        return key.keysym
+
     @staticmethod
     def is_acceptable(entry):
         """ Determine if a character is allowed in the field. """
@@ -1,8 +1,9 @@
 import tkinter as tk
+from itertools import islice
 from tkinter import messagebox
 from letter_field import LetterField
 from one_word_solver import OneWordSolver
-from copy import copy
+from word_query import WordQuery
 from cryp_constants import CrypConstants
 
 class OneWordWindow(tk.Toplevel):
@@ -14,7 +15,7 @@ class OneWordWindow(tk.Toplevel):
         # Set the title of the main window.
         self.title('Solve one word')
         # Set the size of the main window.
-        self.geometry('450x350')
+        self.geometry('450x400')
 
         # Keep a reference to the master puzzle window.
         self.master = master
@@ -61,6 +62,20 @@ class OneWordWindow(tk.Toplevel):
         self.use_puzzle_control = tk.Checkbutton(self,
             text='Use Puzzle', variable=self.use_puzzle)
 
+        # Controls for a crossword-style query, like "?A??ER" or "UN*"
+        query_label = tk.Label(self, text = 'Query:')
+        self.query_value = tk.StringVar()
+        query_control = tk.Entry(self, textvariable=self.query_value)
+        query_control.bind('<Return>', lambda event : self.query())
+        self.no_repeats = tk.BooleanVar()
+        no_repeats_control = tk.Checkbutton(self,
+            text='No repeats', variable=self.no_repeats)
+        button_query = tk.Button(self, text = 'Query',
+            command=lambda : self.query())
+        # (Query results get listed a batch at a time; this tells
+        # us whether a batch belongs to the latest query.)
+        self.query_number = 0
+
         # Display for solutions
         scrollbar = tk.Scrollbar(self, orient="vertical")
         self.solutions = tk.Listbox(self, yscrollcommand=scrollbar.set)
@@ -94,6 +109,11 @@ class OneWordWindow(tk.Toplevel):
         self.total.grid(row=6, column=1,
                         columnspan = CrypConstants.MAXIMUM_WORD_SIZE)
 
+        query_label.grid(row=8, column=1, columnspan=2)
+        query_control.grid(row=8, column=3, columnspan=8, sticky='EW')
+        no_repeats_control.grid(row=8, column=11, columnspan=6)
+        button_query.grid(row=8, column=17, columnspan=4)
+
         # And we may want a "Select Word" button as well.
         self.button_select_word = tk.Button(self, text='Select word',
             command=lambda : self.select_word(None))
@@ -186,17 +206,18 @@ class OneWordWindow(tk.Toplevel):
         self.solutions.delete(0, tk.END)
         # (And therefore hide the Select Word button.)
         self.button_select_word.grid_forget()
+        # (And stop listing the results of any query.)
+        self.query_number += 1
+
+        # The solutions are a read-only view of the dictionary's words for
+        # this pattern (see CandidateView). Narrowing them down is just bit
+        # operations on the view, and we only list the words at the end.
+        solutions = OneWordSolver.solve_word(self.search_for_value)
+        positional = solutions.positional()
 
-        solutions = copy(OneWordSolver.solve_word(self.search_for_value))
-        
         # Remove all words that conflict with the known plaintext.
-        index = 0
-        while index < len(solutions):
-            if self.conflicts_with_plaintext(
-                    solutions[index], self.like_exclusion.get()):
-                del(solutions[index])
-            else:
-                index = index + 1
+        solutions = solutions.narrowed(self.plaintext_mask(
+                positional, self.like_exclusion.get()))
 
         # If the user checked the "Use Puzzle" option...
         if self.use_puzzle.get():
@@ -205,13 +226,10 @@ class OneWordWindow(tk.Toplevel):
             # corresponding ciphertext characters appear in THIS window.
             letters_to_exclude = self.master.known_plaintext\
                     (self.search_for_value)
-            index = 0
-            while index < len(solutions):
-                if self.have_common_characters(
-                        solutions[index], letters_to_exclude):
-                    del(solutions[index])
-                else:
-                    index = index + 1
+            if letters_to_exclude != '':
+                for index in range(len(self.search_for_value)):
+                    solutions = solutions.narrowed(~positional.matching(
+                            index, letters_to_exclude))
 
         for solution in solutions:
             self.solutions.insert(tk.END, solution)
@@ -222,18 +240,55 @@ class OneWordWindow(tk.Toplevel):
             total = str(len(solutions)) + ' solutions found'
         self.total.config(text = total)
 
-    def conflicts_with_plaintext(self, solution, like_exclusion):
-        """ If a word (a candidate solution) conflicts with the known
-            plaintext, return True; otherwise return False. """
-        for index in range(len(solution)):
+    def query(self):
+        """ List all the words that match the query. """
+        self.solutions.delete(0, tk.END)
+        self.button_select_word.grid_forget()
+        self.query_number += 1
+        try:
+            word_query = WordQuery(self.query_value.get(),
+                    self.no_repeats.get())
+        except ValueError as error:
+            messagebox.showwarning('Query', str(error), parent=self)
+            return
+
+        # Report the count right away; it doesn't need the words
+        # themselves. Then list the words a batch at a time, so the
+        # window stays responsive even if there are thousands.
+        count = word_query.count()
+        if count == 1:
+            total = '1 match found'
+        else:
+            total = str(count) + ' matches found'
+        self.total.config(text = total)
+        self.after_idle(self.list_query_results,
+                self.query_number, word_query.results())
+
+    def list_query_results(self, query_number, results):
+        """ List the next batch of a query's results, and schedule the
+            batch after that, unless another query has come along. """
+        if query_number != self.query_number:
+            return
+        batch = list(islice(results, CrypConstants.QUERY_BATCH_SIZE))
+        for word in batch:
+            self.solutions.insert(tk.END, word)
+        if len(batch) == CrypConstants.QUERY_BATCH_SIZE:
+            self.after(1, self.list_query_results, query_number, results)
+
+    def plaintext_mask(self, positional, like_exclusion):
+        """ Given the positional index of the candidate solutions,
+            return the bitset of those that don't conflict with the
+            known plaintext. """
+        mask = positional.everything()
+        for index in range(len(self.search_for_value)):
             if like_exclusion:
-                if solution[index] != '\'':
-                    if solution[index] == self.ciphertext_value[index].get():
-                        return True
+                ciphertext = self.ciphertext_value[index].get()
+                if ciphertext != '\'':
+                    mask &= ~positional.matching(index, ciphertext)
             if self.plaintext_value[index].get() != '':
-                if solution[index] != self.plaintext_value[index].get():
-                    return True
-        return False
+                mask &= positional.matching(
+                        index, self.plaintext_value[index].get())
+        return mask
 
     def clear(self):
         """ Clear all data. """
@@ -241,6 +296,7 @@ class OneWordWindow(tk.Toplevel):
             self.plaintext_control[i].delete(0, tk.END)
             self.ciphertext_control[i].delete(0, tk.END)
         self.search_for.config(text='')
+        self.query_number += 1
         self.solutions.delete(0, tk.END)
         self.total.config(text='')
         self.ciphertext_control[0].focus_set()
@@ -275,12 +331,3 @@ class OneWordWindow(tk.Toplevel):
         self.master.assign_one_word_plaintext(self.puzzle_row,
             self.puzzle_start_column, self.puzzle_cipherword, plaintext_word)
 
-    @staticmethod
-    def have_common_characters(string1, string2):
-        """ Determine whether two strings have
-            at least one common character. """
-        for char in string1:
-            if char in string2:
-                return True
-        return False
-
@@ -6,35 +6,209 @@
     https://creativecommons.org/licenses/by-nc-sa/3.0/us .
 """
 
-import word_patterns
+import os
+from sharded_pattern_index import ShardedPatternIndex
+from layered_dictionary import LayeredDictionary
+from shared_dictionary import SharedDictionary
+from suffix_dictionary import SuffixDictionary
+from editable_dictionary import EditableDictionary
+from phrase_dictionary import PhraseDictionary
+from word_membership import WordMembership
+from pattern_encoder import PatternEncoder
+from cryp_constants import CrypConstants
 
 class OneWordSolver():
     """ Solve a one-word cryptogram. """
 
+    # The pattern index, opened the first time anybody needs it.
+    # (Its shards are opened as words of each length come up.)
+    _index = None
+    # The part of it that words can be added to and removed from.
+    _edits = None
+    # The stock phrases, also loaded the first time anybody needs them.
+    _phrases = None
+
+    @staticmethod
+    def solve_word(word, limit=None):
+        """ Returns all plaintext translations for a ciphertext word, most
+            likely first (or only the "limit" likeliest, if given), as a
+            read-only CandidateView; call its copy() for a list to change """
+        word_pattern = OneWordSolver.get_pattern_key(word)
+        return OneWordSolver.pattern_index().candidates(word_pattern, limit)
+
+    @staticmethod
+    def solve_phrase(words):
+        """ Returns a list of the stock phrases (each a tuple of words)
+            that a run of ciphertext words might translate to, most
+            common first """
+        return OneWordSolver.phrase_dictionary().candidates(words)
+
+    @staticmethod
+    def phrase_dictionary():
+        """ Returns the dictionary of stock phrases (see PhraseDictionary),
+            loading it from stock_phrases.py if necessary """
+        if OneWordSolver._phrases is None:
+            import stock_phrases
+            OneWordSolver._phrases = PhraseDictionary(stock_phrases.allPhrases)
+        return OneWordSolver._phrases
+
+    @staticmethod
+    def word_frequencies(word, limit=None):
+        """ Returns the frequencies of the plaintext translations for
+            a ciphertext word, in the same order as solve_word """
+        word_pattern = OneWordSolver.get_pattern_key(word)
+        return OneWordSolver.pattern_index().frequencies(word_pattern, limit)
+
+    @staticmethod
+    def is_word(word):
+        """ Returns True if a (plaintext) word is in the dictionary """
+        return OneWordSolver.pattern_index().contains(word)
+
+    @staticmethod
+    def score_plaintext(text):
+        """ Returns how many of the words in a decoded piece of text are
+            in the dictionary, and how many words there are altogether """
+        dictionary = OneWordSolver.pattern_index()
+        words = WordMembership.words_in(text, dictionary.alphabet())
+        known = 0
+        for word in words:
+            if dictionary.contains(word):
+                known += 1
+        return known, len(words)
+
+    @staticmethod
+    def alphabet():
+        """ Returns the alphabet (see Alphabet) that the dictionary's
+            words, and so the plaintext of puzzles, are written in """
+        return OneWordSolver.pattern_index().alphabet()
+
+    @staticmethod
+    def positional_index(word):
+        """ Returns the positional letter index (see PositionalIndex)
+            of the plaintext translations for a ciphertext word, whose
+            bits are in the same order as solve_word """
+        word_pattern = OneWordSolver.get_pattern_key(word)
+        return OneWordSolver.pattern_index().positional(word_pattern)
+
+    @staticmethod
+    def pattern_index():
+        """ Return the pattern index, opening it if necessary. And if the
+            compiled index is missing, older than word_patterns.py or
+            common_words.py (which the frequencies come from) or in an
+            outdated format, (re)build it from word_patterns.py first.
+            (An install that ships only the compiled index, without
+            word_patterns.py, just uses the index it has.) """
+        if OneWordSolver._index is None:
+            directory = os.path.dirname(os.path.abspath(__file__))
+            index_path = os.path.join(directory,
+                    CrypConstants.PATTERN_INDEX_DIRECTORY)
+            manifest_path = ShardedPatternIndex.manifest_path(index_path)
+            source_path = os.path.join(directory, 'word_patterns.py')
+            frequency_path = os.path.join(directory, 'common_words.py')
+            if os.path.exists(manifest_path) and \
+                    (not os.path.exists(source_path) or
+                    os.path.getmtime(manifest_path) >=
+                    max(os.path.getmtime(source_path),
+                    os.path.getmtime(frequency_path))):
+                try:
+                    OneWordSolver._index = OneWordSolver._stack(
+                            ShardedPatternIndex(index_path))
+                    return OneWordSolver._index
+                except ValueError:
+                    pass
+            # This is the only time we pay for importing the big module.
+            import word_patterns
+            ShardedPatternIndex.compile(word_patterns.allPatterns, index_path)
+            OneWordSolver._index = OneWordSolver._stack(
+                    ShardedPatternIndex(index_path))
+        return OneWordSolver._index
+
     @staticmethod
-    def solve_word(word):
-        """ Prints all plaintext translations for a ciphertext word """
-        word_pattern = OneWordSolver.get_word_pattern(word)
-        try:
-            answers = word_patterns.allPatterns[word_pattern][:]
-        except:
-            answers = []
-        return answers
+    def load_index(directory):
+        """ Switch to a different dictionary, such as
+            one compiled by build_dictionary.py. """
+        OneWordSolver.use_dictionary(ShardedPatternIndex(directory))
+
+    @staticmethod
+    def attach_shared(name):
+        """ Switch to a dictionary that another process published in
+            shared memory (see SharedDictionary), so that this process
+            doesn't need a copy of its own. """
+        OneWordSolver.use_dictionary(SharedDictionary(name))
+
+    @staticmethod
+    def with_suffixes(dictionary):
+        """ Returns a dictionary that has all the words of the given one,
+            plus their possessives and contractions (see SuffixDictionary
+            and CrypConstants.CONTRACTION_SUFFIXES) for the patterns that
+            it has few words for (see CrypConstants.SUFFIX_FALLBACK_SIZE) """
+        return LayeredDictionary([(dictionary, 1), (SuffixDictionary(
+                dictionary, CrypConstants.CONTRACTION_SUFFIXES,
+                CrypConstants.SUFFIX_FALLBACK_SIZE), 1)])
+
+    @staticmethod
+    def _stack(dictionary):
+        """ Returns a dictionary as the solver uses it: editable (see
+            add_word) and with suffixes (see with_suffixes). It's always a
+            LayeredDictionary, so add_layer can stack more on top """
+        edits = EditableDictionary(dictionary)
+        index = OneWordSolver.with_suffixes(edits)
+        # The suffixed words and merged layers come from the editable
+        # buckets, so they have to be worked out again when one changes.
+        edits.add_listener(index.invalidate)
+        OneWordSolver._edits = edits
+        return index
+
+    @staticmethod
+    def use_dictionary(dictionary):
+        """ Switch to a different dictionary engine, such as a
+            DawgDictionary or a LayeredDictionary. It needs the same
+            candidates(), frequencies(), positional() and close()
+            methods as ShardedPatternIndex. """
+        if OneWordSolver._index is not None:
+            OneWordSolver._index.close()
+        OneWordSolver._index = OneWordSolver._stack(dictionary)
+
+    @staticmethod
+    def add_word(word, frequency=None):
+        """ Adds a word to the dictionary for the rest of the session (or
+            changes its frequency, if it's there already); the frequency
+            is estimated if not given. Raises ValueError for a non-word """
+        OneWordSolver.pattern_index()
+        OneWordSolver._edits.add_word(word, frequency)
+
+    @staticmethod
+    def remove_word(word):
+        """ Removes a word from the dictionary for the rest of the
+            session. Returns False if it wasn't there to begin with """
+        OneWordSolver.pattern_index()
+        return OneWordSolver._edits.remove_word(word)
+
+    @staticmethod
+    def add_listener(listener):
+        """ Has a function called with the pattern key of every bucket
+            that add_word or remove_word changes, so that anything that
+            remembers candidates can forget them. (Switching dictionaries
+            drops the listeners along with the old dictionary.) """
+        OneWordSolver.pattern_index()
+        OneWordSolver._edits.add_listener(listener)
+
+    @staticmethod
+    def add_layer(directory, weight=1):
+        """ Stack another dictionary (such as a list of names compiled by
+            build_dictionary.py) on top of the current one. Its words'
+            frequencies get multiplied by the weight when ranking. """
+        OneWordSolver.pattern_index().add_layer(
+                ShardedPatternIndex(directory), weight)
     
+    @staticmethod
+    def get_pattern_key(word):
+        """ Returns the compact pattern key of the given word, e.g.
+            bytes([0, 1, 2, 3, 4, 1, 2, 3, 5, 6]) for 'DUSTBUSTER' """
+        return PatternEncoder.key(word)
+
     @staticmethod
     def get_word_pattern(word):
         """ Returns a string of the pattern form of the given
             word, e.g. '0.1.2.3.4.1.2.3.5.6' for 'DUSTBUSTER' """
-        word = word.upper()
-        nextNum = 0
-        letterNums = {}
-        wordPattern = []
-
-        for letter in word:
-            if letter == '\'':
-                letterNums[letter] = '\''
-            elif letter not in letterNums:
-                letterNums[letter] = str(nextNum)
-                nextNum += 1
-            wordPattern.append(letterNums[letter])
-        return '.'.join(wordPattern)
+        return PatternEncoder.string_from_key(PatternEncoder.key(word))
@@ -0,0 +1,46 @@
+from functools import lru_cache
+from alphabet import Alphabet
+from cryp_constants import CrypConstants
+
+class PatternEncoder():
+    """ Turn words into compact pattern keys. A key is a bytes object with
+        one byte per character: the number of the letter in order of first
+        appearance, or APOSTROPHE for an apostrophe. So 'DUSTBUSTER' becomes
+        bytes([0, 1, 2, 3, 4, 1, 2, 3, 5, 6]). Keys are cheap to build, hash
+        and compare, and every key for a word of length n is n bytes long.
+        The older string form, e.g. '0.1.2.3.4.1.2.3.5.6', is still
+        available for anything that wants it. """
+
+    # The byte that stands for an apostrophe in a key.
+    APOSTROPHE = 255
+
+    @staticmethod
+    @lru_cache(maxsize=CrypConstants.PATTERN_CACHE_SIZE)
+    def key(word):
+        """ Return the pattern key of a word, remembering recent
+            answers because the same words come up again and again. """
+        return PatternEncoder.encode(word)
+
+    @staticmethod
+    def encode(word):
+        """ Return the pattern key of a word without caching it.
+            (This is for one-time jobs like building a dictionary.) """
+        letter_numbers = {'\'': PatternEncoder.APOSTROPHE}
+        key = bytearray()
+        for letter in Alphabet.upper(word):
+            if letter not in letter_numbers:
+                letter_numbers[letter] = len(letter_numbers) - 1
+            key.append(letter_numbers[letter])
+        return bytes(key)
+
+    @staticmethod
+    def key_from_string(pattern):
+        """ Convert a pattern string like '0.1.0' to a key. """
+        return bytes(PatternEncoder.APOSTROPHE if number == '\''
+                else int(number) for number in pattern.split('.'))
+
+    @staticmethod
+    def string_from_key(key):
+        """ Convert a key to a pattern string like '0.1.0'. """
+        return '.'.join('\'' if number == PatternEncoder.APOSTROPHE
+                else str(number) for number in key)
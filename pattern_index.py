@@ -0,0 +1,201 @@
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+from alphabet import Alphabet
+from positional_index import PositionalIndex
+from candidate_view import CandidateView
+
+class PatternIndex():
+    """ A compiled, memory-mapped version of the word pattern dictionary
+        for words of one length. Instead of importing a huge module full
+        of string literals, we open a binary file and look words up in
+        it only as they're needed. """
+
+    # The file layout is:
+    #   a header (magic number, version, number of patterns, key width
+    #       and the offset of the word area);
+    #   a pattern table of fixed-size records, sorted by pattern key,
+    #       each holding the key itself (see PatternEncoder) followed by
+    #       where to find its word block and how many words are in it;
+    #   and the word area, where each pattern's words are stored back to
+    #       back with a fixed stride (every word that fits a pattern has
+    #       the same length as the key, so the stride is the key width),
+    #       followed by a 32-bit frequency for each word. The words are
+    #       in descending order of frequency, so the likeliest come first.
+    #       Each character of a word is stored as its ordinal in the
+    #       index's alphabet (see Alphabet), one byte apiece.
+    MAGIC = b'CRYPIDX\x00'
+    VERSION = 4
+    HEADER = struct.Struct('<8sIIII')
+    BLOCK = struct.Struct('<II')
+    FREQUENCY = struct.Struct('<I')
+
+    def __init__(self, path, buffer=None, alphabet=None):
+        """ Open the index file and map it into memory. Or, if we're given
+            a buffer that holds an index (in shared memory, say), read the
+            index straight from that; then the path is only for messages.
+            The index must have been compiled with the same alphabet (by
+            default, the default one). """
+        self._alphabet = alphabet or Alphabet.default()
+        self._file = None
+        self._map = None
+        if buffer is None:
+            self._file = open(path, 'rb')
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                    access=mmap.ACCESS_READ)
+            buffer = self._map
+        self._buffer = memoryview(buffer)
+        magic, version, self._pattern_count, self._key_width, \
+                self._word_area = self.HEADER.unpack_from(self._buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(path + ' is not a compatible pattern index')
+        self._record_size = self._key_width + self.BLOCK.size
+        # Remember the lookups we've already done, but only those; we
+        # never build a dictionary of the whole file.
+        self._lookups = {}
+        self._positional = {}
+
+    def candidates(self, key, limit=None):
+        """ Return a view (see CandidateView) of all the words that fit a
+            given pattern key, most frequent first, which is empty if none
+            do. If there's a limit, include only that many of the most
+            frequent words. """
+        return CandidateView.likeliest(self.positional(key), limit)
+
+    def frequencies(self, key, limit=None):
+        """ Return a list of the frequencies of the words that fit a given
+            pattern key, in the same order that candidates() returns. """
+        return list(self._lookup(key)[1][:limit])
+
+    def positional(self, key):
+        """ Return the positional letter index of the words that
+            fit a given pattern key, building it if necessary. """
+        if key not in self._positional:
+            self._positional[key] = PositionalIndex(self._lookup(key)[0],
+                    self._alphabet)
+        return self._positional[key]
+
+    def keys(self):
+        """ Iterate over all the pattern keys in the index, in order. """
+        for number in range(self._pattern_count):
+            record_offset = self.HEADER.size + number * self._record_size
+            yield self._buffer[record_offset:
+                    record_offset + self._key_width].tobytes()
+
+    def _lookup(self, key):
+        """ Return a sequence of the words that fit a given pattern key
+            and a tuple of their frequencies, looking them up if we
+            haven't already. """
+        if key not in self._lookups:
+            self._lookups[key] = self._find(key)
+        return self._lookups[key]
+
+    def _find(self, key):
+        """ Binary-search the pattern table for a key and return a sequence
+            of its words and a tuple of their frequencies (both of which
+            may be empty). The words are read from the buffer as they're
+            needed rather than copied out of it all at once. """
+        low = 0
+        high = self._pattern_count
+        while low < high:
+            middle = (low + high) // 2
+            record_offset = self.HEADER.size + middle * self._record_size
+            middle_key = self._buffer[record_offset:
+                    record_offset + self._key_width].tobytes()
+            if middle_key < key:
+                low = middle + 1
+            elif middle_key > key:
+                high = middle
+            else:
+                block_offset, word_count = self.BLOCK.unpack_from(
+                        self._buffer, record_offset + self._key_width)
+                stride = self._key_width
+                words = _BucketWords(self._buffer, block_offset,
+                        word_count, stride, self._alphabet)
+                frequencies = struct.unpack_from('<%dI' % word_count,
+                        self._buffer, block_offset + word_count * stride)
+                return words, frequencies
+        return (), ()
+
+    def close(self):
+        """ Release the memory map and the file (if we opened them). """
+        self._lookups = {}
+        self._positional = {}
+        self._buffer.release()
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+
+    @staticmethod
+    def compile(patterns, path, alphabet=None):
+        """ Write an index file for a dictionary that maps each pattern key
+            to a list of (word, frequency) pairs for the words that fit it.
+            All the keys must be the same length (i.e. all the words must
+            be), and the words must be in the alphabet (by default, the
+            default one). The pairs can be in any order; we'll rank them
+            here. """
+        alphabet = alphabet or Alphabet.default()
+        keys = sorted(patterns)
+        ranked = {}
+        for key in keys:
+            ranked[key] = sorted(patterns[key],
+                    key=lambda pair: (-pair[1], pair[0]))
+        key_width = len(keys[0]) if keys else 0
+        word_area = PatternIndex.HEADER.size + \
+                len(keys) * (key_width + PatternIndex.BLOCK.size)
+
+        records = []
+        block_offset = word_area
+        for key in keys:
+            records.append(key + PatternIndex.BLOCK.pack(
+                    block_offset, len(ranked[key])))
+            block_offset += len(ranked[key]) * \
+                    (key_width + PatternIndex.FREQUENCY.size)
+
+        # Write to a temporary file first so that nobody
+        # ever opens a half-written index.
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'wb') as index_file:
+            index_file.write(PatternIndex.HEADER.pack(PatternIndex.MAGIC,
+                    PatternIndex.VERSION, len(keys), key_width, word_area))
+            index_file.write(b''.join(records))
+            for key in keys:
+                index_file.write(alphabet.encode(''.join(word
+                        for word, frequency in ranked[key])))
+                index_file.write(b''.join(PatternIndex.FREQUENCY.pack(
+                        frequency) for word, frequency in ranked[key]))
+        os.replace(temporary_path, path)
+
+class _BucketWords(Sequence):
+    """ The words of one pattern's block, decoded from the
+        index's buffer one at a time as they're asked for. """
+
+    def __init__(self, buffer, offset, count, stride, alphabet):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._stride = stride
+        self._alphabet = alphabet
+
+    def ordinals(self, position):
+        """ Return the ordinals of the letters that the words have in a
+            given position, as bytes, read with one strided slice of the
+            buffer. """
+        start = self._offset + position
+        return self._buffer[start:self._offset + self._count * self._stride:
+                self._stride].tobytes()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[number]
+                    for number in range(*index.indices(self._count)))
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError('word index out of range')
+        start = self._offset + index * self._stride
+        return self._alphabet.decode(self._buffer[start:start + self._stride])
@@ -0,0 +1,52 @@
+from pattern_encoder import PatternEncoder
+
+class PhraseDictionary():
+    """ A dictionary of stock phrases ("OF THE", "THERE IS A"), keyed by
+        the pattern of the whole phrase rather than of each word. Letters
+        shared between the words count, so a run of ciphertext words has
+        to repeat letters across words just as the phrase does, which
+        makes a phrase's pattern far more selective than its words'. """
+
+    def __init__(self, phrases):
+        """ Build the dictionary from a sequence of phrases (strings of
+            words separated by spaces), most common first. """
+        self._phrases = {}
+        self._longest = 0
+        for phrase in phrases:
+            words = tuple(phrase.upper().split())
+            if len(words) < 2:
+                continue
+            self._phrases.setdefault(PhraseDictionary.key(words),
+                    []).append(words)
+            self._longest = max(self._longest, len(words))
+
+    def candidates(self, words):
+        """ Return a list of the phrases (each a tuple of words) that a
+            run of ciphertext words might translate to, most common
+            first, which is empty if none fit. """
+        return list(self._phrases.get(PhraseDictionary.key(words), ()))
+
+    def longest(self):
+        """ Return the number of words in the longest phrase. """
+        return self._longest
+
+    @staticmethod
+    def selective(words):
+        """ Return True if some letter turns up in more than one of the
+            words of a phrase (or a run of ciphertext words), which is
+            what makes a phrase's pattern more selective than its words'
+            patterns taken one at a time. """
+        seen = set()
+        for word in words:
+            letters = set(word) - {'\''}
+            if not seen.isdisjoint(letters):
+                return True
+            seen |= letters
+        return False
+
+    @staticmethod
+    def key(words):
+        """ Return the pattern key of a run of words taken together. (The
+            space between words gets a number of its own, just as if it
+            were a letter, so words of different lengths never mix.) """
+        return PatternEncoder.encode(' '.join(words))
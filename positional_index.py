@@ -0,0 +1,175 @@
+from alphabet import Alphabet
+
+class PositionalIndex():
+    """ An index of one pattern bucket's words by letter and position.
+        For each position, there's a list of bitsets (Python ints) indexed
+        by letter ordinal (see Alphabet), in which bit n is set if word n
+        of the bucket has that letter in that position. So a question like
+        "which words have E or A in position 2?" is just an OR of two ints,
+        and combining conditions on several positions is just an AND. """
+
+    def __init__(self, words, alphabet=None):
+        """ Set up the index for a sequence of words of equal length in a
+            given alphabet (or the default one). (The bitsets for each
+            position get built the first time they're needed; plenty of
+            buckets are only ever listed, never filtered.) """
+        self._words = words
+        self._alphabet = alphabet or Alphabet.default()
+        self._everything = (1 << len(words)) - 1
+        self._bitsets = []
+        # (For each position whose bitsets we've built, the mask of the
+        # ordinals of the letters that some word has there.)
+        self._present = []
+        if len(words) > 0:
+            self._bitsets = [None] * len(words[0])
+            self._present = [0] * len(words[0])
+
+    def alphabet(self):
+        """ Return the alphabet of the words. """
+        return self._alphabet
+
+    def everything(self):
+        """ Return the bitset of all the words in the bucket. """
+        return self._everything
+
+    def width(self):
+        """ Return the length of the words in the bucket. """
+        return len(self._bitsets)
+
+    def word(self, number):
+        """ Return word number "number" of the bucket. """
+        return self._words[number]
+
+    def _position(self, position):
+        """ Return the bitsets for a given position, by letter ordinal,
+            building them if we haven't already. """
+        if self._bitsets[position] is None:
+            # (We set the bits in byte arrays and convert them to ints
+            # at the end; OR-ing bits into big ints one at a time would
+            # take time proportional to the square of the bucket size.)
+            # (Some word sequences can hand us a whole column of letter
+            # ordinals at once, which beats going word by word.)
+            if hasattr(self._words, 'ordinals'):
+                column = self._words.ordinals(position)
+            else:
+                column = self._alphabet.encode(''.join(word[position]
+                        for word in self._words))
+            bits = [None] * (self._alphabet.size() + 1)
+            for number, ordinal in enumerate(column):
+                if bits[ordinal] is None:
+                    bits[ordinal] = bytearray(len(self._words) // 8 + 1)
+                bits[ordinal][number >> 3] |= 1 << (number & 7)
+            present = 0
+            for ordinal, array in enumerate(bits):
+                if array is None:
+                    bits[ordinal] = 0
+                else:
+                    bits[ordinal] = int.from_bytes(array, 'little')
+                    present |= 1 << ordinal
+            self._bitsets[position] = bits
+            self._present[position] = present
+        return self._bitsets[position]
+
+    def _present_at(self, position):
+        """ Return the mask of the ordinals of the letters
+            that some word has in a given position. """
+        self._position(position)
+        return self._present[position]
+
+    def matching(self, position, letters):
+        """ Return the bitset of the words that have
+            one of the given letters in a given position. """
+        return self.matching_mask(position, self._alphabet.mask_of(letters))
+
+    def matching_mask(self, position, mask):
+        """ Do the same as matching, but with the letters given as a mask
+            of their ordinals' bits (as an alphabet mapping keeps them). """
+        bitsets = self._position(position)
+        present = self._present_at(position)
+        wanted = mask & present
+        if wanted == present:
+            return self._everything
+        # (If most letters are allowed, it's quicker
+        # to subtract the ones that aren't.)
+        if 2 * wanted.bit_count() > present.bit_count():
+            result = self._everything
+            for ordinal in Alphabet.ordinals_of(present & ~mask):
+                result &= ~bitsets[ordinal]
+            return result
+        result = 0
+        for ordinal in Alphabet.ordinals_of(wanted):
+            result |= bitsets[ordinal]
+        return result
+
+    def letters_at(self, position, mask):
+        """ Return a string of all the letters that appear in a given
+            position in at least one of the words in a bitset. """
+        bitsets = self._position(position)
+        return ''.join(self._alphabet.letter(ordinal) for ordinal
+                in Alphabet.ordinals_of(self._present_at(position))
+                if bitsets[ordinal] & mask)
+
+    def words(self, mask):
+        """ Return a list of the words in a bitset, in bucket order. """
+        result = []
+        while mask:
+            lowest = mask & -mask
+            result.append(self._words[lowest.bit_length() - 1])
+            mask ^= lowest
+        return result
+
+    def editable(self):
+        """ Return a copy of the index that insert() and remove() can
+            change without changing this one. (It starts with whatever
+            bitsets we've already built, rather than building them over.) """
+        index = PositionalIndex(list(self._words), self._alphabet)
+        index._bitsets = [None if bitsets is None else list(bitsets)
+                for bitsets in self._bitsets]
+        index._present = list(self._present)
+        return index
+
+    def insert(self, number, word):
+        """ Put a word into the bucket as word number "number", moving
+            the words from there on up by one. The bitsets are shifted
+            rather than rebuilt, one shift for each of the word's positions
+            and the letters seen there, but each shift still goes through
+            a whole bitset, so this takes time in proportion to the
+            bucket. (Only for an index from editable(); any view of the
+            index from before the change is out of date after it.) """
+        if len(self._words) == 0:
+            self._bitsets = [None] * len(word)
+            self._present = [0] * len(word)
+        self._words.insert(number, word)
+        self._everything = (1 << len(self._words)) - 1
+        low = (1 << number) - 1
+        for position, bitsets in enumerate(self._bitsets):
+            if bitsets is None:
+                continue
+            for ordinal in Alphabet.ordinals_of(self._present[position]):
+                bitset = bitsets[ordinal]
+                bitsets[ordinal] = (bitset & low) | \
+                        ((bitset >> number) << (number + 1))
+            ordinal = self._alphabet.ordinal(word[position])
+            bitsets[ordinal] |= 1 << number
+            self._present[position] |= 1 << ordinal
+
+    def remove(self, number):
+        """ Take word number "number" out of the bucket, moving the words
+            after it down by one, the same way that insert() does. """
+        del self._words[number]
+        self._everything = (1 << len(self._words)) - 1
+        low = (1 << number) - 1
+        for position, bitsets in enumerate(self._bitsets):
+            if bitsets is None:
+                continue
+            for ordinal in Alphabet.ordinals_of(self._present[position]):
+                bitset = bitsets[ordinal]
+                bitset = (bitset & low) | ((bitset >> (number + 1)) << number)
+                bitsets[ordinal] = bitset
+                if not bitset:
+                    self._present[position] &= ~(1 << ordinal)
+
+    @staticmethod
+    def count(mask):
+        """ Return the number of words in a bitset. """
+        return mask.bit_count()
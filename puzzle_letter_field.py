@@ -1,4 +1,5 @@
 import tkinter as tk
+from alphabet import Alphabet
 
 class PuzzleLetterField(tk.Entry):
     """ A tkinter Entry widget with functionality
@@ -17,7 +18,7 @@ class PuzzleLetterField(tk.Entry):
     def enter_char(self, key):
         """ Enter the character the user entered
             at the exclusion of all else. """
-        entry = key.keysym
+        entry = PuzzleLetterField.key_entry(key)
 
         if entry == 'BackSpace':
             self.delete(0, tk.END) # Throw out everything in the field.
@@ -42,7 +43,7 @@ class PuzzleLetterField(tk.Entry):
         elif entry == 'End':
             self.master.end(self.row)
         elif PuzzleLetterField.is_acceptable(entry):
-            entry = entry.upper()
+            entry = Alphabet.upper(entry)
             self.delete(0, tk.END) # Throw out everything in the field.
             self.insert(0, entry)
         else:
@@ -53,7 +54,7 @@ class PuzzleLetterField(tk.Entry):
     def finish_char(self, key):
         """ Enter the character the user entered
             at the exclusion of all else. """
-        entry = key.keysym
+        entry = PuzzleLetterField.key_entry(key)
         if PuzzleLetterField.is_acceptable(entry):
             if entry == 'space':
                 self.delete(0, tk.END) # Throw out everything in the field.
@@ -62,7 +63,7 @@ class PuzzleLetterField(tk.Entry):
                and entry != 'Right' and entry != 'Up' and entry != 'Down' \
                and entry != 'Tab' and entry != 'Home' and entry != 'End':
  
-                entry = entry.upper()
+                entry = Alphabet.upper(entry)
                 self.delete(0, tk.END) # Throw out everything in the field.
                 self.insert(0, entry)
                 self.master.tab(self.row, self.column)
@@ -78,6 +79,14 @@ class PuzzleLetterField(tk.Entry):
         """ Indicate that this is the letter field that last got focus. """
         self.master.indicate_focus(self.row, self.column)
 
+    @staticmethod
+    def key_entry(key):
+        """ Return the name of the key the user pressed or, for a letter
+            whose key has a longer name (like "ntilde" for Ñ), the letter. """
+        if len(key.keysym) > 1 and len(key.char) == 1 and key.char.isalpha():
+            return key.char
+        return key.keysym
+
     @staticmethod
     def is_acceptable(entry):
         """ Determine if a character is allowed in the field. """
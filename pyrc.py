@@ -1,6 +1,7 @@
 import random
+from alphabet import Alphabet
 
-def violates_like_exclusion(alphabet, plaintext):
+def violates_like_exclusion(letters, alphabet, plaintext):
     """ Determine if a letter in the alphabet violates
         like-exclusion and if that letter is in the plaintext. """
 
@@ -13,7 +14,7 @@ def violates_like_exclusion(alphabet, plaintext):
     for index, val in enumerate(alphabet):
         # If there is such a coincidence, see
         # if that letter is in the plaintext.
-        if chr(index+65) == val:
+        if letters.letter(index) == val:
             if val in plaintext:
                 return True
     # Otherwise, we're good.
@@ -21,23 +22,22 @@ def violates_like_exclusion(alphabet, plaintext):
 
 # Read the plaintext message.
 input_file = open("message.txt", "r")
-plaintext = input_file.read().upper()
+plaintext = Alphabet.upper(input_file.read())
 input_file.close()
 
+letters = Alphabet.default()
 while True:
     # Generate a ciphertext alphabet.
-    alphabet = []
-    for i in range(65, 91):
-        alphabet.append(chr(i))
+    alphabet = list(letters.letters())
     random.shuffle(alphabet)
-    if not violates_like_exclusion(alphabet, plaintext):
+    if not violates_like_exclusion(letters, alphabet, plaintext):
         break
 
 # Generate the ciphertext message.
 ciphertext = ''
 for plainchar in plaintext:
-    if plainchar.isalpha():
-        ciphertext = ciphertext + alphabet[ord(plainchar)-65]
+    if letters.contains(plainchar):
+        ciphertext = ciphertext + alphabet[letters.ordinal(plainchar)]
     else:
         ciphertext = ciphertext + plainchar
 
@@ -0,0 +1,172 @@
+import os
+from alphabet import Alphabet
+from pattern_index import PatternIndex
+from positional_index import PositionalIndex
+from candidate_view import CandidateView
+from pattern_encoder import PatternEncoder
+from word_frequency import WordFrequency
+from word_membership import WordMembership
+
+class ShardedPatternIndex():
+    """ The word pattern dictionary split into one pattern index per word
+        length. A shard gets opened the first time somebody asks about a
+        word of its length, and then it stays open for the duration. """
+
+    # The manifest gives the index format version and the letters of the
+    # alphabet the words are in (see Alphabet), and then lists the word
+    # lengths that have shards. It's written last, so if it exists, the
+    # whole directory is complete.
+    MANIFEST = 'MANIFEST'
+
+    def __init__(self, directory):
+        """ Read the manifest, but don't open any shards yet. """
+        self._directory = directory
+        with open(os.path.join(directory, self.MANIFEST),
+                encoding='utf-8') as manifest:
+            if manifest.readline().strip() != \
+                    'version ' + str(PatternIndex.VERSION):
+                raise ValueError(directory +
+                        ' is not a compatible pattern index')
+            alphabet = manifest.readline().strip()
+            if not alphabet.startswith('alphabet '):
+                raise ValueError(directory +
+                        ' is not a compatible pattern index')
+            self._alphabet = Alphabet.of(alphabet[len('alphabet '):])
+            self._lengths = set(int(line) for line in manifest
+                    if line.strip())
+        self._shards = {}
+        self._membership = None
+
+    def candidates(self, key, limit=None):
+        """ Return a view (see CandidateView) of all the words that fit a
+            given pattern key, most frequent first, which is empty if none
+            do. If there's a limit, include only that many of the most
+            frequent words. """
+        shard = self.shard(len(key))
+        if shard is None:
+            return CandidateView(PositionalIndex((), self._alphabet))
+        return shard.candidates(key, limit)
+
+    def frequencies(self, key, limit=None):
+        """ Return a list of the frequencies of the words that fit a given
+            pattern key, in the same order that candidates() returns. """
+        shard = self.shard(len(key))
+        if shard is None:
+            return []
+        return shard.frequencies(key, limit)
+
+    def positional(self, key):
+        """ Return the positional letter index of
+            the words that fit a given pattern key. """
+        shard = self.shard(len(key))
+        if shard is None:
+            return PositionalIndex((), self._alphabet)
+        return shard.positional(key)
+
+    def keys(self, length):
+        """ Iterate over all the pattern keys for words of a given length. """
+        shard = self.shard(length)
+        if shard is None:
+            return iter(())
+        return shard.keys()
+
+    def contains(self, word):
+        """ Return True if a word is in the dictionary, False if not. This
+            uses the membership file (see WordMembership) if there is one
+            and falls back on searching the word's bucket otherwise. """
+        if self._membership is None:
+            self._membership = self._open_membership()
+        if self._membership is not False:
+            return word in self._membership
+        return Alphabet.upper(word) in \
+                self.candidates(PatternEncoder.key(word))
+
+    def _open_membership(self):
+        """ Open the membership file, or return False if there isn't one. """
+        path = os.path.join(self._directory, WordMembership.FILE_NAME)
+        if not os.path.exists(path):
+            return False
+        return WordMembership(path)
+
+    def shard(self, length):
+        """ Return the shard for words of a given length (opening
+            it if necessary), or None if there are no such words. """
+        if length not in self._lengths:
+            return None
+        if length not in self._shards:
+            self._shards[length] = self._open_shard(length)
+        return self._shards[length]
+
+    def _open_shard(self, length):
+        """ Open the shard for words of a given length. """
+        return PatternIndex(os.path.join(
+                self._directory, self.shard_name(length)),
+                alphabet=self._alphabet)
+
+    def directory(self):
+        """ Return the directory the shards are in. """
+        return self._directory
+
+    def alphabet(self):
+        """ Return the alphabet the words are in. """
+        return self._alphabet
+
+    def lengths(self):
+        """ Return a sorted list of the word lengths that have shards. """
+        return sorted(self._lengths)
+
+    def close(self):
+        """ Close every shard we've opened. """
+        for shard in self._shards.values():
+            shard.close()
+        self._shards = {}
+        if self._membership:
+            self._membership.close()
+        self._membership = None
+
+    @staticmethod
+    def shard_name(length):
+        """ Return the file name of the shard for a given word length. """
+        return 'length_%02d.idx' % length
+
+    @staticmethod
+    def manifest_path(directory):
+        """ Return the path of the manifest in a shard directory. """
+        return os.path.join(directory, ShardedPatternIndex.MANIFEST)
+
+    @staticmethod
+    def compile(patterns, directory, alphabet=None):
+        """ Write a directory of shards for a dictionary that maps each
+            pattern string to a list of the words that fit it (in the
+            same form as word_patterns.allPatterns), all in the given
+            alphabet (or the default one). Since such a dictionary has
+            no frequencies, we estimate them. """
+        alphabet = alphabet or Alphabet.default()
+        by_length = {}
+        for pattern, words in patterns.items():
+            key = PatternEncoder.key_from_string(pattern)
+            by_length.setdefault(len(key), {})[key] = [(word,
+                    WordFrequency.estimate(word)) for word in words]
+        os.makedirs(directory, exist_ok=True)
+        for length, shard_patterns in by_length.items():
+            PatternIndex.compile(shard_patterns, os.path.join(
+                    directory, ShardedPatternIndex.shard_name(length)),
+                    alphabet)
+        WordMembership.compile((word for words in patterns.values()
+                for word in words), os.path.join(directory,
+                WordMembership.FILE_NAME))
+        ShardedPatternIndex.write_manifest(directory, by_length, alphabet)
+
+    @staticmethod
+    def write_manifest(directory, lengths, alphabet=None):
+        """ Write the manifest for a shard directory (of words in the given
+            alphabet, or the default one), which marks the directory as
+            complete and ready to use. """
+        alphabet = alphabet or Alphabet.default()
+        manifest_path = ShardedPatternIndex.manifest_path(directory)
+        with open(manifest_path + '.tmp', 'w', encoding='utf-8') as manifest:
+            manifest.write('version ' + str(PatternIndex.VERSION) + '\n')
+            manifest.write('alphabet ' + alphabet.letters() + '\n')
+            for length in sorted(lengths):
+                manifest.write(str(length) + '\n')
+        os.replace(manifest_path + '.tmp', manifest_path)
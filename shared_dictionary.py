@@ -0,0 +1,123 @@
+import os
+import struct
+from multiprocessing import shared_memory
+from alphabet import Alphabet
+from pattern_index import PatternIndex
+from sharded_pattern_index import ShardedPatternIndex
+
+class SharedDictionary(ShardedPatternIndex):
+    """ A sharded pattern index published once into shared memory, so
+        that any number of worker processes can attach to it read-only
+        and look words up in the very same pages, instead of each one
+        holding a copy of its own. The parent process publishes:
+
+            segment = SharedDictionary.publish(index_directory)
+
+        and passes segment.name to the workers, each of which calls:
+
+            OneWordSolver.attach_shared(name)
+
+        When the workers are done, the parent calls segment.close() and
+        segment.unlink(). """
+
+    # The segment starts with a header (magic number, index version,
+    # number of shards and the size of the alphabet's letters in UTF-8)
+    # followed by the alphabet's letters (see Alphabet), then a table of
+    # (word length, offset, size) entries, one per shard, and then the
+    # shards themselves, byte for byte as they are in their files.
+    MAGIC = b'CRYPSHM\x00'
+    HEADER = struct.Struct('<8sIII')
+    ENTRY = struct.Struct('<III')
+
+    def __init__(self, name):
+        """ Attach to a published segment, but don't open any shards yet. """
+        self._directory = 'shared memory segment ' + name
+        self._segment = SharedDictionary._attach(name)
+        self._view = memoryview(self._segment.buf)
+        magic, version, shard_count, letters_size = \
+                self.HEADER.unpack_from(self._view, 0)
+        if magic != self.MAGIC or version != PatternIndex.VERSION:
+            self._view.release()
+            self._segment.close()
+            raise ValueError(self._directory +
+                    ' is not a compatible pattern index')
+        table = self.HEADER.size + letters_size
+        self._alphabet = Alphabet.of(bytes(
+                self._view[self.HEADER.size:table]).decode('utf-8'))
+        self._locations = {}
+        for number in range(shard_count):
+            length, offset, size = self.ENTRY.unpack_from(self._view,
+                    table + number * self.ENTRY.size)
+            self._locations[length] = (offset, size)
+        self._lengths = set(self._locations)
+        self._shards = {}
+        self._membership = None
+
+    def _open_shard(self, length):
+        """ Open the shard for words of a given length, reading
+            it directly from its part of the shared segment. """
+        offset, size = self._locations[length]
+        return PatternIndex(self._directory,
+                self._view[offset:offset + size], self._alphabet)
+
+    def _open_membership(self):
+        """ The membership file isn't published, so
+            fall back on searching buckets instead. """
+        return False
+
+    def close(self):
+        """ Detach from the segment (without destroying it). """
+        ShardedPatternIndex.close(self)
+        self._view.release()
+        self._segment.close()
+
+    @staticmethod
+    def _attach(name):
+        """ Attach to an existing segment. A process that merely attaches
+            mustn't have the segment destroyed on its behalf when it ends,
+            so we opt out of resource tracking where Python allows it.
+            (Older versions of Python always track the segment, but worker
+            processes started by multiprocessing share their parent's
+            resource tracker, which already knows about the segment, so
+            there the extra registration does no harm.) """
+        try:
+            return shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            return shared_memory.SharedMemory(name=name)
+
+    @staticmethod
+    def publish(directory, name=None):
+        """ Copy a shard directory into a new shared memory segment and
+            return the segment (a SharedMemory object). The caller owns
+            the segment and must close and unlink it when it's done. """
+        index = ShardedPatternIndex(directory)
+        letters = index.alphabet().letters().encode('utf-8')
+        shards = []
+        for length in index.lengths():
+            with open(os.path.join(directory,
+                    ShardedPatternIndex.shard_name(length)), 'rb') as shard:
+                shards.append((length, shard.read()))
+        index.close()
+
+        offset = SharedDictionary.HEADER.size + len(letters) + \
+                len(shards) * SharedDictionary.ENTRY.size
+        table = []
+        for length, contents in shards:
+            table.append(SharedDictionary.ENTRY.pack(
+                    length, offset, len(contents)))
+            offset += len(contents)
+        segment = shared_memory.SharedMemory(name=name,
+                create=True, size=max(offset, 1))
+        SharedDictionary.HEADER.pack_into(segment.buf, 0,
+                SharedDictionary.MAGIC, PatternIndex.VERSION, len(shards),
+                len(letters))
+        position = SharedDictionary.HEADER.size
+        segment.buf[position:position + len(letters)] = letters
+        position += len(letters)
+        for entry in table:
+            segment.buf[position:position + len(entry)] = entry
+            position += len(entry)
+        for length, contents in shards:
+            segment.buf[position:position + len(contents)] = contents
+            position += len(contents)
+        return segment
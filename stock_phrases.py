@@ -0,0 +1,93 @@
+""" Stock phrases that turn up again and again in cryptograms (and in
+    English generally), most common first. Each is two or more words
+    that are all in the word pattern dictionary. """
+
+allPhrases = ['OF THE',
+              'IN THE',
+              'TO THE',
+              'ON THE',
+              'AND THE',
+              'FOR THE',
+              'AT THE',
+              'FROM THE',
+              'WITH THE',
+              'BY THE',
+              'IT IS',
+              'IT WAS',
+              'THERE IS',
+              'THERE ARE',
+              'THERE IS A',
+              'THERE WAS A',
+              'IS THE',
+              'WAS THE',
+              'ONE OF THE',
+              'OUT OF THE',
+              'PART OF THE',
+              'SOME OF THE',
+              'MOST OF THE',
+              'ALL OF THE',
+              'END OF THE',
+              'AS WELL AS',
+              'IN ORDER TO',
+              'AT LEAST',
+              'AT ALL',
+              'AS IF',
+              'SO THAT',
+              'SUCH AS',
+              'IS NOT',
+              'DO NOT',
+              'DOES NOT',
+              'DID NOT',
+              'CAN NOT',
+              'WILL NOT',
+              'HAVE BEEN',
+              'HAS BEEN',
+              'HAD BEEN',
+              'WILL BE',
+              'WOULD BE',
+              'COULD BE',
+              'SHOULD BE',
+              'THAT IS',
+              'THIS IS',
+              'WHAT IS',
+              'WHO IS',
+              'I AM',
+              'I WILL',
+              'I HAVE',
+              'I DO NOT',
+              'YOU ARE',
+              'YOU CAN',
+              'WE ARE',
+              'THEY ARE',
+              'HE WAS',
+              'SHE WAS',
+              'THE WORLD',
+              'THE SAME',
+              'THE OTHER',
+              'THE FIRST',
+              'THE ONLY',
+              'THE BEST',
+              'THE MOST',
+              'THE END',
+              'THE TRUTH',
+              'THE PEOPLE',
+              'A LOT OF',
+              'A LITTLE',
+              'EACH OTHER',
+              'NO ONE',
+              'EVERY DAY',
+              'TO BE',
+              'NOT TO BE',
+              'IF YOU',
+              'IF YOU CAN',
+              'WHEN YOU',
+              'ALL THE TIME',
+              'FOR EXAMPLE',
+              'OF COURSE',
+              'IN FACT',
+              'LIFE IS',
+              'LOVE IS',
+              'TIME IS',
+              'THE TIME',
+              'IN THE WORLD',
+              'ONCE UPON A TIME']
@@ -0,0 +1,346 @@
+from alphabet import Alphabet
+from pattern_encoder import PatternEncoder
+from positional_index import PositionalIndex
+from candidate_view import CandidateView
+
+class SuffixDictionary():
+    """ The words we can make by putting an apostrophe suffix ('S, 'LL,
+        N'T and so on) on the end of a dictionary word, worked out when a
+        pattern is looked up rather than stored. Every key for a word with
+        a suffix starts with the key for its stem (since letters are
+        numbered in order of first appearance), so to answer a query we
+        look up the stem's bucket and keep only the stems whose letters
+        agree with what the rest of the key says about the suffix's
+        letters. The words come straight out of the stem's bucket and
+        positional index, suffix attached, with nothing copied. Stack this
+        on top of the dictionary with a LayeredDictionary, so words that
+        the dictionary does list (like "IT'S") come from there. """
+
+    def __init__(self, stems, suffixes, fewer_than=None):
+        """ Make the suffixed words for a dictionary of stems, which is
+            anything with candidates(), frequencies() and positional()
+            methods, like ShardedPatternIndex. "suffixes" maps each suffix
+            to the weight by which to multiply its stems' frequencies. If
+            there's a "fewer_than", only make words for the pattern keys
+            that the stems' dictionary itself has fewer words than that
+            for, so that a key it has plenty of words for (like the one
+            for "WORLD'S", "DOESN'T" and "HAVEN'T") keeps just those and
+            doesn't fill up with every possessive that fits. """
+        self._stems = stems
+        self._suffixes = suffixes
+        self._fewer_than = fewer_than
+        self._matched = {}
+        self._merged = {}
+        self._keys = {}
+
+    def candidates(self, key, limit=None):
+        """ Return a view (see CandidateView) of all the suffixed words
+            that fit a given pattern key, most frequent first, which is
+            empty if none do. If there's a limit, include only that many
+            of the most frequent words. """
+        matches = self._matches(key)
+        if len(matches) == 0:
+            return CandidateView(PositionalIndex((), self.alphabet()))
+        if len(matches) == 1:
+            positional, mask, weight = matches[0]
+            return CandidateView(positional,
+                    SuffixDictionary._first(mask, limit))
+        return CandidateView.likeliest(self._merge(key)[2], limit)
+
+    def frequencies(self, key, limit=None):
+        """ Return a list of the (weighted) frequencies of the words that
+            fit a given pattern key, in the same order as candidates(). """
+        matches = self._matches(key)
+        if len(matches) == 0:
+            return []
+        if len(matches) == 1:
+            positional, mask, weight = matches[0]
+            stem_frequencies = self._stems.frequencies(positional.stem_key())
+            frequencies = []
+            while mask and (limit is None or len(frequencies) < limit):
+                lowest = mask & -mask
+                frequencies.append(round(weight *
+                        stem_frequencies[lowest.bit_length() - 1]))
+                mask ^= lowest
+            return frequencies
+        return list(self._merge(key)[1][:limit])
+
+    def positional(self, key):
+        """ Return the positional letter index of the words that fit a
+            given pattern key, in the same order that candidates() does.
+            (If only one suffix fits, that's the stems' index with the
+            suffix attached, which also covers stems that didn't fit; the
+            view from candidates() tells which do.) """
+        matches = self._matches(key)
+        if len(matches) == 0:
+            return PositionalIndex((), self.alphabet())
+        if len(matches) == 1:
+            return matches[0][0]
+        return self._merge(key)[2]
+
+    def keys(self, length):
+        """ Return a sorted list of the pattern keys that suffixed words
+            of a given length might have. (From a stem's key alone, we
+            can't tell whether the stem has the suffix's letters in it, so
+            this includes every way it might or might not; some of these
+            keys will turn out to have no words.) """
+        if length not in self._keys:
+            keys = set()
+            for suffix in self._suffixes:
+                if length <= len(suffix):
+                    continue
+                tails = {}
+                for stem_key in self._stems.keys(length - len(suffix)):
+                    distinct = len(set(stem_key) -
+                            {PatternEncoder.APOSTROPHE})
+                    if distinct not in tails:
+                        tails[distinct] = SuffixDictionary._suffix_tails(
+                                distinct, suffix)
+                    keys.update(stem_key + tail for tail in tails[distinct])
+            self._keys[length] = sorted(keys)
+        return self._keys[length]
+
+    def alphabet(self):
+        """ Return the alphabet of the words (the stems'). """
+        return self._stems.alphabet()
+
+    def lengths(self):
+        """ Return a sorted list of the lengths of the suffixed words. """
+        lengths = set()
+        for length in self._stems.lengths():
+            for suffix in self._suffixes:
+                lengths.add(length + len(suffix))
+        return sorted(lengths)
+
+    def contains(self, word):
+        """ Return True if a word is a stem with a suffix (and we make
+            words for its pattern key), False if not. """
+        word = Alphabet.upper(word)
+        if not self._composes(PatternEncoder.key(word)):
+            return False
+        for suffix in self._suffixes:
+            if len(word) > len(suffix) and word.endswith(suffix) and \
+                    self._stems.contains(word[:-len(suffix)]):
+                return True
+        return False
+
+    def close(self):
+        """ Forget what we've worked out. (The stems belong to whoever
+            gave them to us, so we leave them open.) """
+        self._matched = {}
+        self._merged = {}
+
+    def invalidate(self, key):
+        """ Forget everything we worked out from the stems' bucket for a
+            pattern key, because it has changed (see EditableDictionary).
+            (The key's own words can decide whether we make words for it
+            at all, so we forget what we worked out for it too.) """
+        self._matched.pop(key, None)
+        self._merged.pop(key, None)
+        for suffix in self._suffixes:
+            self._keys.pop(len(key) + len(suffix), None)
+        for cache in (self._matched, self._merged):
+            for suffixed_key in list(cache):
+                if self.derives(key, suffixed_key):
+                    del cache[suffixed_key]
+
+    def derives(self, key, suffixed_key):
+        """ Return True if the words for one pattern key might be made
+            from the stems' bucket for another: that is, if the first key
+            followed by one of our suffixes' worth of key gives the second.
+            (Letters are numbered in order of first appearance, so a
+            suffixed word's key always starts with its stem's.) """
+        return suffixed_key.startswith(key) and any(
+                len(suffixed_key) - len(key) == len(suffix)
+                for suffix in self._suffixes)
+
+    def _matches(self, key):
+        """ Return a list of (positional index, bitset, weight) triples,
+            one for each suffix that some stem can take to fit a given
+            pattern key: the stems' index with the suffix attached, the
+            bitset of the stems that fit and the suffix's weight. (We
+            remember the answer, since it's needed again and again.) """
+        if key in self._matched:
+            return self._matched[key]
+        matches = []
+        if not self._composes(key):
+            self._matched[key] = matches
+            return matches
+        for suffix, weight in self._suffixes.items():
+            if len(key) <= len(suffix):
+                continue
+            stem_key = key[:-len(suffix)]
+            letters = SuffixDictionary._suffix_letters(stem_key,
+                    key[-len(suffix):], suffix)
+            if letters is None:
+                continue
+            stem_positional = self._stems.positional(stem_key)
+            mask = stem_positional.everything()
+            # (An empty bucket's index may not even have
+            # the positions to ask about, so don't ask.)
+            if not mask:
+                continue
+            for letter, position in letters.items():
+                if position is not None:
+                    # The stem must have this letter right there...
+                    mask &= stem_positional.matching(position, letter)
+                else:
+                    # ...or nowhere at all.
+                    for stem_position in range(len(stem_key)):
+                        if not mask:
+                            break
+                        mask &= ~stem_positional.matching(stem_position,
+                                letter)
+            if mask:
+                matches.append((_SuffixedIndex(stem_positional, stem_key,
+                        suffix), mask, weight))
+        self._matched[key] = matches
+        return matches
+
+    def _composes(self, key):
+        """ Return True if we make suffixed words for a pattern key: that
+            is, unless the stems' dictionary has enough words of its own
+            for it (see fewer_than). """
+        return self._fewer_than is None or len(self._stems.candidates(
+                key, self._fewer_than)) < self._fewer_than
+
+    @staticmethod
+    def _suffix_letters(stem_key, suffix_key, suffix):
+        """ Work out what the end of a pattern key says about the letters
+            of a suffix, given the stem's part of the key. Return a dict
+            that maps each letter of the suffix to the stem position that
+            must have that letter, or to None if the letter mustn't be
+            in the stem at all. Or return None if the suffix can't fit
+            the key whatever the stem is. """
+        first_position = {}
+        for position, number in enumerate(stem_key):
+            first_position.setdefault(number, position)
+        letters = {}
+        numbers = {}
+        for number, character in zip(suffix_key, suffix):
+            if character == '\'' or number == PatternEncoder.APOSTROPHE:
+                if character != '\'' or number != PatternEncoder.APOSTROPHE:
+                    return None
+                continue
+            # The same letter must always get the same number,
+            # and different letters must get different numbers.
+            if numbers.get(character, number) != number or \
+                    letters.get(number, character) != character:
+                return None
+            numbers[character] = number
+            letters[number] = character
+        return {character: first_position.get(number)
+                for character, number in numbers.items()}
+
+    @staticmethod
+    def _suffix_tails(distinct, suffix):
+        """ Return a list of the ways a suffix's part of a pattern key
+            might go, on a stem with a given number of different letters,
+            depending on which of the suffix's letters (if any) the stem
+            has and where. (The stem's letters are numbered 0 up to but
+            not including "distinct", whatever the stem is, so the stem's
+            own key doesn't matter.) """
+        tails = [(b'', {}, distinct)]
+        for character in suffix:
+            extended = []
+            for tail, numbers, next_number in tails:
+                if character == '\'':
+                    extended.append((tail + bytes([PatternEncoder.APOSTROPHE]),
+                            numbers, next_number))
+                elif character in numbers:
+                    extended.append((tail + bytes([numbers[character]]),
+                            numbers, next_number))
+                else:
+                    # The letter is either new or one of the stem's
+                    # letters that no other suffix letter has claimed.
+                    for number in range(distinct + 1):
+                        if number in numbers.values():
+                            continue
+                        if number == distinct:
+                            number = next_number
+                        extended.append((tail + bytes([number]),
+                                dict(numbers, **{character: number}),
+                                next_number + (number == next_number)))
+            tails = extended
+        return [tail for tail, numbers, next_number in tails]
+
+    @staticmethod
+    def _first(mask, limit):
+        """ Return the bitset of the first "limit" words in a bitset
+            (or the whole bitset, if there's no limit). """
+        if limit is None or PositionalIndex.count(mask) <= limit:
+            return mask
+        result = 0
+        for number in range(limit):
+            lowest = mask & -mask
+            result |= lowest
+            mask ^= lowest
+        return result
+
+    def _merge(self, key):
+        """ Return a tuple of the words for a pattern key that more than
+            one suffix fits (as with "'S" and "'D"), a tuple of their
+            weighted frequencies and their positional index, merging
+            them if we haven't yet. """
+        if key not in self._merged:
+            ranked = []
+            for positional, mask, weight in self._matches(key):
+                stem_frequencies = self._stems.frequencies(
+                        positional.stem_key())
+                while mask:
+                    lowest = mask & -mask
+                    number = lowest.bit_length() - 1
+                    ranked.append((positional.word(number),
+                            round(weight * stem_frequencies[number])))
+                    mask ^= lowest
+            ranked.sort(key=lambda pair: (-pair[1], pair[0]))
+            words = tuple(word for word, frequency in ranked)
+            self._merged[key] = (words,
+                    tuple(frequency for word, frequency in ranked),
+                    PositionalIndex(words, self.alphabet()))
+        return self._merged[key]
+
+class _SuffixedIndex(PositionalIndex):
+    """ The positional index of a stem bucket's words with a suffix on
+        the end, which uses the stems' own bitsets for the stem positions
+        and knows without looking that every word has the suffix. """
+
+    def __init__(self, stems, stem_key, suffix):
+        self._stems = stems
+        self._alphabet = stems.alphabet()
+        self._stem_key = stem_key
+        self._suffix = suffix
+        self._everything = stems.everything()
+        self._suffix_bitsets = {}
+
+    def stem_key(self):
+        """ Return the pattern key of the stems. """
+        return self._stem_key
+
+    def width(self):
+        return len(self._stem_key) + len(self._suffix)
+
+    def word(self, number):
+        return self._stems.word(number) + self._suffix
+
+    def _position(self, position):
+        if position < len(self._stem_key):
+            return self._stems._position(position)
+        if position not in self._suffix_bitsets:
+            bitsets = [0] * (self._alphabet.size() + 1)
+            bitsets[self._suffix_ordinal(position)] = self._everything
+            self._suffix_bitsets[position] = bitsets
+        return self._suffix_bitsets[position]
+
+    def _present_at(self, position):
+        if position < len(self._stem_key):
+            return self._stems._present_at(position)
+        return 1 << self._suffix_ordinal(position)
+
+    def _suffix_ordinal(self, position):
+        """ Return the ordinal of the suffix's character at a position. """
+        return self._alphabet.ordinal(
+                self._suffix[position - len(self._stem_key)])
+
+    def words(self, mask):
+        return [word + self._suffix for word in self._stems.words(mask)]
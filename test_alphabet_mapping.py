@@ -0,0 +1,39 @@
+import random
+import unittest
+from alphabet_mapping import AlphabetMapping
+from test_bitmask_alphabet_mapping import LETTERS, StringMapping, \
+        random_operations
+
+class AlphabetMappingTest(unittest.TestCase):
+    """ The simple mapping, checked against the original string mapping. """
+
+    def test_same_as_string_mapping(self):
+        """ The mapping (and its copies, which stay simple mappings) ends
+            up with exactly the translations that the string mapping does. """
+        generator = random.Random(13)
+        for trial in range(500):
+            like_exclusion = generator.random() < 0.5
+            expected, mapping = random_operations(generator,
+                    [StringMapping(like_exclusion),
+                    AlphabetMapping(like_exclusion)],
+                    generator.randint(1, 80))
+            self.assertIsInstance(mapping, AlphabetMapping)
+            for letter in LETTERS:
+                self.assertEqual(mapping.translate(letter),
+                        expected.translate(letter))
+
+    def test_rollback(self):
+        """ Rolling back undoes the changes since the checkpoint. """
+        generator = random.Random(17)
+        mapping = AlphabetMapping(True)
+        checkpoint = mapping.checkpoint()
+        snapshot = mapping.snapshot()
+        for operation in range(40):
+            mapping.narrow_down_translations(generator.choice(LETTERS),
+                    ''.join(generator.sample(LETTERS, 4)))
+        mapping.rollback(checkpoint)
+        mapping.release(checkpoint)
+        self.assertEqual(mapping.snapshot(), snapshot)
+
+if __name__ == '__main__':
+    unittest.main()
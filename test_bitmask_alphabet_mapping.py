@@ -0,0 +1,206 @@
+import random
+import unittest
+from alphabet import Alphabet
+from bitmask_alphabet_mapping import BitmaskAlphabetMapping
+
+LETTERS = Alphabet.default().letters()
+
+class StringMapping():
+    """ The original, string-based alphabet mapping, kept here as it was
+        so that the mappings that replaced it can be checked against it. """
+
+    def __init__(self, like_exclusion):
+        self._letter_dictionary = {}
+        for letter in LETTERS:
+            self._letter_dictionary[letter] = LETTERS
+            if like_exclusion:
+                self._letter_dictionary[letter] = \
+                        self._letter_dictionary[letter].replace(letter, '')
+
+    def copy(self):
+        duplicate = StringMapping(False)
+        duplicate._letter_dictionary = dict(self._letter_dictionary)
+        return duplicate
+
+    def delete_translation(self, ciphertext, plaintext):
+        if len(self._letter_dictionary[ciphertext]) > 1:
+            self._letter_dictionary[ciphertext] = \
+                    self._letter_dictionary[ciphertext].replace(plaintext, '')
+            if len(self._letter_dictionary[ciphertext]) == 1:
+                for letter in LETTERS:
+                    if letter != ciphertext:
+                        self.delete_translation(letter,
+                                self._letter_dictionary[ciphertext])
+
+    def narrow_down_translations(self, ciphertext, plaintext):
+        current_plaintext = self._letter_dictionary[ciphertext]
+        if len(current_plaintext) <= 1:
+            return
+        result = ''.join(sorted(set(current_plaintext).
+                intersection(plaintext)))
+        if result == "":
+            return
+        self._letter_dictionary[ciphertext] = result
+        if len(result) == 1:
+            for letter in LETTERS:
+                if letter != ciphertext:
+                    self.delete_translation(letter, result)
+
+    def conforms(self, ciphertext, plaintext):
+        for index in range(len(ciphertext)):
+            if ciphertext[index] != '\'':
+                if not plaintext[index] in \
+                        self._letter_dictionary[ciphertext[index]]:
+                    return False
+        return True
+
+    def translate(self, ciphertext):
+        return self._letter_dictionary[ciphertext]
+
+def random_operations(generator, mappings, count):
+    """ Narrow down or delete translations at random, the same way in
+        each of the mappings, now and then swapping them for copies.
+        Return the mappings as they end up. """
+    for operation in range(count):
+        ciphertext = generator.choice(LETTERS)
+        if generator.random() < 0.5:
+            plaintext = ''.join(generator.choice(LETTERS)
+                    for letter in range(generator.randint(0, 6)))
+            for mapping in mappings:
+                mapping.narrow_down_translations(ciphertext, plaintext)
+        else:
+            plaintext = generator.choice(LETTERS)
+            for mapping in mappings:
+                mapping.delete_translation(ciphertext, plaintext)
+        if generator.random() < 0.05:
+            mappings = [mapping.copy() for mapping in mappings]
+    return mappings
+
+class BitmaskAlphabetMappingTest(unittest.TestCase):
+    """ Random operation sequences, checked against the string mapping and
+        against what the bitmask mapping promises about itself. """
+
+    def test_same_as_string_mapping(self):
+        """ At SINGLES strength, the bitmask mapping ends up with exactly
+            the translations that the string mapping does. """
+        generator = random.Random(5)
+        for trial in range(1000):
+            like_exclusion = generator.random() < 0.5
+            expected, mapping = random_operations(generator,
+                    [StringMapping(like_exclusion),
+                    BitmaskAlphabetMapping(like_exclusion)],
+                    generator.randint(1, 80))
+            for letter in LETTERS:
+                self.assertEqual(mapping.translate(letter),
+                        expected.translate(letter))
+            ciphertext = ''.join(generator.choice(LETTERS) for letter in 'WORD')
+            plaintext = ''.join(generator.choice(expected.translate(letter))
+                    if generator.random() < 0.5 else generator.choice(LETTERS)
+                    for letter in ciphertext)
+            self.assertEqual(mapping.conforms(ciphertext, plaintext),
+                    expected.conforms(ciphertext, plaintext))
+
+    def test_stronger_rules_keep_the_truth(self):
+        """ Narrowing down only ever to sets that include the true key
+            never loses a true translation at any strength, and a stronger
+            mapping pins down everything a weaker one does. """
+        generator = random.Random(3)
+        for trial in range(500):
+            key = dict(zip(LETTERS, generator.sample(LETTERS, len(LETTERS))))
+            mappings = [BitmaskAlphabetMapping(False, strength) for strength in
+                    (BitmaskAlphabetMapping.SINGLES,
+                    BitmaskAlphabetMapping.HIDDEN_SINGLES,
+                    BitmaskAlphabetMapping.SETS)]
+            for narrowing in range(generator.randint(5, 60)):
+                ciphertext = generator.choice(LETTERS)
+                plaintext = ''.join(set(generator.sample(LETTERS,
+                        generator.randint(1, 6))) | {key[ciphertext]})
+                for mapping in mappings:
+                    mapping.narrow_down_translations(ciphertext, plaintext)
+            for mapping in mappings:
+                self.assertTrue(mapping.consistent())
+                for letter in LETTERS:
+                    self.assertIn(key[letter], mapping.translate(letter))
+            for weaker, stronger in zip(mappings, mappings[1:]):
+                for letter in LETTERS:
+                    if len(weaker.translate(letter)) == 1:
+                        self.assertEqual(stronger.translate(letter),
+                                weaker.translate(letter))
+
+    def test_rollback(self):
+        """ Rolling back to a checkpoint, however deeply nested, gives back
+            exactly the mapping as it was when the checkpoint was taken. """
+        generator = random.Random(5)
+        for trial in range(300):
+            mapping = BitmaskAlphabetMapping(generator.random() < 0.5,
+                    generator.randint(0, 2))
+            checkpoints = []
+            for operation in range(80):
+                choice = generator.random()
+                if choice < 0.15:
+                    checkpoints.append((mapping.checkpoint(),
+                            mapping.snapshot()))
+                elif choice < 0.25 and checkpoints:
+                    checkpoint, snapshot = checkpoints[-1]
+                    mapping.rollback(checkpoint)
+                    self.assertEqual(mapping.snapshot(), snapshot)
+                elif choice < 0.3 and checkpoints:
+                    mapping.release(checkpoints.pop()[0])
+                else:
+                    mapping.narrow_down_translations(generator.choice(LETTERS),
+                            ''.join(generator.sample(LETTERS,
+                            generator.randint(1, 8))))
+            while checkpoints:
+                checkpoint, snapshot = checkpoints.pop()
+                mapping.rollback(checkpoint)
+                self.assertEqual(mapping.snapshot(), snapshot)
+                mapping.release(checkpoint)
+
+    def test_sources_and_snapshots(self):
+        """ sources() always agrees with translate(), through checkpoints,
+            rollbacks, copies and snapshots, at every strength. """
+        generator = random.Random(7)
+        for trial in range(300):
+            strength = generator.randint(0, 2)
+            mapping = BitmaskAlphabetMapping(generator.random() < 0.5,
+                    strength)
+            checkpoints = []
+            for operation in range(60):
+                choice = generator.random()
+                if choice < 0.1:
+                    checkpoints.append(mapping.checkpoint())
+                elif choice < 0.2 and checkpoints:
+                    mapping.rollback(checkpoints[-1])
+                elif choice < 0.25 and checkpoints:
+                    mapping.release(checkpoints.pop())
+                elif choice < 0.3:
+                    mapping = generator.choice([mapping.copy(),
+                            BitmaskAlphabetMapping.from_snapshot(
+                            mapping.snapshot(), strength)])
+                    checkpoints = []
+                else:
+                    mapping.narrow_down_translations(generator.choice(LETTERS),
+                            ''.join(generator.sample(LETTERS,
+                            generator.randint(1, 8))))
+                plaintext = generator.choice(LETTERS)
+                self.assertEqual(mapping.sources(plaintext),
+                        ''.join(letter for letter in LETTERS
+                        if plaintext in mapping.translate(letter)))
+
+    def test_changes(self):
+        """ changes() reports every letter whose translations are different
+            from the last time it was called. """
+        generator = random.Random(11)
+        mapping = BitmaskAlphabetMapping(False)
+        mapping.changes()
+        for operation in range(500):
+            before = {letter: mapping.translate(letter) for letter in LETTERS}
+            mapping.narrow_down_translations(generator.choice(LETTERS),
+                    ''.join(generator.sample(LETTERS, generator.randint(1, 20))))
+            changed = mapping.changes()
+            for letter in LETTERS:
+                if mapping.translate(letter) != before[letter]:
+                    self.assertIn(letter, changed)
+
+if __name__ == '__main__':
+    unittest.main()
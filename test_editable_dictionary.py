@@ -0,0 +1,84 @@
+import random
+import shutil
+import tempfile
+import unittest
+from editable_dictionary import EditableDictionary
+from layered_dictionary import LayeredDictionary
+from pattern_encoder import PatternEncoder
+from suffix_dictionary import SuffixDictionary
+from cryp_constants import CrypConstants
+from test_sharded_pattern_index import build, random_word_list
+
+LETTERS = 'ABDEINORST'
+
+def with_suffixes(dictionary):
+    """ Stack suffixed words on a dictionary the way the solver does. """
+    return LayeredDictionary([(dictionary, 1), (SuffixDictionary(
+            dictionary, CrypConstants.CONTRACTION_SUFFIXES,
+            CrypConstants.SUFFIX_FALLBACK_SIZE), 1)])
+
+def random_key(generator):
+    """ Return the pattern key of a made-up word, with or without one of
+        the suffixes on the end. """
+    word = ''.join(generator.choice(LETTERS)
+            for letter in range(generator.randint(1, 6)))
+    if generator.random() < 0.5:
+        word += generator.choice(list(CrypConstants.CONTRACTION_SUFFIXES))
+    return PatternEncoder.key(word)
+
+class EditableDictionaryTest(unittest.TestCase):
+    """ Edits made on top of a built dictionary, checked against
+        a dictionary built from scratch with the edits already in. """
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp(prefix='cryp_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def test_same_as_rebuilding(self):
+        """ After any run of additions and removals (and lookups in
+            between, which get remembered), the editable dictionary and the
+            suffixed words stacked on it give the same answers as a fresh
+            stack on a dictionary built from the edited word list. """
+        generator = random.Random(5)
+        words = random_word_list(generator, 400, LETTERS)
+        edits = EditableDictionary(build(words, self._directory))
+        index = with_suffixes(edits)
+        edits.add_listener(index.invalidate)
+        for operation in range(300):
+            if generator.random() < 0.5 and words:
+                word = generator.choice(sorted(words))
+                self.assertTrue(edits.remove_word(word))
+                del words[word]
+            else:
+                word = random_word_list(generator, 1, LETTERS).popitem()[0]
+                words[word] = generator.choice((1, 2, 3, 100))
+                edits.add_word(word, words[word])
+            for lookup in range(5):
+                index.candidates(random_key(generator))
+
+        shutil.rmtree(self._directory)
+        self._directory = tempfile.mkdtemp(prefix='cryp_test_')
+        rebuilt = build(words, self._directory)
+        fresh = with_suffixes(rebuilt)
+        for length in range(1, 8):
+            self.assertEqual(list(edits.keys(length)),
+                    sorted(rebuilt.keys(length)))
+        for trial in range(2000):
+            key = random_key(generator)
+            self.assertEqual(edits.candidates(key).copy(),
+                    rebuilt.candidates(key).copy())
+            self.assertEqual(list(edits.frequencies(key)),
+                    list(rebuilt.frequencies(key)))
+            self.assertEqual(index.candidates(key).copy(),
+                    fresh.candidates(key).copy())
+            self.assertEqual(list(index.frequencies(key)),
+                    list(fresh.frequencies(key)))
+        for word in random_word_list(generator, 300, LETTERS):
+            self.assertEqual(edits.contains(word), word in words)
+        edits.close()
+        rebuilt.close()
+
+if __name__ == '__main__':
+    unittest.main()
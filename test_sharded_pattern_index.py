@@ -0,0 +1,99 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+from build_dictionary import DictionaryBuilder
+from pattern_encoder import PatternEncoder
+from sharded_pattern_index import ShardedPatternIndex
+
+def random_word_list(generator, count, letters='ABDEINORST'):
+    """ Return a dictionary of made-up words (from a few letters, so that
+        plenty of them share patterns) and their frequencies, some of which
+        tie. """
+    words = {}
+    while len(words) < count:
+        word = ''.join(generator.choice(letters)
+                for letter in range(generator.randint(1, 7)))
+        words[word] = generator.choice((1, 2, 3, 5, 8, 13, 100, 1000))
+    return words
+
+def build(words, directory):
+    """ Build a shard directory from a dictionary of words
+        and frequencies, and return the index for it. """
+    source_path = os.path.join(directory, 'words.txt')
+    with open(source_path, 'w', encoding='utf-8') as source:
+        for word, frequency in words.items():
+            source.write(word.lower() + ' ' + str(frequency) + '\n')
+    DictionaryBuilder.build(source_path, os.path.join(directory, 'index'))
+    return ShardedPatternIndex(os.path.join(directory, 'index'))
+
+def ranked(words):
+    """ Group a dictionary of words and frequencies the slow, obvious way:
+        a list of words for each pattern key, most frequent first (and in
+        alphabetical order among words with the same frequency). """
+    buckets = {}
+    for word in sorted(words, key=lambda word: (-words[word], word)):
+        buckets.setdefault(PatternEncoder.encode(word), []).append(word)
+    return buckets
+
+class ShardedPatternIndexTest(unittest.TestCase):
+    """ A built index, checked against a plain grouping of its word list. """
+
+    def setUp(self):
+        self._directory = tempfile.mkdtemp(prefix='cryp_test_')
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def test_same_as_grouping(self):
+        """ Every bucket holds the words that fit its key in frequency
+            order, with their frequencies, and nothing else. """
+        generator = random.Random(5)
+        words = random_word_list(generator, 3000)
+        buckets = ranked(words)
+        index = build(words, self._directory)
+        try:
+            self.assertEqual(index.lengths(),
+                    sorted(set(len(word) for word in words)))
+            for length in index.lengths():
+                self.assertEqual(sorted(index.keys(length)), sorted(key
+                        for key in buckets if len(key) == length))
+            for key, bucket in buckets.items():
+                self.assertEqual(index.candidates(key).copy(), bucket)
+                self.assertEqual(list(index.frequencies(key)),
+                        [words[word] for word in bucket])
+                limit = generator.randint(1, 5)
+                self.assertEqual(index.candidates(key, limit).copy(),
+                        bucket[:limit])
+                self.assertEqual(list(index.frequencies(key, limit)),
+                        [words[word] for word in bucket[:limit]])
+            for word in list(words)[:500]:
+                self.assertTrue(index.contains(word))
+            for trial in range(500):
+                word = ''.join(generator.choice('ABCDEFGHIJ')
+                        for letter in range(generator.randint(1, 7)))
+                self.assertEqual(index.contains(word), word in words)
+        finally:
+            index.close()
+
+    def test_positional(self):
+        """ Filtering a bucket by letters at a position gives the same
+            words as checking each word. """
+        generator = random.Random(7)
+        words = random_word_list(generator, 2000)
+        buckets = ranked(words)
+        index = build(words, self._directory)
+        try:
+            for key, bucket in buckets.items():
+                position = generator.randrange(len(key))
+                letters = ''.join(generator.sample('ABDEINORST',
+                        generator.randint(1, 5)))
+                self.assertEqual(index.candidates(key).where(position,
+                        letters).copy(), [word for word in bucket
+                        if word[position] in letters])
+        finally:
+            index.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+from cryp_constants import CrypConstants
+
+class WordFrequency():
+    """ Estimate how common a word is, for dictionaries that don't come
+        with real corpus counts, from the common English words listed in
+        common_words.py. """
+
+    # The estimate for each word in common_words.py,
+    # worked out the first time anybody asks.
+    _estimates = None
+
+    @staticmethod
+    def estimate(word):
+        """ Return roughly how many times a word turns up in a million
+            words of English. A word in common_words.py gets the count
+            that Zipf's law gives for its rank: the commonest word's count
+            (CrypConstants.TOP_WORD_FREQUENCY) divided by the rank. The
+            unranked common words all get half the last ranked word's
+            count, and any other word gets 1, so it comes after all the
+            common words that fit its pattern. """
+        return WordFrequency._table().get(word.upper(), 1)
+
+    @staticmethod
+    def signature():
+        """ Return bytes that change whenever the estimates do, for
+            telling whether a dictionary was built with these ones. """
+        import common_words
+        return '\n'.join(common_words.rankedWords + ['-'] +
+                common_words.unrankedWords).encode('utf-8')
+
+    @staticmethod
+    def _table():
+        """ Return the estimates for the words in common_words.py. """
+        if WordFrequency._estimates is None:
+            import common_words
+            estimates = {}
+            for rank, word in enumerate(common_words.rankedWords, 1):
+                estimates.setdefault(word, max(2, round(
+                        CrypConstants.TOP_WORD_FREQUENCY / rank)))
+            unranked = max(2, round(CrypConstants.TOP_WORD_FREQUENCY /
+                    len(common_words.rankedWords) / 2))
+            for word in common_words.unrankedWords:
+                estimates.setdefault(word, unranked)
+            WordFrequency._estimates = estimates
+        return WordFrequency._estimates
@@ -4,10 +4,15 @@ class WordMapping():
     """ The class to map one ciphertext word to
         its plaintext translation candidates """
 
-    def __init__(self, ciphertext):
-        """ Build an initial list of candidate plaintext
-            translations for the given ciphertext word. """
-        self._translations = OneWordSolver.solve_word(ciphertext)
+    def __init__(self, ciphertext, limit=None):
+        """ Build an initial list of candidate plaintext translations for
+            the given ciphertext word, likeliest first. If there's a limit,
+            keep only that many of the likeliest and forget the long tail. """
+        # The candidates are a read-only view of the dictionary's bucket
+        # for this word's pattern, so narrowing them down never means
+        # copying the bucket or deleting words from it one by one.
+        self._ciphertext = ciphertext
+        self._translations = OneWordSolver.solve_word(ciphertext, limit)
 
     def number_of_candidates(self):
         """ Return the number of candidate words to which
@@ -15,6 +20,24 @@ class WordMapping():
         return len(self._translations)
 
     def candidates(self):
-        """ Return a list of candidate words to which
-            we're considering translating the ciphertext. """
+        """ Return a (read-only) view of the candidate words to
+            which we're considering translating the ciphertext. """
         return self._translations
+
+    def letters_at(self, position):
+        """ Return a string of all the plaintext letters that the
+            candidates have in a given position. """
+        return self._translations.positional().letters_at(
+                position, self._translations.mask())
+
+    def reduce_by_alpha(self, alphabet_map):
+        """ Eliminate the candidates that don't
+            conform to an alphabet mapping. """
+        self.narrow(alphabet_map.conforming(self._ciphertext,
+                self._translations.positional(),
+                self._translations.mask()))
+
+    def narrow(self, mask):
+        """ Keep only the candidates in a bitset over their positional
+            index (like one that reduce_by_alpha worked out before). """
+        self._translations = self._translations.narrowed(mask)
@@ -1,6 +1,11 @@
 import re
+import time
 from word_mapping import WordMapping
-from alphabet_mapping import AlphabetMapping
+from one_word_solver import OneWordSolver
+from alphabet import Alphabet
+from phrase_dictionary import PhraseDictionary
+from positional_index import PositionalIndex
+from cryp_constants import CrypConstants
 
 class WordMappingGroup():
     """ The class to map (almost) every word in a puzzle
@@ -8,13 +13,30 @@ class WordMappingGroup():
 
     def __init__(self, puzzle, alphabet_map):
         """ Build the group of word mappings from a puzzle. """
-        
+        ciphertext_words = self._ciphertext_words(puzzle,
+                alphabet_map.alphabet())
+        # (Keep the words and the alphabet map as they were
+        # to start with, in case we're asked to search.)
+        self._puzzle_words = ciphertext_words
+        self._starting_map = alphabet_map.copy()
+        self._statistics = {}
+        self._reductions = {}
+        self._phrase_runs = self._ciphertext_runs(puzzle,
+                alphabet_map.alphabet())
         self._alphabet_map = alphabet_map
-        self._word_dictionary = {}
+        self._solve(ciphertext_words)
+
+    @staticmethod
+    def _ciphertext_words(puzzle, alphabet):
+        """ Return a list of the distinct ciphertext words in a puzzle
+            (in the letters of a given alphabet) that are worth trying
+            to map, in the order they appear. """
+        ciphertext_words = []
         # Note that we're temporarily keeping the parentheses
         # to determine whether to include a one-letter word.
-        ciphertextWordList = re.compile('[^A-Z\s\'\(\)]')\
-                .sub('', puzzle.upper()).split()
+        ciphertextWordList = re.compile(
+                WordMappingGroup._punctuation(alphabet))\
+                .sub('', Alphabet.upper(puzzle)).split()
         inParentheses = False
         for ciphertextWord in ciphertextWordList:
             if "(" in ciphertextWord:
@@ -23,22 +45,122 @@ class WordMappingGroup():
                     ciphertextWord.replace('(','').replace(')','')
             if (len(ciphertextWordWithoutParentheses) > 1 or not inParentheses) \
                     and not ciphertextWordWithoutParentheses \
-                    in self._word_dictionary.keys():
-                word_mapping = WordMapping(ciphertextWordWithoutParentheses)
-                if word_mapping.number_of_candidates() > 0:
-                    self._word_dictionary[ciphertextWordWithoutParentheses] = \
-                            word_mapping.candidates()
+                    in ciphertext_words:
+                ciphertext_words.append(ciphertextWordWithoutParentheses)
             if ")" in ciphertextWord:
                 inParentheses = False
+        return ciphertext_words
+
+    @staticmethod
+    def _ciphertext_runs(puzzle, alphabet):
+        """ Return a list of the runs of consecutive ciphertext words in a
+            puzzle that might be stock phrases (see PhraseDictionary),
+            longest first and otherwise in the order they appear. A run
+            doesn't cross punctuation, which usually ends a phrase. """
+        longest = OneWordSolver.phrase_dictionary().longest()
+        runs = []
+        for sentence in re.split(WordMappingGroup._punctuation(alphabet),
+                Alphabet.upper(puzzle)):
+            words = sentence.replace('(', '').replace(')', '').split()
+            for length in range(2, longest + 1):
+                for start in range(len(words) - length + 1):
+                    runs.append(words[start:start + length])
+        runs.sort(key=len, reverse=True)
+        return runs
+
+    @staticmethod
+    def _punctuation(alphabet):
+        """ Return a regular expression for any character that isn't a
+            letter of the alphabet, white space, an apostrophe or a
+            parenthesis. """
+        return '[^' + re.escape(alphabet.letters()) + '\\s\'\\(\\)]'
+
+    def _solve(self, ciphertext_words):
+        """ Map the ciphertext words and pare them down. But first,
+            try taking each run of words that fits a stock phrase (see
+            PhraseDictionary) to be that phrase, which can settle a lot of
+            letters at once, and keep the first such attempt that leaves
+            no word without candidates and that stands up to a closer
+            look (see _confirmed). """
+        # (Each failed attempt gets rolled back, so the alphabet map is
+        # just as it was for the next one; see BitmaskAlphabetMapping.)
+        checkpoint = self._alphabet_map.checkpoint()
+        attempts = 0
+        for run in self._phrase_runs:
+            for phrase in OneWordSolver.solve_phrase(run):
+                if attempts == CrypConstants.PHRASE_ATTEMPTS:
+                    break
+                attempts += 1
+                if self._attempt(ciphertext_words, run, phrase) \
+                        and self._confirmed(ciphertext_words, run):
+                    self._alphabet_map.release(checkpoint)
+                    return
+                self._alphabet_map.rollback(checkpoint)
+        self._alphabet_map.release(checkpoint)
+        self._attempt(ciphertext_words)
+
+    def _confirmed(self, ciphertext_words, run):
+        """ After a successful attempt with a stock phrase, decide whether
+            to believe it. A phrase whose words share letters (see
+            PhraseDictionary.selective) fits so few runs of words that we
+            take it as it is. But one whose words don't (like "OF THE")
+            fits nearly any run of words of the right lengths, and merely
+            leaving every word some candidates proves little; so it has to
+            have pinned down at least one other word that shares letters
+            with the run, and every such word it pinned down has to be in
+            the dictionary. """
+        if PhraseDictionary.selective(run):
+            return True
+        letters = set(''.join(run)) - {'\''}
+        pinned_down = False
+        for ciphertext_word in ciphertext_words:
+            if ciphertext_word in run or letters.isdisjoint(ciphertext_word):
+                continue
+            plaintext_word = ''
+            for ciphertext in ciphertext_word:
+                if ciphertext == '\'':
+                    plaintext_word += ciphertext
+                else:
+                    plaintext_word += self._alphabet_map.translate(ciphertext)
+            if len(plaintext_word) == len(ciphertext_word):
+                if not OneWordSolver.is_word(plaintext_word):
+                    return False
+                pinned_down = True
+        return pinned_down
+
+    def _attempt(self, ciphertext_words, run=(), phrase=()):
+        """ Map the ciphertext words and pare them down, assuming that the
+            given run of words (if any) translates to the given phrase.
+            Return True if every word ended up with some candidates (or
+            got solved along the way), False if any ran out. """
+        self._word_dictionary = {}
+        # (These are the words that ran out of candidates.)
+        self._emptied_words = []
+        for ciphertext_word in ciphertext_words:
+            word_mapping = WordMapping(ciphertext_word)
+            if word_mapping.number_of_candidates() > 0:
+                self._word_dictionary[ciphertext_word] = word_mapping
         # In case the alphabet map has been narrowed down (because the
         # user made some letter choices and hit the Guess button),
         # check for chances to reduce the words by the alphabet map.
-        self._reduce_words_by_alpha()
+        self._reduce_words_by_alpha(True)
+
+        # Narrow the alphabet map down to the phrase, if there is one
+        # (which must be possible, or the phrase can't be right).
+        for ciphertext_word, plaintext_word in zip(run, phrase):
+            for ciphertext, plaintext in zip(ciphertext_word, plaintext_word):
+                if ciphertext != '\'':
+                    self._alphabet_map.narrow_down_translations(
+                            ciphertext, plaintext)
+                    if self._alphabet_map.translate(ciphertext) != plaintext:
+                        return False
+        if phrase:
+            self._reduce_words_by_alpha()
 
         # If we can't find a candidate translation for
         # any word, we can't make any guess, so quit.
         if len(self._word_dictionary) == 0:
-            return
+            return len(self._emptied_words) == 0
 
         # Find our starting point.
         word_to_guess = self._most_promising_word()
@@ -76,6 +198,7 @@ class WordMappingGroup():
                 break
             # ...pick the next-best word and try again.
             word_to_guess = self._most_promising_word()
+        return len(self._emptied_words) == 0
 
     def _most_promising_word(self):
         """ Look through all the words in this mapping and find one that shows
@@ -97,11 +220,11 @@ class WordMappingGroup():
 
         # The first criterion is the number of candidate
         # plaintext words - the fewer the better.
-        if len(self._word_dictionary[word_1]) < \
-           len(self._word_dictionary[word_2]):
+        if self._word_dictionary[word_1].number_of_candidates() < \
+           self._word_dictionary[word_2].number_of_candidates():
             return word_1
-        if len(self._word_dictionary[word_1]) > \
-           len(self._word_dictionary[word_2]):
+        if self._word_dictionary[word_1].number_of_candidates() > \
+           self._word_dictionary[word_2].number_of_candidates():
             return word_2
 
         # If the plaintext list is the same length for both, the second
@@ -123,14 +246,13 @@ class WordMappingGroup():
             narrow down that word's letters' translations. """
         for index in range(len(word_to_guess)):
             if word_to_guess[index] != '\'':
-                plaintext_values = ""
-                for plaintext in self._word_dictionary[word_to_guess]:
-                    plaintext_values += plaintext[index]
+                plaintext_values = \
+                        self._word_dictionary[word_to_guess].letters_at(index)
                 self._alphabet_map.narrow_down_translations(
                         word_to_guess[index], plaintext_values)
 
         # Now if the word we guessed has only one translation...
-        if len(self._word_dictionary[word_to_guess]) == 1:
+        if self._word_dictionary[word_to_guess].number_of_candidates() == 1:
             # ...then we did all the good we can with it, so delete it.
             del self._word_dictionary[word_to_guess]
 
@@ -138,29 +260,184 @@ class WordMappingGroup():
         # pare down the word translations accordingly.
         self._reduce_words_by_alpha()
 
-    def _reduce_words_by_alpha(self):
+    def _reduce_words_by_alpha(self, every_word=False):
         """ Based on the premise that the alphabet map is
             correct, eliminate the candidate translations
-            from every ciphertext word accordingly. """
+            from every ciphertext word accordingly. (Unless we're
+            told to do every word, only the words with letters whose
+            translations changed since last time can lose any.) """
+        changed = self._alphabet_map.changes()
+        # The same word with the same candidates often gets reduced by
+        # the same alphabet map again (especially as each stock phrase
+        # attempt starts over), so remember the results, keyed by a
+        # snapshot of the map (see BitmaskAlphabetMapping).
+        snapshot = self._alphabet_map.snapshot()
         # Start by looping through the ciphertext words.
         all_entries = list(self._word_dictionary.keys())
         for entry in all_entries:
-            # And for each ciphertext word, loop
-            # through the plaintext candidates.
-            index = 0
-            while index < len(self._word_dictionary[entry]):
-                # If a translation doesn't conform, delete it.
-                if self._alphabet_map.conforms(entry,
-                        self._word_dictionary[entry][index]):
-                    index += 1
-                else:
-                    del self._word_dictionary[entry][index]
+            if not every_word and changed.isdisjoint(entry):
+                continue
+            # And for each ciphertext word, drop the plaintext
+            # candidates that don't conform. (That's done with the
+            # positional index rather than word by word.)
+            word_mapping = self._word_dictionary[entry]
+            reduction = (snapshot, entry, word_mapping.candidates().mask())
+            if reduction in self._reductions:
+                word_mapping.narrow(self._reductions[reduction])
+            else:
+                word_mapping.reduce_by_alpha(self._alphabet_map)
+                self._reductions[reduction] = word_mapping.candidates().mask()
             # Furthermore, after deleting some translations, if
             # we find there are no translations left, delete
             # the whole ciphertext entry from the dictionary!
-            if len(self._word_dictionary[entry]) == 0:
+            if self._word_dictionary[entry].number_of_candidates() == 0:
+                self._emptied_words.append(entry)
                 del self._word_dictionary[entry]
 
     def translate(self, ciphertext):
         """ Given a ciphertext letter, return all translations. """
         return self._alphabet_map.translate(ciphertext)
+
+    def search(self, solutions=1, node_limit=CrypConstants.SEARCH_NODE_LIMIT,
+            time_limit=CrypConstants.SEARCH_TIME_LIMIT):
+        """ Rather than pare down, search (depth first) for complete keys:
+            ways to translate every ciphertext word with any dictionary
+            candidates at all into one of its candidates, all at once.
+            Starting from the alphabet map this group was given, take the
+            word with the fewest candidates, try each of them in turn
+            (likeliest first), narrowing a copy of the alphabet map down to
+            it and dropping the other words' candidates that no longer
+            conform, and back up whenever that contradicts the map or
+            leaves some word with no candidates. Return a list of up to
+            "solutions" keys, in the order found, each a dictionary from
+            the ciphertext letters of those words to plaintext letters.
+            Give up after trying node_limit candidates or after time_limit
+            seconds (either of which can be None, for no limit); then
+            search_statistics() tells how far we got. """
+        started = time.monotonic()
+        self._search_map = self._starting_map.copy()
+        self._keys = []
+        self._solutions = solutions
+        self._node_limit = node_limit
+        self._deadline = None
+        if time_limit is not None:
+            self._deadline = started + time_limit
+        self._statistics = {'nodes': 0, 'dead ends': 0, 'depth': 0,
+                'exhausted': False, 'limited': False}
+
+        # Start each word off with the candidates that
+        # conform to the alphabet map as it is.
+        self._positionals = {}
+        masks = {}
+        for ciphertext_word in self._puzzle_words:
+            candidates = WordMapping(ciphertext_word).candidates()
+            if len(candidates) > 0:
+                self._positionals[ciphertext_word] = candidates.positional()
+                masks[ciphertext_word] = self._search_map.conforming(
+                        ciphertext_word, candidates.positional(),
+                        candidates.mask())
+        self._search_map.changes()
+        if all(masks.values()):
+            if not self._search_from(masks, 0):
+                self._statistics['exhausted'] = True
+        else:
+            self._statistics['exhausted'] = True
+
+        self._statistics['keys'] = len(self._keys)
+        self._statistics['seconds'] = time.monotonic() - started
+        return self._keys
+
+    def search_statistics(self):
+        """ Return a dictionary of statistics about the last search: how
+            many candidates it tried ("nodes"), how many of those it had to
+            back up from right away ("dead ends"), the most words it had
+            translated at once ("depth"), how many keys it found ("keys"),
+            how long it took ("seconds"), whether it looked at every
+            possibility ("exhausted") and whether it gave up because of a
+            limit ("limited"). It's empty if there hasn't been a search. """
+        return dict(self._statistics)
+
+    def _search_from(self, masks, depth):
+        """ Search on from the alphabet map as it is, given the candidates
+            (as bitsets over their positional indexes) of the words that
+            haven't been translated yet. Return True if the search should
+            stop here (because it found enough keys or hit a limit), False
+            if it should go on looking. """
+        if not masks:
+            self._keys.append(self._key())
+            return len(self._keys) >= self._solutions
+        self._statistics['depth'] = max(self._statistics['depth'], depth)
+
+        # The most constrained word is the one with the fewest candidates
+        # (and after that, the longest word, as in _more_promising_word).
+        ciphertext_word = min(masks, key=lambda word:
+                (PositionalIndex.count(masks[word]), -len(word), word))
+        positional = self._positionals[ciphertext_word]
+        others = dict(masks)
+        del others[ciphertext_word]
+        candidates = masks[ciphertext_word]
+        while candidates:
+            lowest = candidates & -candidates
+            candidates ^= lowest
+            if self._out_of_limits():
+                self._statistics['limited'] = True
+                return True
+            self._statistics['nodes'] += 1
+            checkpoint = self._search_map.checkpoint()
+            reduced = self._assign(ciphertext_word,
+                    positional.word(lowest.bit_length() - 1), others)
+            if reduced is None:
+                self._statistics['dead ends'] += 1
+                stop = False
+            else:
+                stop = self._search_from(reduced, depth + 1)
+            self._search_map.rollback(checkpoint)
+            self._search_map.release(checkpoint)
+            if stop:
+                return True
+        return False
+
+    def _assign(self, ciphertext_word, plaintext_word, masks):
+        """ Narrow the search's alphabet map down to a ciphertext word
+            translating to a plaintext word, and return the candidates
+            of the other words (given as for _search_from) that still
+            conform. Return None instead if that contradicts the map or
+            leaves some other word with no candidates. """
+        for ciphertext, plaintext in zip(ciphertext_word, plaintext_word):
+            if ciphertext != '\'':
+                self._search_map.narrow_down_translations(
+                        ciphertext, plaintext)
+                if self._search_map.translate(ciphertext) != plaintext:
+                    return None
+        if not self._search_map.consistent():
+            return None
+        # (Only the words with letters that changed can lose candidates.)
+        changed = self._search_map.changes()
+        reduced = {}
+        for word, mask in masks.items():
+            if not changed.isdisjoint(word):
+                mask = self._search_map.conforming(word,
+                        self._positionals[word], mask)
+                if not mask:
+                    return None
+            reduced[word] = mask
+        return reduced
+
+    def _out_of_limits(self):
+        """ Return True if the search has tried as many
+            candidates as it may or run out of time. """
+        return (self._node_limit is not None and
+                self._statistics['nodes'] >= self._node_limit) or \
+                (self._deadline is not None and
+                time.monotonic() >= self._deadline)
+
+    def _key(self):
+        """ Return the key that the search has found: a dictionary from
+            each ciphertext letter of the words it translated to the
+            plaintext letter it's pinned down to. """
+        key = {}
+        for ciphertext_word in self._positionals:
+            for ciphertext in ciphertext_word:
+                if ciphertext != '\'':
+                    key[ciphertext] = self._search_map.translate(ciphertext)
+        return key
@@ -0,0 +1,139 @@
+import hashlib
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from alphabet import Alphabet
+
+class WordMembership():
+    """ A compact, memory-mapped hash set of every word in a dictionary,
+        for checking in constant time whether a decoded word is a real
+        word, without working out its pattern and searching its bucket.
+        Each word is stored as a 64-bit fingerprint in an open-addressing
+        table, optionally fronted by a Bloom filter that turns most
+        non-words away before we ever touch the table. (Two words would
+        have to share a 64-bit fingerprint to be confused, which for any
+        real dictionary is a chance in billions.) """
+
+    # The file layout is a header (magic number, version, log2 of the
+    # number of table slots, log2 of the number of Bloom filter bits,
+    # or 0 for no filter, and the number of Bloom hashes), then the Bloom
+    # filter's bits and then the table of 64-bit fingerprints, in which
+    # 0 marks an empty slot.
+    MAGIC = b'CRYPMEM\x00'
+    VERSION = 1
+    HEADER = struct.Struct('<8sIIII')
+    SLOT = struct.Struct('<Q')
+
+    # The file's name in a pattern index directory.
+    FILE_NAME = 'MEMBERSHIP'
+
+    # How many Bloom filter hashes to use, and about how many
+    # bits of filter to give each word (before rounding up).
+    BLOOM_HASHES = 4
+    BLOOM_BITS_PER_WORD = 10
+
+    def __init__(self, path):
+        """ Open the membership file and map it into memory. """
+        self._file = open(path, 'rb')
+        self._buffer = mmap.mmap(self._file.fileno(), 0,
+                access=mmap.ACCESS_READ)
+        magic, version, slot_bits, bloom_bits, self._bloom_hashes = \
+                self.HEADER.unpack_from(self._buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError(path + ' is not a compatible membership file')
+        self._slot_mask = (1 << slot_bits) - 1
+        self._bloom_mask = (1 << bloom_bits) - 1 if bloom_bits else 0
+        self._table = self.HEADER.size + \
+                ((1 << bloom_bits) // 8 if bloom_bits else 0)
+
+    def __contains__(self, word):
+        """ Return True if a word is in the dictionary, False if not. """
+        fingerprint = WordMembership.fingerprint(word)
+        if self._bloom_mask:
+            for bit in WordMembership._bloom_bits(fingerprint,
+                    self._bloom_hashes, self._bloom_mask):
+                if not self._buffer[self.HEADER.size + (bit >> 3)] & \
+                        (1 << (bit & 7)):
+                    return False
+        slot = fingerprint & self._slot_mask
+        while True:
+            stored = self.SLOT.unpack_from(self._buffer,
+                    self._table + slot * self.SLOT.size)[0]
+            if stored == fingerprint:
+                return True
+            if stored == 0:
+                return False
+            slot = (slot + 1) & self._slot_mask
+
+    def close(self):
+        """ Release the memory map and the file. """
+        self._buffer.close()
+        self._file.close()
+
+    @staticmethod
+    def fingerprint(word):
+        """ Return the 64-bit fingerprint of a word (never 0). """
+        return int.from_bytes(hashlib.blake2b(
+                Alphabet.upper(word).encode('utf-8'),
+                digest_size=8).digest(), 'little') or 1
+
+    @staticmethod
+    def _bloom_bits(fingerprint, hashes, mask):
+        """ Return the Bloom filter bits for a fingerprint, derived
+            from its two halves by double hashing. """
+        first = fingerprint & 0xFFFFFFFF
+        second = (fingerprint >> 32) | 1
+        return [(first + number * second) & mask
+                for number in range(hashes)]
+
+    @staticmethod
+    def words_in(text, alphabet=None):
+        """ Return a list of the words in a piece of (decoded) text
+            in a given alphabet (or the default one). """
+        alphabet = alphabet or Alphabet.default()
+        return [word.strip('\'') for word in
+                re.findall('[' + re.escape(alphabet.letters()) + '\']+',
+                Alphabet.upper(text)) if word.strip('\'')]
+
+    @staticmethod
+    def compile(words, path, bloom=True):
+        """ Write a membership file for an iterable of words, with or
+            without a Bloom filter in front of the table. """
+        # (Arrays of 64-bit ints, rather than lists or sets of Python
+        # ints, keep this affordable for word lists in the millions.)
+        fingerprints = array('Q', (WordMembership.fingerprint(word)
+                for word in words))
+        # Keep the table at most half full, so probes stay short.
+        slot_bits = max(1, (2 * len(fingerprints)).bit_length())
+        slot_mask = (1 << slot_bits) - 1
+        table = array('Q', bytes(WordMembership.SLOT.size << slot_bits))
+        for fingerprint in fingerprints:
+            slot = fingerprint & slot_mask
+            # (A word listed twice is only stored once.)
+            while table[slot] != 0 and table[slot] != fingerprint:
+                slot = (slot + 1) & slot_mask
+            table[slot] = fingerprint
+        if sys.byteorder == 'big':
+            table.byteswap()
+
+        bloom_bits = 0
+        bloom_filter = bytearray()
+        if bloom:
+            bloom_bits = max(3, (WordMembership.BLOOM_BITS_PER_WORD *
+                    len(fingerprints)).bit_length())
+            bloom_filter = bytearray((1 << bloom_bits) // 8)
+            for fingerprint in fingerprints:
+                for bit in WordMembership._bloom_bits(fingerprint,
+                        WordMembership.BLOOM_HASHES, (1 << bloom_bits) - 1):
+                    bloom_filter[bit >> 3] |= 1 << (bit & 7)
+
+        with open(path + '.tmp', 'wb') as membership_file:
+            membership_file.write(WordMembership.HEADER.pack(
+                    WordMembership.MAGIC, WordMembership.VERSION, slot_bits,
+                    bloom_bits, WordMembership.BLOOM_HASHES))
+            membership_file.write(bloom_filter)
+            membership_file.write(table.tobytes())
+        os.replace(path + '.tmp', path)
@@ -0,0 +1,109 @@
+from one_word_solver import OneWordSolver
+from pattern_encoder import PatternEncoder
+
+class WordQuery():
+    """ A crossword-style word query, like '?A??ER' (six letters, with A
+        second and E and R last) or 'UN*' (anything starting with UN),
+        optionally with no letter repeated. Rather than scanning the whole
+        dictionary, we use the pattern index: a bucket whose pattern can't
+        fit the query (say, one that repeats a letter when we want none
+        repeated, or puts the same letter where the query has A and E)
+        is skipped without looking inside it, and within the buckets that
+        are left, the fixed letters are picked out with positional
+        bitsets. So we can count the answers before listing any. """
+
+    # The characters with special meanings in a query.
+    ANY_LETTER = '?'
+    ANY_LETTERS = '*'
+
+    def __init__(self, query, distinct=False, dictionary=None):
+        """ Parse a query, raising ValueError if it's malformed. A query
+            is made of letters, apostrophes, ANY_LETTER and at most one
+            ANY_LETTERS. If "distinct" is true, only words with no
+            repeated letter will match. The dictionary defaults to the
+            one OneWordSolver is using. """
+        self._query = query.strip().upper()
+        self._distinct = distinct
+        self._dictionary = dictionary or OneWordSolver.pattern_index()
+        if self._query == '':
+            raise ValueError('The query is empty.')
+        for character in self._query:
+            if not (character.isalpha() or
+                    character in '\'' + self.ANY_LETTER + self.ANY_LETTERS):
+                raise ValueError('A query can\'t contain "' +
+                        character + '".')
+        if self._query.count(self.ANY_LETTERS) > 1:
+            raise ValueError('A query can contain only one "' +
+                    self.ANY_LETTERS + '".')
+        # (We work out the matching buckets once, since
+        # counting and listing both need them.)
+        self._matches = None
+
+    def count(self):
+        """ Return how many words match the query, without listing them. """
+        return sum(len(view) for view in self._views())
+
+    def results(self):
+        """ Iterate over the matching words, one bucket at a time (and
+            within each bucket, most frequent first). """
+        for view in self._views():
+            yield from view
+
+    def _views(self):
+        """ Return a list of candidate views, one for each
+            bucket that has at least one matching word. """
+        if self._matches is None:
+            self._matches = []
+            for template in self._templates():
+                for key in self._dictionary.keys(len(template)):
+                    if self._key_fits(key, template):
+                        view = self._dictionary.candidates(key)
+                        # (Some dictionaries list keys that
+                        # might turn out to have no words.)
+                        if len(view) == 0:
+                            continue
+                        for position, character in enumerate(template):
+                            if character.isalpha():
+                                view = view.where(position, character)
+                        if len(view) > 0:
+                            self._matches.append(view)
+        return self._matches
+
+    def _templates(self):
+        """ Return the query written out for every word length it allows,
+            i.e. with ANY_LETTERS replaced by the right number of
+            ANY_LETTER characters for each length in the dictionary. """
+        if self.ANY_LETTERS not in self._query:
+            return [self._query]
+        shortest = len(self._query) - 1
+        return [self._query.replace(self.ANY_LETTERS,
+                self.ANY_LETTER * (length - shortest))
+                for length in self._dictionary.lengths()
+                if length >= shortest]
+
+    def _key_fits(self, key, template):
+        """ Return True if words with a given pattern key could
+            possibly match a template, judging by the key alone. """
+        # (A quick check first, since most keys fail it.)
+        if (PatternEncoder.APOSTROPHE in key) != ('\'' in template):
+            return False
+        letter_of = {}
+        number_of = {}
+        for position, character in enumerate(template):
+            number = key[position]
+            if character == '\'' or number == PatternEncoder.APOSTROPHE:
+                if character != '\'' or number != PatternEncoder.APOSTROPHE:
+                    return False
+            elif character != self.ANY_LETTER:
+                # The same letter must always get the same number,
+                # and different letters must get different numbers.
+                if letter_of.get(number, character) != character or \
+                        number_of.get(character, number) != number:
+                    return False
+                letter_of[number] = character
+                number_of[character] = number
+        if self._distinct:
+            numbers = [number for number in key
+                    if number != PatternEncoder.APOSTROPHE]
+            return len(numbers) == len(set(numbers))
+        return True